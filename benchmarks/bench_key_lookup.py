@@ -0,0 +1,88 @@
+"""Import into a project that already holds many cases, with and without the key prefetch.
+
+Usage: `python -m benchmarks.bench_key_lookup [EXISTING] [CASES]` from the repository root.
+Existing cases live in SQLite with the Zephyr key inside a JSON attributes column and no
+index on it, like TestY's `attributes__zephyr__key` lookups; everything else stays in memory.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import sys
+import time
+from collections.abc import Mapping
+from io import BytesIO
+from typing import Any
+
+from zephyr_xml_importer.services.importer import import_into_testy
+from zephyr_xml_importer.services.testy_adapter import InMemoryTestyAdapter
+
+from .synthetic import write_synthetic_export
+
+
+class SqliteCaseAdapter(InMemoryTestyAdapter):
+    def __init__(self, existing: int) -> None:
+        super().__init__()
+        self.queries = 0
+        self._db = sqlite3.connect(":memory:")
+        self._db.execute("CREATE TABLE cases (id INTEGER PRIMARY KEY, project_id, attributes)")
+        self._db.executemany(
+            "INSERT INTO cases (project_id, attributes) VALUES (1, ?)",
+            ((json.dumps({"zephyr": {"key": f"OLD-T{idx}"}}),) for idx in range(existing)),
+        )
+
+    def find_case_id_by_zephyr_key(self, project_id: int, zephyr_key: str) -> int | None:
+        self.queries += 1
+        row = self._db.execute(
+            "SELECT id FROM cases WHERE project_id = ? "
+            "AND json_extract(attributes, '$.zephyr.key') = ? ORDER BY id LIMIT 1",
+            (project_id, zephyr_key),
+        ).fetchone()
+        return row[0] if row else None
+
+    def case_ids_by_zephyr_key(self, project_id: int) -> dict[str, int]:
+        self.queries += 1
+        case_ids: dict[str, int] = {}
+        for key, case_id in self._db.execute(
+            "SELECT json_extract(attributes, '$.zephyr.key'), id FROM cases "
+            "WHERE project_id = ? ORDER BY id",
+            (project_id,),
+        ):
+            if key:
+                case_ids.setdefault(key, case_id)
+        return case_ids
+
+    def create_case_with_steps(
+        self, project_id: int, suite_id: int, payload: Mapping[str, Any]
+    ) -> int:
+        self._db.execute(
+            "INSERT INTO cases (project_id, attributes) VALUES (?, ?)",
+            (project_id, json.dumps({"zephyr": {"key": payload["attributes"]["zephyr"]["key"]}})),
+        )
+        return super().create_case_with_steps(project_id, suite_id, payload)
+
+
+class PerCaseLookupAdapter(SqliteCaseAdapter):
+    def case_ids_by_zephyr_key(self, project_id: int) -> dict[str, int]:
+        raise NotImplementedError
+
+
+def main(argv: list[str]) -> int:
+    existing = int(argv[0]) if argv else 100_000
+    cases = int(argv[1]) if len(argv) > 1 else 500
+    buffer = BytesIO()
+    write_synthetic_export(buffer, cases, steps=2, test_data_rows=0)
+    export = buffer.getvalue()
+    print(f"importing {cases} cases into a project with {existing} cases")
+    for label, adapter_cls in (("per case", PerCaseLookupAdapter), ("prefetch", SqliteCaseAdapter)):
+        adapter = adapter_cls(existing)
+        started = time.perf_counter()
+        import_into_testy(export, project_id=1, adapter=adapter)
+        elapsed = time.perf_counter() - started
+        print(f"{label:>9}: {elapsed:.2f}s, {adapter.queries} key queries")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
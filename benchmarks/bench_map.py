@@ -0,0 +1,46 @@
+"""Dry-run wall time and request-process CPU time with and without mapping workers.
+
+Usage: `python -m benchmarks.bench_map [CASES] [WORKERS]` from the repository root (best of
+three runs). Worker CPU time is not counted in the request-process column, so on a host
+with spare cores the wall time follows it down.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from io import BytesIO
+
+from zephyr_xml_importer.services.importer import dry_run_import
+
+from .synthetic import write_synthetic_export
+
+
+def _best(export: bytes, map_workers: int, repeat: int = 3) -> tuple[float, float]:
+    best_wall = best_cpu = float("inf")
+    for _ in range(repeat):
+        wall, cpu = time.perf_counter(), time.process_time()
+        dry_run_import(export, map_workers=map_workers)
+        best_wall = min(best_wall, time.perf_counter() - wall)
+        best_cpu = min(best_cpu, time.process_time() - cpu)
+    return best_wall, best_cpu
+
+
+def main(argv: list[str]) -> int:
+    cases = int(argv[0]) if argv else 5_000
+    workers = int(argv[1]) if len(argv) > 1 else 2
+    buffer = BytesIO()
+    write_synthetic_export(buffer, cases)
+    export = buffer.getvalue()
+    print(f"{cases} cases")
+    for label, map_workers in (("inline", 0), (f"map x{workers}", workers)):
+        wall, cpu = _best(export, map_workers)
+        print(
+            f"{label:>10}: {wall:.2f}s wall, {cpu:.2f}s request-process CPU "
+            f"({cpu / cases * 1e6:.0f} CPU-us/case)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
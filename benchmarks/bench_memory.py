@@ -0,0 +1,53 @@
+"""Measure memory retained by parsed test cases held in a list (tracemalloc).
+
+Usage: `python -m benchmarks.bench_memory [CASES] [STEPS] [TEST_DATA_ROWS] [ENGINE]` from
+the repository root. This is what any mode that keeps cases in memory (XLSX import,
+parallel pipelines) pays per case.
+"""
+
+from __future__ import annotations
+
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from zephyr_xml_importer.services.parser import iter_test_cases
+
+from .synthetic import write_synthetic_export
+
+
+def main(argv: list[str]) -> int:
+    cases = int(argv[0]) if argv else 200_000
+    steps = int(argv[1]) if len(argv) > 1 else 5
+    test_data_rows = int(argv[2]) if len(argv) > 2 else 2
+    engine = argv[3] if len(argv) > 3 else None
+    with TemporaryDirectory() as tmp:
+        path = Path(tmp) / "export.xml"
+        with open(path, "wb") as handle:
+            write_synthetic_export(handle, cases, steps=steps, test_data_rows=test_data_rows)
+        size_mb = path.stat().st_size / (1024 * 1024)
+        print(
+            f"synthetic export: {cases} cases x {steps} steps x {test_data_rows} data rows, "
+            f"{size_mb:.1f} MiB"
+        )
+        gc.collect()
+        tracemalloc.start()
+        started = time.perf_counter()
+        parsed = list(iter_test_cases(path, engine=engine))
+        elapsed = time.perf_counter() - started
+        gc.collect()
+        retained, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    mib = 1024 * 1024
+    print(
+        f"{len(parsed)} cases held: {retained / mib:.1f} MiB retained "
+        f"({retained / len(parsed):.0f} B/case), peak {peak / mib:.1f} MiB, {elapsed:.1f}s"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
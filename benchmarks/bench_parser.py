@@ -0,0 +1,73 @@
+"""Compare XML parser engines in test cases per second (best of three runs).
+
+Usage: `python -m benchmarks.bench_parser [CASES] [STEPS] [TEST_DATA_ROWS] [WORKERS]` from
+the repository root. With WORKERS, `iter_test_cases_parallel` is measured as well.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from zephyr_xml_importer.services.parser import (
+    PARSER_ENGINE_DEFUSEDXML,
+    PARSER_ENGINE_LXML,
+    LxmlET,
+    iter_test_cases,
+    iter_test_cases_parallel,
+)
+
+from .synthetic import write_synthetic_export
+
+
+def _run(path: Path, engine: str, workers: int = 0, repeat: int = 3) -> tuple[int, float]:
+    best = float("inf")
+    count = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        if workers:
+            cases = iter_test_cases_parallel(path, engine=engine, workers=workers)
+        else:
+            cases = iter_test_cases(path, engine=engine)
+        count = sum(1 for _ in cases)
+        best = min(best, time.perf_counter() - started)
+    return count, best
+
+
+def main(argv: list[str]) -> int:
+    cases = int(argv[0]) if argv else 20_000
+    steps = int(argv[1]) if len(argv) > 1 else 5
+    test_data_rows = int(argv[2]) if len(argv) > 2 else 2
+    workers = int(argv[3]) if len(argv) > 3 else 0
+    engines = [PARSER_ENGINE_DEFUSEDXML]
+    if LxmlET is not None:
+        engines.append(PARSER_ENGINE_LXML)
+    with TemporaryDirectory() as tmp:
+        path = Path(tmp) / "export.xml"
+        with open(path, "wb") as handle:
+            write_synthetic_export(handle, cases, steps=steps, test_data_rows=test_data_rows)
+        size_mb = path.stat().st_size / (1024 * 1024)
+        print(
+            f"synthetic export: {cases} cases x {steps} steps x {test_data_rows} data rows, "
+            f"{size_mb:.1f} MiB"
+        )
+        runs = [(engine, 0) for engine in engines]
+        if workers:
+            runs += [(engine, workers) for engine in engines]
+        for engine, run_workers in runs:
+            count, elapsed = _run(path, engine, run_workers)
+            per_case_us = elapsed / count * 1_000_000
+            label = f"{engine} x{run_workers}" if run_workers else engine
+            print(
+                f"{label:>14}: {count / elapsed:10.0f} cases/sec "
+                f"({per_case_us:.0f} us/case, {elapsed:.2f}s)"
+            )
+    if LxmlET is None:
+        print("lxml is not installed; install the 'fast' extra to compare engines")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
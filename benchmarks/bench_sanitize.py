@@ -0,0 +1,67 @@
+"""Compare the single-scan `sanitize_html` with the rule-by-rule version (best of five runs).
+
+Usage: `python -m benchmarks.bench_sanitize [CASES] [STEPS]` from the repository root. The
+fragments are every field the mapping sanitizes, taken from a synthetic export.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from collections.abc import Callable
+from io import BytesIO
+
+from zephyr_xml_importer.services.parser import iter_test_cases
+from zephyr_xml_importer.services.sanitize import _sanitize_html_by_rule, sanitize_html
+
+from .synthetic import write_synthetic_export
+
+
+def _fragments(cases: int, steps: int) -> list[str | None]:
+    export = BytesIO()
+    write_synthetic_export(export, cases, steps=steps)
+    export.seek(0)
+    fragments: list[str | None] = []
+    for tc in iter_test_cases(export):
+        fragments += [tc.objective, tc.precondition, tc.test_script_text]
+        for step in tc.steps:
+            fragments += [step.description, step.test_data, step.expected_result]
+        if tc.test_data_wrapper is not None:
+            for row in tc.test_data_wrapper.rows:
+                for cell in row.cells:
+                    fragments += [cell.name, cell.value, cell.data_type]
+    return fragments
+
+
+def _best(sanitize: Callable[[str], str], fragments: list[str | None], repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for fragment in fragments:
+            if fragment:
+                sanitize(fragment)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main(argv: list[str]) -> int:
+    cases = int(argv[0]) if argv else 5_000
+    steps = int(argv[1]) if len(argv) > 1 else 5
+    fragments = _fragments(cases, steps)
+    print(f"{len(fragments)} fragments from {cases} cases x {steps} steps")
+    results = {}
+    for label, sanitize in (
+        ("rule-by-rule", _sanitize_html_by_rule),
+        ("single-scan", sanitize_html),
+    ):
+        results[label] = _best(sanitize, fragments)
+        print(
+            f"{label:>12}: {len(fragments) / results[label]:10.0f} fragments/sec "
+            f"({results[label]:.2f}s)"
+        )
+    print(f"speedup: {results['rule-by-rule'] / results['single-scan']:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,49 @@
+"""Dry-run CPU time per case with and without the sanitize cache (best of five runs).
+
+Usage: `python -m benchmarks.bench_sanitize_cache [CASES] [DISTINCT_STEPS] [CACHE_SIZE]` from
+the repository root. Step texts repeat every DISTINCT_STEPS cases, as in exports built from
+shared step templates.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from io import BytesIO
+
+from zephyr_xml_importer.services.importer import dry_run_import
+
+from .synthetic import write_synthetic_export
+
+
+def _best_cpu(export: bytes, cache_size: int, repeat: int = 5) -> tuple[float, object]:
+    best = float("inf")
+    summary = None
+    for _ in range(repeat):
+        started = time.process_time()
+        summary = dry_run_import(export, sanitize_cache_size=cache_size).summary
+        best = min(best, time.process_time() - started)
+    return best, summary
+
+
+def main(argv: list[str]) -> int:
+    cases = int(argv[0]) if argv else 5_000
+    distinct_steps = int(argv[1]) if len(argv) > 1 else 20
+    cache_size = int(argv[2]) if len(argv) > 2 else 4_096
+    buffer = BytesIO()
+    write_synthetic_export(buffer, cases, distinct_steps=distinct_steps)
+    export = buffer.getvalue()
+    print(f"{cases} cases, step texts repeating every {distinct_steps} cases")
+    results = {}
+    for label, size in (("uncached", 0), (f"cache={cache_size}", cache_size)):
+        results[label], summary = _best_cpu(export, size)
+        print(
+            f"{label:>12}: {results[label] / cases * 1e6:8.1f} CPU-us/case ({results[label]:.2f}s)"
+        )
+    print(f"cache hits {summary.sanitize_cache_hits}, misses {summary.sanitize_cache_misses}")
+    print(f"speedup: {results['uncached'] / results[f'cache={cache_size}']:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
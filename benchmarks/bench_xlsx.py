@@ -0,0 +1,68 @@
+"""Compare the native XLSX row reader with openpyxl read-only mode: rows/sec and peak memory.
+
+Usage: `python -m benchmarks.bench_xlsx [CASES] [STEPS]` from the repository root; the
+defaults give a 100k-row export. Speed is timed untraced; peak memory comes from a second,
+tracemalloc-traced pass, since tracing slows allocation-heavy code several times over.
+"""
+
+from __future__ import annotations
+
+import gc
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any
+
+import openpyxl
+
+from zephyr_xml_importer.services.xlsx_parser import _iter_sheet_rows
+
+from .synthetic import write_synthetic_xlsx
+
+
+def _openpyxl_rows(path: Path) -> Iterable[Any]:
+    wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        ws = wb.active
+        ws.reset_dimensions()
+        yield from ws.iter_rows(values_only=True)
+    finally:
+        wb.close()
+
+
+def _measure(read_rows: Callable[[Path], Iterable[Any]], path: Path) -> tuple[int, float, int]:
+    gc.collect()
+    started = time.perf_counter()
+    count = sum(1 for _ in read_rows(path))
+    elapsed = time.perf_counter() - started
+    gc.collect()
+    tracemalloc.start()
+    for _ in read_rows(path):
+        pass
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return count, elapsed, peak
+
+
+def main(argv: list[str]) -> int:
+    cases = int(argv[0]) if argv else 20_000
+    steps = int(argv[1]) if len(argv) > 1 else 5
+    with TemporaryDirectory() as tmp:
+        path = Path(tmp) / "export.xlsx"
+        write_synthetic_xlsx(path, cases, steps=steps)
+        size_mb = path.stat().st_size / (1024 * 1024)
+        print(f"synthetic XLSX export: {cases} cases x {steps} steps, {size_mb:.1f} MiB")
+        for label, read_rows in (("native", _iter_sheet_rows), ("openpyxl", _openpyxl_rows)):
+            count, elapsed, peak = _measure(read_rows, path)
+            print(
+                f"{label:>9}: {count / elapsed:10.0f} rows/sec ({elapsed:.2f}s), "
+                f"peak {peak / (1024 * 1024):.1f} MiB"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,157 @@
+"""Synthetic Zephyr Scale XML and XLSX exports for benchmarks.
+
+Run from the repository root, e.g. `python -m benchmarks.synthetic out.xml 10000`.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import BinaryIO
+
+
+def _case_xml(
+    index: int,
+    folder_count: int,
+    steps: int,
+    test_data_rows: int,
+    distinct_steps: int | None = None,
+) -> str:
+    folder = f"root/area-{index % folder_count}"
+    step_case = index if distinct_steps is None else index % distinct_steps
+    step_xml = "".join(
+        f'<step index="{step}">'
+        f"<description><![CDATA[<p>Step {step} of case {step_case}<br/>details</p>]]></description>"
+        f"<expectedResult><![CDATA[<ul><li>Result {step}</li></ul>]]></expectedResult>"
+        f"<testData><![CDATA[user=u{step}]]></testData>"
+        "</step>"
+        for step in range(steps)
+    )
+    rows_xml = "".join(
+        "<testDataRow><testDataColumns>"
+        f'<testData index="0"><name>login</name><type>free_text_input</type>'
+        f"<value>user-{row}</value></testData>"
+        f'<testData index="1"><name>role</name><type>free_text_input</type>'
+        f"<value>admin</value></testData>"
+        "</testDataColumns></testDataRow>"
+        for row in range(test_data_rows)
+    )
+    wrapper_xml = f"<testDataWrapper>{rows_xml}</testDataWrapper>" if rows_xml else ""
+    return (
+        f'<testCase id="{index}" key="BENCH-T{index}" paramType="TEST_DATA">'
+        f"<name><![CDATA[Case {index}]]></name>"
+        f"<folder><![CDATA[{folder}]]></folder>"
+        f"<objective><![CDATA[<p>Objective {index}</p>]]></objective>"
+        "<precondition><![CDATA[<p>Logged in</p>]]></precondition>"
+        "<status>Approved</status><priority>Normal</priority><owner>JIRAUSER1</owner>"
+        "<createdBy>JIRAUSER1</createdBy><createdOn>2024-01-01 10:00:00 UTC</createdOn>"
+        "<updatedBy>JIRAUSER2</updatedBy><updatedOn>2024-02-01 10:00:00 UTC</updatedOn>"
+        "<labels><label>smoke</label><label>regression</label></labels>"
+        f"<issues><issue><key>BENCH-{index % 97}</key><summary>Story</summary></issue></issues>"
+        f"<attachments><attachment><name>file-{index % 13}.png</name></attachment></attachments>"
+        '<parameters><parameter index="0"><name>login</name></parameter></parameters>'
+        f"{wrapper_xml}"
+        f'<testScript type="steps"><steps>{step_xml}</steps></testScript>'
+        "</testCase>\n"
+    )
+
+
+def write_synthetic_export(
+    target: BinaryIO,
+    cases: int,
+    *,
+    folder_count: int = 50,
+    steps: int = 5,
+    test_data_rows: int = 2,
+    distinct_steps: int | None = None,
+) -> None:
+    """
+    Write an XML export of `cases` test cases. With `distinct_steps`, step texts repeat
+    every that many cases, as in exports built from shared step templates.
+    """
+    target.write(b'<?xml version="1.0" encoding="UTF-8"?>\n<project><folders>\n')
+    target.writelines(
+        f'<folder fullPath="root/area-{idx}" index="{idx}" />\n'.encode()
+        for idx in range(folder_count)
+    )
+    target.write(b"</folders><testCases>\n")
+    target.writelines(
+        _case_xml(idx, folder_count, steps, test_data_rows, distinct_steps).encode()
+        for idx in range(cases)
+    )
+    target.write(b"</testCases></project>\n")
+
+
+XLSX_HEADER = (
+    "Key",
+    "Name",
+    "Status",
+    "Precondition",
+    "Objective",
+    "Folder",
+    "Folder Description",
+    "Priority",
+    "Labels",
+    "Owner",
+    "Coverage (Issues)",
+    "Test Script (Step-by-Step) - Step",
+    "Test Script (Step-by-Step) - Test Data",
+    "Test Script (Step-by-Step) - Expected Result",
+    "Test Script (Plain Text)",
+    "Test Script (BDD)",
+)
+
+
+def write_synthetic_xlsx(
+    target: str | Path,
+    cases: int,
+    *,
+    folder_count: int = 50,
+    steps: int = 5,
+) -> None:
+    """
+    Write an XLSX export the way Zephyr lays it out: one row per step, case columns
+    filled on the first row of each case only.
+    """
+    import openpyxl
+
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.append(XLSX_HEADER)
+    for idx in range(cases):
+        for step in range(steps):
+            case_columns = (
+                [
+                    f"BENCH-T{idx}",
+                    f"Case {idx}",
+                    "Approved",
+                    "<p>Logged in</p>",
+                    f"<p>Objective {idx}</p>",
+                    f"root/area-{idx % folder_count}",
+                    "Area description",
+                    "Normal",
+                    "smoke, regression",
+                    "JIRAUSER1",
+                    f"BENCH-{idx % 97}",
+                ]
+                if step == 0
+                else [None] * 11
+            )
+            ws.append(
+                case_columns
+                + [f"<p>Step {step} of case {idx}</p>", f"user=u{step}", f"Result {step}"]
+            )
+    wb.save(target)
+
+
+def main(argv: list[str]) -> int:
+    if len(argv) < 2:
+        print("usage: python -m benchmarks.synthetic OUTPUT.xml CASES", file=sys.stderr)
+        return 2
+    with open(Path(argv[0]), "wb") as handle:
+        write_synthetic_export(handle, int(argv[1]))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -1,10 +1,16 @@
+from io import BytesIO
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
+from zephyr_xml_importer.api import serializers
 from zephyr_xml_importer.api.serializers import ImportValidationError, validate_import_request
-from zephyr_xml_importer.api.views import handle_import_request
-
+from zephyr_xml_importer.api.views import (
+    build_import_response,
+    build_preflight_payload,
+    handle_import_request,
+)
 
 FIXTURE = Path(__file__).parent / "fixtures" / "sample.xml"
 
@@ -41,6 +47,59 @@ def test_validate_import_request_invalid_on_duplicate():
     assert "on_duplicate" in excinfo.value.errors
 
 
+def test_validate_import_request_worker_counts(monkeypatch):
+    monkeypatch.setattr(serializers, "max_import_workers", lambda: 4)
+    data = {"project_id": 1, "xml_file": b"<project />"}
+    assert validate_import_request(data).parse_workers == 0
+    assert validate_import_request({**data, "parse_workers": "4"}).parse_workers == 4
+    assert validate_import_request({**data, "map_workers": "2"}).map_workers == 2
+    assert validate_import_request({**data, "bulk_batch_size": "500"}).bulk_batch_size == 500
+
+    with pytest.raises(ImportValidationError) as excinfo:
+        validate_import_request({**data, "parse_workers": "-1"})
+    assert "parse_workers" in excinfo.value.errors
+
+    with pytest.raises(ImportValidationError) as excinfo:
+        validate_import_request({**data, "parse_workers": "5", "map_workers": 1_000_000})
+    assert excinfo.value.errors == {
+        "parse_workers": "must be at most 4",
+        "map_workers": "must be at most 4",
+    }
+
+
+def test_max_import_workers_defaults_to_cpu_count(monkeypatch):
+    monkeypatch.setattr(serializers.os, "cpu_count", lambda: 3)
+    monkeypatch.setattr(serializers, "settings", None)
+    assert serializers.max_import_workers() == 3
+
+    monkeypatch.setattr(serializers, "settings", SimpleNamespace(ZEPHYR_IMPORT_MAX_WORKERS=8))
+    assert serializers.max_import_workers() == 8
+
+
+def test_validate_import_request_case_filter():
+    data = {"project_id": 1, "xml_file": b"<project />"}
+    assert validate_import_request(data).case_filter is None
+
+    request = validate_import_request(
+        {
+            **data,
+            "folder_prefix": "/ui/",
+            "zephyr_keys": "ES-T1, ES-T2*",
+            "updated_since": "2024-01-31",
+        }
+    )
+    case_filter = request.case_filter
+    assert case_filter.folder_prefix == "ui"
+    assert case_filter.match_key("ES-T1")
+    assert case_filter.match_key("ES-T25")
+    assert not case_filter.match_key("ES-T3")
+    assert case_filter.updated_since.isoformat() == "2024-01-31T00:00:00+00:00"
+
+    with pytest.raises(ImportValidationError) as excinfo:
+        validate_import_request({**data, "updated_since": "last week"})
+    assert "updated_since" in excinfo.value.errors
+
+
 def test_handle_import_request_dry_run_response():
     xml_bytes = FIXTURE.read_bytes()
     response = handle_import_request(
@@ -66,3 +125,78 @@ def test_handle_import_request_dry_run_response():
         "failed": 0,
     }
     assert "ES-T560" in response["report_csv"]
+
+
+def test_handle_import_request_reports_sanitize_cache_counters():
+    xml_bytes = FIXTURE.read_bytes()
+    request = {"project_id": 7, "xml_file": xml_bytes, "dry_run": True}
+    uncached = handle_import_request(request)
+    cached = handle_import_request({**request, "sanitize_cache_size": "100"})
+
+    assert cached["report_csv"] == uncached["report_csv"]
+    assert "sanitize_cache_hits" not in uncached["summary"]
+    hits = cached["summary"]["sanitize_cache_hits"]
+    misses = cached["summary"]["sanitize_cache_misses"]
+    assert hits > 0 and misses > 0
+
+    with pytest.raises(ImportValidationError) as excinfo:
+        validate_import_request({**request, "sanitize_cache_size": -1})
+    assert "sanitize_cache_size" in excinfo.value.errors
+
+    too_large = serializers.MAX_SANITIZE_CACHE_SIZE + 1
+    with pytest.raises(ImportValidationError) as excinfo:
+        validate_import_request({**request, "sanitize_cache_size": too_large})
+    assert "sanitize_cache_size" in excinfo.value.errors
+
+
+def test_preflight_payload_counts_and_case_limit():
+    xml_bytes = FIXTURE.read_bytes()
+    payload = build_preflight_payload(xml_bytes, max_cases=1)
+    assert payload["status"] == "success"
+    assert payload["counts"] == {"folders": 2, "cases": 1, "steps": 2, "attachments": 2}
+    assert payload["within_limit"] is True
+    assert build_preflight_payload(xml_bytes)["max_cases"] is None
+
+    stream = BytesIO(xml_bytes)
+    request_data = validate_import_request({"project_id": 1, "xml_file": stream, "dry_run": True})
+    response = build_import_response(request_data, max_cases=1)
+    # The limit check rewinds the upload before the import reads it.
+    assert response["status"] == "success"
+    assert response["summary"]["cases"] == 1
+
+    two_cases = xml_bytes.replace(b"</testCases>", b'<testCase id="2" key="ES-T2" /></testCases>')
+    request_data = validate_import_request(
+        {"project_id": 1, "xml_file": two_cases, "dry_run": True}
+    )
+    response = build_import_response(request_data, max_cases=1)
+    assert response["status"] == "failed"
+    assert response["errors"] == ["Export has 2 test cases; the limit is 1"]
+
+    # Only the cases the filter keeps count against the limit.
+    request_data = validate_import_request(
+        {"project_id": 1, "xml_file": two_cases, "dry_run": True, "zephyr_keys": "ES-T560"}
+    )
+    response = build_import_response(request_data, max_cases=1)
+    assert response["status"] == "success"
+    assert response["summary"]["cases"] == 1
+
+
+class _OneShotStream(BytesIO):
+    def seekable(self) -> bool:
+        return False
+
+
+def test_case_limit_refuses_unrewindable_and_unreadable_uploads():
+    request = {"project_id": 1, "dry_run": True}
+    unrewindable = validate_import_request(
+        {**request, "xml_file": _OneShotStream(FIXTURE.read_bytes())}
+    )
+    response = build_import_response(unrewindable, max_cases=10)
+    assert response["status"] == "failed"
+    assert response["errors"] == ["The upload cannot be read twice, so its size cannot be checked"]
+    assert build_import_response(unrewindable)["status"] == "success"
+
+    malformed = validate_import_request({**request, "xml_file": b"<project><testCases>"})
+    response = build_import_response(malformed, max_cases=10)
+    assert response["status"] == "failed"
+    assert response["errors"][0].startswith("Could not read the export: ")
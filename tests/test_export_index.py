@@ -0,0 +1,92 @@
+from pathlib import Path
+
+import pytest
+
+from zephyr_xml_importer.services import export_index, importer
+from zephyr_xml_importer.services.export_index import open_export_index
+from zephyr_xml_importer.services.filters import build_case_filter
+from zephyr_xml_importer.services.importer import dry_run_import
+from zephyr_xml_importer.services.parser import iter_test_cases
+
+XML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<project>
+  <folders><folder fullPath="ui" index="1"/><folder fullPath="api" index="2"/></folders>
+  <testCases>
+    <testCase id="1" key="K-1"><name>One</name><folder>ui</folder></testCase>
+    <testCase id="2" key="K-2"><name><![CDATA[<testCase>]]></name><folder>api</folder></testCase>
+    <testCase id="3" key="K-1"><name>Duplicate</name><folder>ui</folder></testCase>
+  </testCases>
+</project>"""
+
+
+def test_export_index_fetches_cases_by_key_id_and_folder(tmp_path: Path):
+    source = tmp_path / "export.xml"
+    source.write_bytes(XML)
+    by_key = {tc.zephyr_id: tc for tc in iter_test_cases(source)}
+
+    with open_export_index(source) as index:
+        assert len(index) == 3
+        assert index.get_test_case(key="K-2") == by_key["2"]
+        assert index.get_test_case(key="K-1") == by_key["1"]
+        assert index.get_test_case(zephyr_id="3") == by_key["3"]
+        assert index.get_test_case(key="missing") is None
+        assert list(index.iter_folder_test_cases("ui")) == [by_key["1"], by_key["3"]]
+        assert list(index.folders()) == ["ui", "api"]
+        with pytest.raises(ValueError):
+            index.get_test_case()
+
+
+def test_export_index_is_built_once_per_content(tmp_path: Path, monkeypatch):
+    source = tmp_path / "export.xml"
+    source.write_bytes(XML)
+    index_dir = tmp_path / "indexes"
+    with open_export_index(source, index_dir=index_dir) as index:
+        first_hash = index.content_hash
+
+    def fail(*args, **kwargs):
+        raise AssertionError("index should be reused")
+
+    copy = tmp_path / "copy.xml"
+    copy.write_bytes(XML)
+    monkeypatch.setattr(export_index, "iter_test_case_spans", fail)
+    with open_export_index(copy, index_dir=index_dir) as index:
+        assert index.content_hash == first_hash
+        assert index.get_test_case(key="K-2").name == "<testCase>"
+
+    monkeypatch.undo()
+    source.write_bytes(XML.replace(b"One", b"Changed"))
+    with open_export_index(source, index_dir=index_dir) as index:
+        assert index.content_hash != first_hash
+        assert index.get_test_case(key="K-1").name == "Changed"
+    assert len(list(index_dir.iterdir())) == 2
+
+
+def test_filtered_import_reads_only_indexed_cases(tmp_path: Path, monkeypatch):
+    source = tmp_path / "export.xml"
+    source.write_bytes(
+        XML.replace(
+            b"<folder>api</folder>", b"<folder>api</folder><updatedOn>2023-01-01</updatedOn>"
+        )
+    )
+    index_dir = tmp_path / "indexes"
+    filters = [
+        build_case_filter(folder_prefix="ui"),
+        build_case_filter(keys=["K-1"]),
+        build_case_filter(keys=["K-*"], updated_since="2024-01-01"),
+    ]
+    expected = [dry_run_import(source, case_filter=case_filter) for case_filter in filters]
+
+    def fail(*args, **kwargs):
+        raise AssertionError("the export should be read through its index")
+
+    monkeypatch.setattr(importer, "parse_folders_and_duplicate_key_counts", fail)
+    for case_filter, result in zip(filters, expected):
+        indexed = dry_run_import(source, case_filter=case_filter, export_index_dir=index_dir)
+        assert indexed == result
+    assert "Duplicate Zephyr key in XML: K-1" in expected[1].warnings
+    assert len(list(index_dir.iterdir())) == 1
+
+    with open_export_index(source, index_dir=index_dir) as index:
+        ranges, duplicate_key_counts = index.select_ranges(filters[2])
+        assert duplicate_key_counts == {"K-1": 2}
+        assert [tc.zephyr_id for tc in index.read_test_cases(ranges)] == ["1", "3"]
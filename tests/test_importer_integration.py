@@ -1,4 +1,6 @@
 import csv
+import zipfile
+from dataclasses import replace
 from io import StringIO
 from pathlib import Path
 
@@ -9,7 +11,11 @@ try:
 except Exception:  # pragma: no cover - dependency should be installed in runtime
     openpyxl = None
 
-from zephyr_xml_importer.services.importer import import_into_testy
+from zephyr_xml_importer.services.importer import (
+    dry_run_import,
+    import_into_testy,
+    preflight_export,
+)
 from zephyr_xml_importer.services.testy_adapter import InMemoryTestyAdapter
 
 
@@ -186,3 +192,332 @@ def test_import_sets_suite_description_from_folder_description(tmp_path: Path) -
     sub = find_suite("Sub", parent_name="Top")
     assert sub is not None
     assert sub.description == "Sub suite description"
+
+
+@pytest.mark.skipif(openpyxl is None, reason="openpyxl is required for XLSX parsing")
+def test_xlsx_import_streams_cases_in_both_modes(tmp_path: Path) -> None:
+    workbook_path = tmp_path / "duplicates.xlsx"
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.append(
+        [
+            "Key",
+            "Name",
+            "Folder",
+            "Test Script (Step-by-Step) - Step",
+            "Test Script (Step-by-Step) - Expected Result",
+        ]
+    )
+    ws.append(["EX-1", "Case one", "ui", "Open", "Opens"])
+    ws.append(["EX-2", "Case two", "api", "Call", "Answers"])
+    ws.append(["EX-1", "Case one again", "ui/forms", "Open", "Opens"])
+    wb.save(workbook_path)
+    wb.close()
+
+    results = []
+    for single_pass in (False, True):
+        dry_run = dry_run_import(workbook_path, single_pass=single_pass)
+        adapter = InMemoryTestyAdapter()
+        imported = import_into_testy(
+            workbook_path, project_id=1, adapter=adapter, single_pass=single_pass
+        )
+        results.append((dry_run.summary, dry_run.warnings, imported.summary, imported.warnings))
+        assert sorted(suite.name for suite in adapter.suites.values()) == ["api", "forms", "ui"]
+
+    assert results[0] == results[1]
+    summary, warnings = results[0][:2]
+    assert summary.cases == 3
+    assert summary.folders == 3
+    assert warnings == ["Duplicate Zephyr key in XML: EX-1"]
+
+
+@pytest.mark.skipif(openpyxl is None, reason="openpyxl is required for XLSX parsing")
+def test_xlsx_import_merges_sheets_and_workbooks(tmp_path: Path) -> None:
+    header = [
+        "Key",
+        "Name",
+        "Folder",
+        "Test Script (Step-by-Step) - Step",
+        "Test Script (Step-by-Step) - Expected Result",
+    ]
+    wb = openpyxl.Workbook()
+    wb.active.append(header)
+    wb.active.append(["EX-1", "Case one", "ui", "Open", "Opens"])
+    second = wb.create_sheet("more")
+    second.append(header)
+    second.append(["EX-2", "Case two", "api", "Call", "Answers"])
+    first_path = tmp_path / "first.xlsx"
+    wb.save(first_path)
+    wb.close()
+    wb = openpyxl.Workbook()
+    wb.active.append(header)
+    wb.active.append(["EX-1", "Case one again", "ui/forms", "Open", "Opens"])
+    second_path = tmp_path / "second.xlsx"
+    wb.save(second_path)
+    wb.close()
+
+    # Only the active sheet of each workbook unless every sheet is asked for.
+    assert dry_run_import([first_path, second_path]).summary.cases == 2
+    bundle_path = tmp_path / "workbooks.zip"
+    with zipfile.ZipFile(bundle_path, "w", zipfile.ZIP_DEFLATED) as bundle:
+        bundle.write(first_path, "first.xlsx")
+        bundle.write(second_path, "second.xlsx")
+
+    for source in ([first_path, second_path], bundle_path):
+        dry_run = dry_run_import(source, xlsx_all_sheets=True)
+        assert dry_run.summary.cases == 3
+        assert dry_run.summary.folders == 3
+        assert dry_run.warnings == ["Duplicate Zephyr key in XML: EX-1"]
+        adapter = InMemoryTestyAdapter()
+        imported = import_into_testy(source, project_id=1, adapter=adapter, xlsx_all_sheets=True)
+        assert (imported.summary.created, imported.summary.skipped) == (2, 1)
+        assert sorted(suite.name for suite in adapter.suites.values()) == ["api", "forms", "ui"]
+    assert preflight_export(bundle_path, xlsx_all_sheets=True).cases == 3
+
+
+def test_single_pass_import_creates_folders_listed_after_cases():
+    xml = """<project>
+  <testCases>
+    <testCase id="1" key="EX-1">
+      <name>Case one</name>
+      <folder>ui/forms</folder>
+      <testScript type="text">Plain text</testScript>
+    </testCase>
+  </testCases>
+  <folders>
+    <folder fullPath="ui/forms" index="2" />
+    <folder fullPath="api" index="3" />
+  </folders>
+</project>"""
+    adapter = InMemoryTestyAdapter()
+
+    result = import_into_testy(
+        xml.encode("utf-8"),
+        project_id=1,
+        adapter=adapter,
+        single_pass=True,
+    )
+
+    assert result.summary.cases == 1
+    assert result.summary.created == 1
+    assert result.summary.folders == 2
+    assert result.warnings == []
+    assert sorted(suite.name for suite in adapter.suites.values()) == ["api", "forms", "ui"]
+
+
+def test_import_maps_cases_in_worker_processes(monkeypatch):
+    monkeypatch.setattr("zephyr_xml_importer.services.mapping._MAP_BATCH_CASES", 2)
+    cases = "".join(
+        f"""<testCase id="{idx}" key="EX-{idx}">
+      <name>Case {idx}</name>
+      <folder>ui/area-{idx % 2}</folder>
+      <labels><label>smoke</label></labels>
+      <testScript type="steps"><steps>
+        <step index="0"><description><![CDATA[<p>Open form</p>]]></description>
+          <expectedResult><![CDATA[<ul><li>Shown {idx % 3}</li></ul>]]></expectedResult></step>
+      </steps></testScript>
+    </testCase>"""
+        for idx in range(7)
+    )
+    xml = f"<project><testCases>{cases}</testCases></project>".encode()
+
+    inline_adapter = InMemoryTestyAdapter()
+    inline = import_into_testy(xml, project_id=1, adapter=inline_adapter, sanitize_cache_size=16)
+    pooled_adapter = InMemoryTestyAdapter()
+    pooled = import_into_testy(
+        xml, project_id=1, adapter=pooled_adapter, sanitize_cache_size=16, map_workers=2
+    )
+
+    assert pooled.report_csv == inline.report_csv
+    assert pooled.warnings == inline.warnings
+    assert pooled_adapter.cases == inline_adapter.cases
+    assert pooled.summary.created == 7
+    # Each worker has its own cache, so only the number of lookups is the same.
+    assert (
+        pooled.summary.sanitize_cache_hits + pooled.summary.sanitize_cache_misses
+        == inline.summary.sanitize_cache_hits + inline.summary.sanitize_cache_misses
+    )
+    assert dry_run_import(xml, map_workers=2).report_csv == dry_run_import(xml).report_csv
+
+
+def test_bulk_import_matches_per_case_import_and_reports_item_failures():
+    cases = "".join(
+        f"""<testCase id="{idx}" key="{key}">
+      <name>{name}</name>
+      <folder>ui</folder>
+      <labels><label>smoke</label></labels>
+      <testScript type="text">Plain text</testScript>
+    </testCase>"""
+        for idx, (key, name) in enumerate(
+            [
+                ("EX-1", "One"),
+                ("EX-2", "Broken"),
+                ("EX-3", "Three"),
+                ("EX-1", "Again"),
+                ("", "Four"),
+            ]
+        )
+    )
+    xml = f"<project><testCases>{cases}</testCases></project>".encode()
+
+    class FlakyAdapter(InMemoryTestyAdapter):
+        bulk_calls = 0
+
+        def create_cases_with_steps_bulk(self, project_id, items, *, batch_size):
+            self.bulk_calls += 1
+            return super().create_cases_with_steps_bulk(project_id, items, batch_size=batch_size)
+
+        def create_case_with_steps(self, project_id, suite_id, payload):
+            if payload["name"].endswith("Broken"):
+                raise ValueError("name rejected")
+            return super().create_case_with_steps(project_id, suite_id, payload)
+
+    per_case_adapter = FlakyAdapter()
+    per_case = import_into_testy(xml, project_id=1, adapter=per_case_adapter)
+    bulk_adapter = FlakyAdapter()
+    bulk = import_into_testy(xml, project_id=1, adapter=bulk_adapter, bulk_batch_size=10)
+
+    assert bulk.report_csv == per_case.report_csv
+    assert replace(bulk.summary, bulk_fallbacks=None) == per_case.summary
+    assert (per_case.summary.bulk_fallbacks, bulk.summary.bulk_fallbacks) == (None, 0)
+    assert (bulk.summary.created, bulk.summary.skipped, bulk.summary.failed) == (3, 1, 1)
+    assert [case.labels for case in bulk_adapter.cases.values()] == [["smoke"]] * 3
+    # The repeated EX-1 flushes the first batch so it can be found and skipped.
+    assert (per_case_adapter.bulk_calls, bulk_adapter.bulk_calls) == (0, 2)
+    rows = _parse_report(bulk.report_csv)
+    error_index = rows[0].index("error")
+    assert [row[error_index] for row in rows[1:]] == ["", "name rejected", "", "", ""]
+
+
+def test_bulk_import_counts_cases_created_after_a_failed_batch():
+    xml = b"""<project><testCases>
+    <testCase id="1" key="EX-1"><name>One</name><folder>ui</folder></testCase>
+    <testCase id="2" key="EX-2"><name>Two</name><folder>ui</folder></testCase>
+</testCases></project>"""
+
+    class FallbackAdapter(InMemoryTestyAdapter):
+        def create_cases_with_steps_bulk(self, project_id, items, *, batch_size):
+            results = super().create_cases_with_steps_bulk(project_id, items, batch_size=batch_size)
+            return [replace(result, bulk_error="deadlock detected") for result in results]
+
+    result = import_into_testy(xml, project_id=1, adapter=FallbackAdapter(), bulk_batch_size=10)
+
+    assert (result.summary.created, result.summary.bulk_fallbacks) == (2, 2)
+    assert "Bulk insert failed, created on its own: deadlock detected" in result.warnings
+
+
+def test_import_looks_up_existing_keys_once_per_project():
+    xml = b"""<project><testCases>
+    <testCase id="1" key="EX-1"><name>One</name><folder>ui</folder></testCase>
+    <testCase id="2" key="EX-2"><name>Two</name><folder>ui</folder></testCase>
+    <testCase id="3" key="EX-2"><name>Two again</name><folder>ui</folder></testCase>
+</testCases></project>"""
+
+    class CountingAdapter(InMemoryTestyAdapter):
+        def __init__(self) -> None:
+            super().__init__()
+            self.lookups = 0
+
+        def find_case_id_by_zephyr_key(self, project_id, zephyr_key):
+            self.lookups += 1
+            return super().find_case_id_by_zephyr_key(project_id, zephyr_key)
+
+    class PerCaseAdapter(CountingAdapter):
+        def case_ids_by_zephyr_key(self, project_id):
+            raise NotImplementedError
+
+    results = []
+    for adapter in (CountingAdapter(), PerCaseAdapter()):
+        suite_id = adapter.create_suite(1, "Existing", None, {})
+        adapter.create_case_with_steps(1, suite_id, {"attributes": {"zephyr": {"key": "EX-1"}}})
+        results.append(import_into_testy(xml, project_id=1, adapter=adapter))
+        assert (len(adapter.cases), adapter.lookups) == (
+            (2, 0) if type(adapter) is CountingAdapter else (2, 3)
+        )
+
+    assert results[0].report_csv == results[1].report_csv
+    assert (results[0].summary.created, results[0].summary.skipped) == (1, 2)
+
+
+def test_import_resolves_folders_from_the_loaded_suite_tree():
+    xml = b"""<project>
+  <folders>
+    <folder fullPath="ui/forms" index="1" />
+    <folder fullPath="ui/forms/login" index="2" />
+    <folder fullPath="api" index="3" />
+  </folders>
+  <testCases>
+    <testCase id="1" key="EX-1"><name>One</name><folder>ui/forms/login</folder></testCase>
+  </testCases>
+</project>"""
+
+    class CountingAdapter(InMemoryTestyAdapter):
+        def __init__(self) -> None:
+            super().__init__()
+            self.lookups = 0
+
+        def get_suite_id(self, project_id, name, parent_id):
+            self.lookups += 1
+            return super().get_suite_id(project_id, name, parent_id)
+
+    class PerSuiteAdapter(CountingAdapter):
+        def load_suite_tree(self, project_id):
+            raise NotImplementedError
+
+    for adapter in (CountingAdapter(), PerSuiteAdapter()):
+        ui_id = adapter.create_suite(1, "ui", None, {})
+        forms_id = adapter.create_suite(1, "forms", ui_id, {})
+        adapter.create_suite(2, "api", None, {})
+
+        import_into_testy(xml, project_id=1, adapter=adapter)
+
+        assert adapter.lookups == (0 if type(adapter) is CountingAdapter else 4)
+        login_id = adapter.get_suite_id(1, "login", forms_id)
+        assert adapter.cases[1].suite_id == login_id
+        project_suites = [suite.name for suite in adapter.suites.values() if suite.project_id == 1]
+        assert sorted(project_suites) == ["api", "forms", "login", "ui"]
+
+
+def test_import_creates_folder_suites_one_level_per_bulk_call():
+    xml = b"""<project>
+  <folders>
+    <folder fullPath="ui/forms/login" index="3" />
+    <folder fullPath="ui/forms" index="2" />
+    <folder fullPath="api/v1" index="4" />
+    <folder fullPath="ui" index="1" />
+  </folders>
+  <testCases>
+    <testCase id="1" key="EX-1"><name>One</name><folder>ui/forms/login</folder></testCase>
+  </testCases>
+</project>"""
+
+    class LevelAdapter(InMemoryTestyAdapter):
+        def __init__(self) -> None:
+            super().__init__()
+            self.levels: list[list[tuple[str, int | None]]] = []
+
+        def create_suites_bulk(self, project_id, suites):
+            self.levels.append([(suite.name, suite.parent_id) for suite in suites])
+            return super().create_suites_bulk(project_id, suites)
+
+    plain = LevelAdapter()
+    import_into_testy(xml, project_id=1, adapter=plain)
+    # Bulk suite inserts skip TestY's history, so only bulk_batch_size opts into them.
+    assert plain.levels == []
+    names = sorted(suite.name for suite in plain.suites.values())
+    assert names == ["api", "forms", "login", "ui", "v1"]
+
+    adapter = LevelAdapter()
+    adapter.create_suite(1, "api", None, {})
+
+    import_into_testy(xml, project_id=1, adapter=adapter, bulk_batch_size=10)
+
+    ids = {suite.name: suite.suite_id for suite in adapter.suites.values()}
+    assert adapter.levels == [
+        [("ui", None)],
+        [("v1", ids["api"]), ("forms", ids["ui"])],
+        [("login", ids["forms"])],
+    ]
+    login = adapter.suites[ids["login"]]
+    assert login.attributes == {"zephyr": {"folderFullPath": "ui/forms/login", "folderIndex": 3}}
+    assert adapter.cases[1].suite_id == ids["login"]
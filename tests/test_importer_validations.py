@@ -1,6 +1,13 @@
+import bz2
 import csv
+import gzip
+import lzma
+import zipfile
 from io import BytesIO, StringIO
 
+import pytest
+
+from zephyr_xml_importer.services.filters import build_case_filter
 from zephyr_xml_importer.services.importer import MAX_WARNING_PREVIEW, dry_run_import
 
 
@@ -184,3 +191,138 @@ def test_dry_run_accepts_non_seekable_stream():
 
     assert result.summary.cases == 2
     assert "Duplicate Zephyr key in XML: DUP-1" in result.warnings
+
+
+def test_single_pass_dry_run_matches_two_pass_report():
+    xml = b"""<project>
+  <testCases>
+    <testCase id="1" key="DUP-1">
+      <name>Case one</name>
+      <folder>Late/Folder</folder>
+      <testScript type="text">Plain text</testScript>
+    </testCase>
+    <testCase id="2" key="DUP-1">
+      <name>Case two</name>
+      <folder>Missing/Path</folder>
+      <testScript type="text">Plain text</testScript>
+    </testCase>
+    <testCase id="3" key="ONE-1">
+      <name>Case three</name>
+      <folder>Late/Folder</folder>
+      <testScript type="text">Plain text</testScript>
+    </testCase>
+  </testCases>
+  <folders>
+    <folder fullPath="Late/Folder" index="1" />
+  </folders>
+</project>"""
+
+    two_pass = dry_run_import(xml)
+    single_pass = dry_run_import(xml, single_pass=True)
+
+    assert single_pass.report_csv == two_pass.report_csv
+    assert single_pass.warnings == two_pass.warnings
+    assert single_pass.summary == two_pass.summary
+    assert "Duplicate Zephyr key in XML: DUP-1" in single_pass.warnings
+    assert "Folder not found in Zephyr export: Missing/Path for case DUP-1" in single_pass.warnings
+    assert not any("Late/Folder" in warning for warning in single_pass.warnings)
+
+    parallel = dry_run_import(xml, parse_workers=2)
+
+    assert parallel.report_csv == two_pass.report_csv
+    assert parallel.warnings == two_pass.warnings
+    assert parallel.summary == two_pass.summary
+
+
+def test_single_pass_dry_run_reads_non_seekable_stream_once():
+    class ReadOnceStream:
+        def __init__(self, data: bytes) -> None:
+            self._bio = BytesIO(data)
+
+        def read(self, size: int = -1):
+            return self._bio.read(size)
+
+        def seekable(self) -> bool:
+            return False
+
+        def seek(self, *args):
+            raise AssertionError("single-pass import must not rewind the source")
+
+        def tell(self):
+            raise OSError("not seekable")
+
+    xml = b"""<project>
+  <folders><folder fullPath="Root" index="1" /></folders>
+  <testCases>
+    <testCase id="1" key="K-1">
+      <name>Case one</name>
+      <folder>Root</folder>
+      <testScript type="text">Plain text</testScript>
+    </testCase>
+  </testCases>
+</project>"""
+    result = dry_run_import(ReadOnceStream(xml), single_pass=True)
+
+    assert result.summary.cases == 1
+    assert result.summary.folders == 1
+    assert result.warnings == []
+
+
+def _zip_single(data: bytes) -> bytes:
+    buffer = BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("export.xml", data)
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize(
+    "compress",
+    [gzip.compress, bz2.compress, lzma.compress, _zip_single],
+    ids=["gz", "bz2", "xz", "zip"],
+)
+@pytest.mark.parametrize("single_pass", [False, True])
+def test_dry_run_reads_compressed_exports(tmp_path, compress, single_pass):
+    xml = b"""<project>
+  <folders><folder fullPath="Root" index="1" /></folders>
+  <testCases>
+    <testCase id="1" key="DUP-1"><name>One</name><folder>Root</folder></testCase>
+    <testCase id="2" key="DUP-1"><name>Two</name><folder>Gone</folder></testCase>
+  </testCases>
+</project>"""
+    expected = dry_run_import(xml)
+    compressed = compress(xml)
+    upload = tmp_path / "export.upload"
+    upload.write_bytes(compressed)
+
+    for source in (compressed, BytesIO(compressed), upload):
+        result = dry_run_import(source, single_pass=single_pass)
+        assert result == expected
+    assert "Duplicate Zephyr key in XML: DUP-1" in expected.warnings
+
+
+@pytest.mark.parametrize("single_pass", [False, True])
+def test_dry_run_imports_only_the_filtered_folder_subtree(single_pass):
+    xml = b"""<project>
+  <folders>
+    <folder fullPath="ui" index="1" />
+    <folder fullPath="ui/login" index="2" />
+    <folder fullPath="api" index="3" />
+  </folders>
+  <testCases>
+    <testCase id="1" key="K-1"><name>One</name><folder>ui/login</folder></testCase>
+    <testCase id="2" key="K-2"><name>Two</name><folder>api</folder></testCase>
+    <testCase id="3" key="K-3"><name>Three</name><folder>ui</folder></testCase>
+    <testCase id="4" key="K-1"><name>Copy</name><folder>api</folder></testCase>
+  </testCases>
+</project>"""
+    result = dry_run_import(
+        xml, single_pass=single_pass, case_filter=build_case_filter(folder_prefix="ui")
+    )
+
+    assert result.summary.cases == 2
+    assert result.summary.folders == 2
+    rows = _parse_report(result.report_csv)
+    id_index = rows[0].index("zephyr_id")
+    assert [row[id_index] for row in rows[1:]] == ["1", "3"]
+    # K-1 also names a case outside the filter, which is not a duplicate of this import.
+    assert result.warnings == []
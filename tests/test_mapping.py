@@ -1,9 +1,10 @@
 from pathlib import Path
 
+from zephyr_xml_importer.services import sanitize
 from zephyr_xml_importer.services.mapping import build_testy_payload_from_zephyr
 from zephyr_xml_importer.services.models import ZephyrStep, ZephyrTestCase
 from zephyr_xml_importer.services.parser import iter_test_cases
-
+from zephyr_xml_importer.services.validation import build_case_warnings
 
 FIXTURE = Path(__file__).parent / "fixtures" / "sample.xml"
 
@@ -97,3 +98,35 @@ def test_mapping_test_data_wrapper_is_json_safe():
     wrapper = payload["attributes"]["zephyr"]["testDataWrapper"]
     assert isinstance(wrapper, dict)
     assert wrapper["rows"][0]["cells"][0]["value"] == "alpha"
+
+
+def test_mapping_and_validation_share_one_sanitized_view():
+    tc = ZephyrTestCase(
+        zephyr_id="43",
+        key="ES-T998",
+        name="Shared view",
+        objective="<p>Goal</p>",
+        precondition="<p>Ready</p>",
+        steps=[
+            ZephyrStep(index=1, description="<b>Submit</b>", expected_result=""),
+            ZephyrStep(index=0, description="Open", test_data="x=1", expected_result="Opens"),
+        ],
+        test_script_type="steps",
+    )
+    calls = []
+
+    def counting_sanitize(fragment):
+        calls.append(fragment)
+        return sanitize.sanitize_html(fragment)
+
+    sanitized = sanitize.sanitize_case(tc, counting_sanitize)
+    assert len(calls) == 3 + 3 * len(tc.steps)
+
+    payload = build_testy_payload_from_zephyr(tc, sanitized=sanitized, sanitize=counting_sanitize)
+    warnings = build_case_warnings(tc, payload["name"], {}, sanitized=sanitized)
+    assert len(calls) == 3 + 3 * len(tc.steps)
+    assert [step["scenario"] for step in payload["steps"]] == ["Open\n\nTest data:\nx=1", "Submit"]
+    assert payload["scenario"].startswith("Step 1\nOpen")
+    assert "Empty expected result for step 2 in Zephyr case ES-T998" in warnings
+    assert payload == build_testy_payload_from_zephyr(tc)
+    assert warnings == build_case_warnings(tc, payload["name"], {})
@@ -1,7 +1,13 @@
 from pathlib import Path
 
-from zephyr_xml_importer.services.parser import parse_folders, iter_test_cases
-
+from zephyr_xml_importer.services.filters import build_case_filter
+from zephyr_xml_importer.services.interning import make_interner
+from zephyr_xml_importer.services.parser import (
+    count_export,
+    iter_test_cases,
+    parse_folders,
+    parse_folders_and_duplicate_key_counts,
+)
 
 FIXTURE = Path(__file__).parent / "fixtures" / "sample.xml"
 
@@ -55,3 +61,112 @@ def test_iter_test_cases_extras():
     assert wrapper.rows[0].cells[0].value == "alpha"
     assert wrapper.rows[0].cells[1].value == "beta"
     assert wrapper.rows[1].cells[0].value == "gamma"
+
+
+def test_iter_test_cases_keeps_first_match_semantics():
+    xml = b"""<project><testCases>
+<testCase key="K-1">
+  <name>First</name><name>ignored</name>
+  <labels><label>a</label><other><label>nested</label></other></labels>
+  <labels><label>ignored</label></labels>
+  <testScript type="steps">
+    <steps>
+      <step index="2"><description>x<!-- c -->y</description><description>dup</description></step>
+      <step><expectedResult>e</expectedResult></step>
+    </steps>
+    <steps><step><description>ignored</description></step></steps>
+  </testScript>
+</testCase>
+<testCase key="K-2"><testScript type="plain">  Body  <steps/></testScript></testCase>
+<other><testCase key="nested"/></other>
+</testCases></project>"""
+
+    first, second, nested = list(iter_test_cases(xml))
+
+    assert first.name == "First"
+    assert first.labels == ["a"]
+    assert [(s.index, s.description, s.expected_result) for s in first.steps] == [
+        (2, "xy", None),
+        (1, None, "e"),
+    ]
+    assert second.test_script_text == "Body"
+    assert second.steps == []
+    assert nested.key == "nested"
+
+
+def test_iter_test_cases_applies_case_filter():
+    xml = b"""<project>
+  <folders>
+    <folder fullPath="ui" index="1" />
+    <folder fullPath="ui/login" index="2" />
+    <folder fullPath="uikit" index="3" />
+  </folders>
+  <testCases>
+    <testCase id="1" key="A-T1"><folder>ui/login</folder><updatedOn>2024-02-01 10:00:00 UTC</updatedOn></testCase>
+    <testCase id="2" key="A-T2"><folder>uikit</folder><updatedOn>2024-02-01 10:00:00 UTC</updatedOn></testCase>
+    <testCase id="3" key="B-T3"><folder>ui</folder><updatedOn>2023-12-31 23:59:59 UTC</updatedOn></testCase>
+    <testCase id="4" key="A-T4"><folder>ui</folder></testCase>
+    <testCase id="5" key="A-T5"><name>No folder</name></testCase>
+  </testCases>
+</project>"""
+
+    def ids(**criteria):
+        folders = {}
+        cases = iter_test_cases(xml, folders=folders, case_filter=build_case_filter(**criteria))
+        return [tc.zephyr_id for tc in cases], sorted(folders)
+
+    assert ids(folder_prefix="ui") == (["1", "3", "4"], ["ui", "ui/login"])
+    assert ids(keys=["A-*", "B-T9"]) == (["1", "2", "4", "5"], ["ui", "ui/login", "uikit"])
+    # Cases without a readable updatedOn are kept.
+    assert ids(updated_since="2024-01-01")[0] == ["1", "2", "4", "5"]
+    assert ids(folder_prefix="ui", keys=["A-T*"], updated_since="2024-01-01")[0] == ["1", "4"]
+    assert build_case_filter(folder_prefix=" / ", keys=[""]) is None
+
+    def counted_keys(**criteria):
+        case_filter = build_case_filter(**criteria)
+        return sorted(parse_folders_and_duplicate_key_counts(xml, case_filter=case_filter)[1])
+
+    assert counted_keys(folder_prefix="ui") == ["A-T1", "A-T4", "B-T3"]
+    assert counted_keys(folder_prefix="ui", keys=["A-T*"], updated_since="2024-01-01") == [
+        "A-T1",
+        "A-T4",
+    ]
+
+
+def test_count_export_matches_parsed_cases():
+    counts = count_export(FIXTURE)
+    tcs = list(iter_test_cases(FIXTURE))
+
+    assert counts.folders == len(parse_folders(FIXTURE))
+    assert counts.cases == len(tcs)
+    assert counts.steps == sum(len(tc.steps) for tc in tcs)
+    assert counts.attachments == sum(len(tc.attachments) for tc in tcs)
+
+
+def test_iter_test_cases_shares_repeated_values():
+    case = (
+        '<testCase id="{0}" key="K-{0}"><folder>ui</folder><status>Approved</status>'
+        "<labels><label>smoke</label></labels><issues><issue><key>ES-1</key></issue></issues>"
+        "</testCase>"
+    )
+    xml = f"<project><testCases>{case.format(1)}{case.format(2)}</testCases></project>"
+    first, second = iter_test_cases(xml.encode("utf-8"))
+
+    assert first.folder is second.folder
+    assert first.status is second.status
+    assert first.labels[0] is second.labels[0]
+    assert first.issues[0].key is second.issues[0].key
+
+
+def _fresh(text):
+    # A new string object equal to `text`, as the parser builds one for every element.
+    return text.encode().decode()
+
+
+def test_interner_is_bounded():
+    intern = make_interner(size=1)
+    a = intern(_fresh("ab"))
+    assert intern(_fresh("ab")) is a
+    c = _fresh("cd")
+    assert intern(c) is c
+    assert intern(_fresh("cd")) is not c
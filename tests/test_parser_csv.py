@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import csv
+import io
+from pathlib import Path
+
+import pytest
+
+try:
+    import openpyxl
+except ImportError:  # pragma: no cover - dependency should be installed in runtime
+    openpyxl = None
+
+from zephyr_xml_importer.services.csv_parser import (
+    iter_test_cases_csv,
+    parse_csv_folders_and_duplicate_key_counts,
+)
+from zephyr_xml_importer.services.filters import build_case_filter
+from zephyr_xml_importer.services.importer import dry_run_import, preflight_export
+from zephyr_xml_importer.services.xlsx_parser import iter_test_cases_xlsx
+
+ROWS = [
+    [
+        "Key",
+        "Name",
+        "Status",
+        "Folder",
+        "Folder Description",
+        "Labels",
+        "Coverage (Issues)",
+        "Test Script (Step-by-Step) - Step",
+        "Test Script (Step-by-Step) - Expected Result",
+        "Test Script (Plain Text)",
+    ],
+    ["ES-T1", "Login works", "Approved", "ui", "", "smoke; ui", "ES-1", "Open", "Opens", ""],
+    ["", "", "", "", "UI checks", "", "", "Submit\nform", "Dashboard, then logout", ""],
+    ["", "", "", "", "", "", "", "", "", ""],
+    ["ES-T2", "Plain case", "Draft", "api", "", "", "", "", "", "Scenario text"],
+    ["ES-T1", "Login again", "Draft", "ui/forms", "", "", "", "", "", "Text"],
+]
+
+
+def _write_csv(path: Path, delimiter: str = ",") -> None:
+    with open(path, "w", encoding="utf-8-sig", newline="") as handle:
+        csv.writer(handle, delimiter=delimiter).writerows(ROWS)
+
+
+def test_iter_test_cases_csv_matches_xlsx(tmp_path: Path) -> None:
+    csv_path = tmp_path / "export.csv"
+    _write_csv(csv_path)
+
+    cases = list(iter_test_cases_csv(csv_path))
+    assert [case.key for case in cases] == ["ES-T1", "ES-T2", "ES-T1"]
+    first = cases[0]
+    assert first.folder_description == "UI checks"
+    assert first.labels == ["smoke", "ui"]
+    assert [step.description for step in first.steps] == ["Open", "Submit\nform"]
+    assert first.steps[1].expected_result == "Dashboard, then logout"
+    assert cases[1].test_script_type == "plain"
+
+    text = csv_path.read_text(encoding="utf-8-sig")
+    assert list(iter_test_cases_csv(io.StringIO(text))) == cases
+    stream = io.BytesIO(csv_path.read_bytes())
+    assert list(iter_test_cases_csv(stream)) == cases
+    assert not stream.closed
+
+    if openpyxl is not None:
+        xlsx_path = tmp_path / "export.xlsx"
+        wb = openpyxl.Workbook()
+        for row in ROWS:
+            wb.active.append([value or None for value in row])
+        wb.save(xlsx_path)
+        wb.close()
+        assert list(iter_test_cases_xlsx(xlsx_path)) == cases
+
+    folders, counts = parse_csv_folders_and_duplicate_key_counts(
+        csv_path.read_bytes(), case_filter=build_case_filter(folder_prefix="ui")
+    )
+    assert sorted(folders) == ["ui", "ui/forms"]
+    assert counts == {"ES-T1": 2}
+
+
+@pytest.mark.parametrize("delimiter", [";", "\t"])
+def test_iter_test_cases_csv_sniffs_the_delimiter(tmp_path: Path, delimiter: str) -> None:
+    comma_path = tmp_path / "comma.csv"
+    _write_csv(comma_path)
+    csv_path = tmp_path / "export.csv"
+    _write_csv(csv_path, delimiter)
+
+    assert list(iter_test_cases_csv(csv_path)) == list(iter_test_cases_csv(comma_path))
+    assert parse_csv_folders_and_duplicate_key_counts(
+        csv_path
+    ) == parse_csv_folders_and_duplicate_key_counts(comma_path)
+
+
+@pytest.mark.parametrize("single_pass", [False, True])
+def test_csv_export_dry_run(tmp_path: Path, single_pass: bool) -> None:
+    csv_path = tmp_path / "export.csv"
+    _write_csv(csv_path)
+
+    result = dry_run_import(csv_path, single_pass=single_pass)
+    assert result.summary.cases == 3
+    assert result.summary.folders == 3
+    assert result.summary.steps == 2
+    assert "Duplicate Zephyr key in XML: ES-T1" in result.warnings
+    assert preflight_export(csv_path).cases == 3
+
+
+def test_csv_unknown_columns_are_never_read(tmp_path: Path) -> None:
+    path = tmp_path / "custom.csv"
+    with open(path, "w", encoding="utf-8", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["Custom A", "Key", "Name", "Folder", "Custom Field"])
+        writer.writerow(["before", "K-1", "Case one", "", "some custom value"])
+        writer.writerow(["before", "K-2", "Case two", "api", "other value", "overflow"])
+
+    cases = list(iter_test_cases_csv(path))
+
+    assert [(tc.key, tc.folder) for tc in cases] == [("K-1", None), ("K-2", "api")]
+    assert all(tc.steps == [] and tc.objective is None and tc.labels == [] for tc in cases)
+    folders, _ = parse_csv_folders_and_duplicate_key_counts(path)
+    assert sorted(folders) == ["api"]
@@ -0,0 +1,82 @@
+from pathlib import Path
+
+import pytest
+
+from zephyr_xml_importer.services import parser
+from zephyr_xml_importer.services.parser import (
+    PARSER_ENGINE_DEFUSEDXML,
+    PARSER_ENGINE_LXML,
+    UnsafeXmlError,
+    count_export,
+    iter_test_cases,
+    parse_folders_and_duplicate_key_counts,
+    resolve_parser_engine,
+)
+
+FIXTURE = Path(__file__).parent / "fixtures" / "sample.xml"
+
+
+def test_resolve_parser_engine_falls_back_without_lxml(monkeypatch):
+    monkeypatch.setattr(parser, "LxmlET", None)
+
+    assert resolve_parser_engine() == PARSER_ENGINE_DEFUSEDXML
+    assert resolve_parser_engine("auto") == PARSER_ENGINE_DEFUSEDXML
+    with pytest.raises(RuntimeError):
+        resolve_parser_engine(PARSER_ENGINE_LXML)
+
+
+def test_resolve_parser_engine_rejects_unknown_engine():
+    with pytest.raises(ValueError):
+        resolve_parser_engine("sax")
+
+
+def test_engines_produce_identical_cases():
+    pytest.importorskip("lxml")
+    xml = FIXTURE.read_bytes().replace(
+        b"<name><![CDATA[Login works]]></name>",
+        b"<name>Login <!-- note --> works</name>",
+    )
+
+    expected = list(iter_test_cases(xml, engine=PARSER_ENGINE_DEFUSEDXML))
+    actual = list(iter_test_cases(xml, engine=PARSER_ENGINE_LXML))
+
+    assert actual == expected
+    assert parse_folders_and_duplicate_key_counts(
+        xml, engine=PARSER_ENGINE_LXML
+    ) == parse_folders_and_duplicate_key_counts(xml, engine=PARSER_ENGINE_DEFUSEDXML)
+
+
+def test_lxml_engine_rejects_entity_declarations():
+    pytest.importorskip("lxml")
+    xml = b"""<?xml version="1.0"?>
+<!DOCTYPE project [<!ENTITY boom "boom">]>
+<project><testCases><testCase key="K-1"><name>&boom;</name></testCase></testCases></project>"""
+
+    with pytest.raises(UnsafeXmlError):
+        list(iter_test_cases(xml, engine=PARSER_ENGINE_LXML))
+
+
+@pytest.mark.parametrize(
+    "doctype",
+    [
+        b"<!DOCTYPE project>",
+        b"<!DOCTYPE project [<!ELEMENT project ANY>]>",
+        b'<!DOCTYPE project SYSTEM "http://example.com/zephyr.dtd">',
+    ],
+)
+def test_engines_accept_doctypes_without_entities(doctype):
+    pytest.importorskip("lxml")
+    xml = FIXTURE.read_bytes()
+    prolog_end = xml.index(b"?>") + 2 if xml.startswith(b"<?xml") else 0
+    xml = xml[:prolog_end] + doctype + xml[prolog_end:]
+
+    expected = list(iter_test_cases(xml, engine=PARSER_ENGINE_DEFUSEDXML))
+
+    assert expected
+    assert list(iter_test_cases(xml, engine=PARSER_ENGINE_LXML)) == expected
+    assert parse_folders_and_duplicate_key_counts(
+        xml, engine=PARSER_ENGINE_LXML
+    ) == parse_folders_and_duplicate_key_counts(xml, engine=PARSER_ENGINE_DEFUSEDXML)
+    assert count_export(xml, engine=PARSER_ENGINE_LXML) == count_export(
+        xml, engine=PARSER_ENGINE_DEFUSEDXML
+    )
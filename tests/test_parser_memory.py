@@ -0,0 +1,84 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+CASES = 500_000
+# Growth of peak RSS over a warmed-up baseline. Without pruning, the cleared
+# `<testCase>` shells left on the tree cost well over 40 MiB at this size. Keys repeat
+# every 1000 cases, so the duplicate-key counts stay small.
+PEAK_RSS_GROWTH_CEILING_MIB = 16
+
+_PROBE = """
+import resource
+import sys
+
+from zephyr_xml_importer.services.parser import (
+    iter_test_cases,
+    parse_folders_and_duplicate_key_counts,
+)
+
+
+class SyntheticExport:
+    # Produces the export lazily so the probe itself stays small.
+    def __init__(self, cases):
+        self._chunks = self._generate(cases)
+        self._buffer = b""
+
+    def _generate(self, cases):
+        yield b'<project><folders><folder fullPath="root" index="1" /></folders><testCases>'
+        case = '<testCase id="{0}" key="MEM-T{1}"><name>Case {0}</name><folder>root</folder></testCase>'
+        for start in range(0, cases, 1000):
+            end = min(cases, start + 1000)
+            yield "".join(case.format(i, i % 1000) for i in range(start, end)).encode("utf-8")
+        yield b"</testCases></project>"
+
+    def read(self, size=-1):
+        while size < 0 or len(self._buffer) < size:
+            try:
+                self._buffer += next(self._chunks)
+            except StopIteration:
+                break
+        if size < 0:
+            size = len(self._buffer)
+        chunk, self._buffer = self._buffer[:size], self._buffer[size:]
+        return chunk
+
+
+def count_cases(cases):
+    if sys.argv[3] == "parse_folders_and_duplicate_key_counts":
+        _, counts = parse_folders_and_duplicate_key_counts(SyntheticExport(cases), engine=engine)
+        return sum(counts.values())
+    return sum(1 for _ in iter_test_cases(SyntheticExport(cases), engine=engine))
+
+
+engine = sys.argv[2]
+count_cases(1000)
+baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+count = count_cases(int(sys.argv[1]))
+peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(count, peak - baseline)
+"""
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="ru_maxrss is reported in KiB on Linux")
+@pytest.mark.parametrize("engine", ["defusedxml", "lxml"])
+@pytest.mark.parametrize("reader", ["iter_test_cases", "parse_folders_and_duplicate_key_counts"])
+def test_parser_peak_rss_is_bounded(tmp_path: Path, engine: str, reader: str) -> None:
+    if engine == "lxml":
+        pytest.importorskip("lxml")
+    probe = tmp_path / "probe.py"
+    probe.write_text(_PROBE, encoding="utf-8")
+
+    completed = subprocess.run(
+        [sys.executable, str(probe), str(CASES), engine, reader],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(__file__).resolve().parents[1],
+    )
+    count, growth_kib = (int(value) for value in completed.stdout.split())
+
+    assert count == CASES
+    assert growth_kib / 1024 < PEAK_RSS_GROWTH_CEILING_MIB
@@ -0,0 +1,95 @@
+from pathlib import Path
+
+import pytest
+
+from zephyr_xml_importer.services import parser
+from zephyr_xml_importer.services.parser import (
+    iter_test_case_ranges,
+    iter_test_cases,
+    iter_test_cases_parallel,
+)
+
+FIXTURE = Path(__file__).parent / "fixtures" / "sample.xml"
+
+XML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<project>
+  <folders><folder fullPath="a" index="1"/></folders>
+  <testCases>
+    <testCase key="K-1">
+      <objective><![CDATA[<testCase key="fake"></testCase>]]></objective>
+      <!-- <testCase key="commented"> -->
+    </testCase>
+    <testCase key='K-2' note="a>b"/>
+    <testCase
+      key="K-3"><name>\xc3\xa9t\xc3\xa9</name><other><testCase key="nested"/></other></testCase >
+  </testCases>
+  <folders><folder fullPath="late"/></folders>
+</project>"""
+
+
+def test_iter_test_case_ranges_finds_outermost_cases():
+    ranges = list(iter_test_case_ranges(XML))
+
+    assert [XML[start:end].split(b"key=")[1][:5] for start, end in ranges] == [
+        b'"K-1"',
+        b"'K-2'",
+        b'"K-3"',
+    ]
+    assert all(XML[start:end].rstrip().endswith(b">") for start, end in ranges)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parallel_parse_matches_sequential(workers):
+    expected_folders: dict = {}
+    expected = list(iter_test_cases(XML, folders=expected_folders))
+
+    folders: dict = {}
+    actual = list(iter_test_cases_parallel(XML, folders=folders, workers=workers))
+
+    assert actual == expected
+    assert [tc.key for tc in actual] == ["K-1", "K-2", "K-3"]
+    assert folders == expected_folders
+    assert list(iter_test_cases_parallel(FIXTURE, workers=workers)) == list(
+        iter_test_cases(FIXTURE)
+    )
+
+
+UNSCANNABLE = {
+    "utf16": (
+        '<?xml version="1.0" encoding="UTF-16"?><project>'
+        '<folders><folder fullPath="a" index="1"/></folders><testCases>'
+        '<testCase key="K-1"><name>One</name><folder>a</folder></testCase>'
+        "</testCases></project>"
+    ).encode("utf-16"),
+    "namespace": (
+        b'<project xmlns="urn:zephyr"><testCases>'
+        b'<testCase key="K-1"><name>One</name></testCase></testCases></project>'
+    ),
+    "nested": (
+        b'<project><folders><folder fullPath="a" index="1"/></folders><testCases>'
+        b'<testCase key="K-1"><name>Outer</name><testCase key="K-2"><name>Inner</name>'
+        b"</testCase></testCase></testCases></project>"
+    ),
+}
+
+
+@pytest.mark.parametrize("name", sorted(UNSCANNABLE))
+@pytest.mark.parametrize("with_folders", [True, False])
+def test_parallel_parse_matches_sequential_on_unusual_exports(tmp_path, name, with_folders):
+    path = tmp_path / "export.xml"
+    path.write_bytes(UNSCANNABLE[name])
+    expected_folders: dict | None = {} if with_folders else None
+    expected = list(iter_test_cases(path, folders=expected_folders))
+
+    folders: dict | None = {} if with_folders else None
+    actual = list(iter_test_cases_parallel(path, folders=folders, workers=2))
+
+    assert actual == expected
+    assert folders == expected_folders
+
+
+def test_parallel_parse_refuses_cases_the_byte_index_missed(monkeypatch):
+    monkeypatch.setattr(parser, "iter_test_case_ranges", lambda buffer: iter(()))
+
+    with pytest.raises(ValueError, match="byte index missed"):
+        list(iter_test_cases_parallel(XML, workers=1))
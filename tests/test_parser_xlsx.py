@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import re
+import zipfile
+from datetime import date, datetime, timedelta
 from pathlib import Path
 
 import pytest
@@ -9,7 +12,27 @@ try:
 except Exception:  # pragma: no cover - dependency should be installed in runtime
     openpyxl = None
 
-from zephyr_xml_importer.services.xlsx_parser import build_folders_from_cases, iter_test_cases_xlsx
+from zephyr_xml_importer.services.filters import build_case_filter
+from zephyr_xml_importer.services.validation import build_duplicate_key_counts
+from zephyr_xml_importer.services.xlsx_parser import (
+    _iter_sheet_rows,
+    _read_sheet_layout,
+    _UnsupportedWorkbook,
+    build_folders_from_cases,
+    iter_test_cases_xlsx,
+    iter_test_cases_xlsx_parallel,
+    parse_xlsx_folders_and_duplicate_key_counts,
+    xlsx_worksheet_count,
+)
+
+
+def _openpyxl_rows(path: Path) -> list[tuple]:
+    wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    ws = wb.active
+    ws.reset_dimensions()
+    rows = [tuple(row) for row in ws.iter_rows(values_only=True)]
+    wb.close()
+    return rows
 
 
 @pytest.mark.skipif(openpyxl is None, reason="openpyxl is required for XLSX parsing")
@@ -127,3 +150,216 @@ def test_iter_test_cases_xlsx(tmp_path: Path) -> None:
     folders = build_folders_from_cases(cases)
     assert "/ui/Login" in folders
     assert folders["/ui/Login"].description == "Login form checks"
+
+
+@pytest.mark.skipif(openpyxl is None, reason="openpyxl is required for XLSX parsing")
+def test_iter_test_cases_xlsx_ignores_stale_sheet_dimension(tmp_path: Path) -> None:
+    saved = tmp_path / "saved.xlsx"
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.append(["Key", "Name", "Test Script (Step-by-Step) - Step"])
+    for idx in range(3):
+        ws.append([f"ES-T{idx}", f"Case {idx}", "Open page"])
+        ws.append([None, None, "Submit form"])
+    wb.save(saved)
+    wb.close()
+
+    # Some exporters declare a dimension smaller than the data actually written.
+    workbook_path = tmp_path / "export.xlsx"
+    with zipfile.ZipFile(saved) as source, zipfile.ZipFile(workbook_path, "w") as target:
+        for item in source.infolist():
+            data = source.read(item.filename)
+            if item.filename == "xl/worksheets/sheet1.xml":
+                data = re.sub(rb'<dimension ref="[^"]*"', b'<dimension ref="A1:C2"', data)
+            target.writestr(item, data)
+
+    cases = list(iter_test_cases_xlsx(workbook_path))
+    assert [case.key for case in cases] == ["ES-T0", "ES-T1", "ES-T2"]
+    assert all(len(case.steps) == 2 for case in cases)
+
+
+@pytest.mark.skipif(openpyxl is None, reason="openpyxl is required for XLSX parsing")
+def test_native_xlsx_rows_match_openpyxl(tmp_path: Path) -> None:
+    workbook_path = tmp_path / "export.xlsx"
+    wb = openpyxl.Workbook()
+    wb.active.append(["not", "the", "active", "sheet"])
+    ws = wb.create_sheet("cases")
+    ws.append(["Key", "Name", None, "Count", "Ratio", "Flag", "Updated", "Spent"])
+    ws.append(["ES-T1", "  padded  ", None, 3, 0.25, True, datetime(2024, 3, 1, 12, 30), None])
+    ws.cell(row=5, column=2, value="after a gap")
+    ws.cell(row=6, column=8, value=timedelta(hours=30)).number_format = "[h]:mm:ss"
+    ws.cell(row=7, column=7, value=date(1999, 12, 31))
+    ws.cell(row=8, column=1, value="=1+1")
+    wb.active = 1
+    wb.save(workbook_path)
+    wb.close()
+
+    rows = [tuple(row) for row in _iter_sheet_rows(workbook_path)]
+    assert rows == _openpyxl_rows(workbook_path)
+    assert rows[1][:2] == ("ES-T1", "  padded  ")
+    assert rows[2] == ()
+
+
+@pytest.mark.skipif(openpyxl is None, reason="openpyxl is required for XLSX parsing")
+def test_iter_test_cases_xlsx_falls_back_to_openpyxl(tmp_path: Path) -> None:
+    saved = tmp_path / "saved.xlsx"
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.append(["Key", "Name", "Test Script (Step-by-Step) - Step"])
+    ws.append(["ES-T1", "Case 1", "Open page"])
+    ws.append([None, None, "Submit form"])
+    wb.save(saved)
+    wb.close()
+
+    # Some writers declare the workbook part through the default XML content type only.
+    workbook_path = tmp_path / "export.xlsx"
+    main_type = b"application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"
+    with zipfile.ZipFile(saved) as source, zipfile.ZipFile(workbook_path, "w") as target:
+        for item in source.infolist():
+            data = source.read(item.filename)
+            if item.filename == "[Content_Types].xml":
+                data = re.sub(rb'<Override PartName="/xl/workbook.xml"[^>]*/>', b"", data)
+                data = data.replace(
+                    b'ContentType="application/xml"', b'ContentType="' + main_type + b'"'
+                )
+            target.writestr(item, data)
+
+    with zipfile.ZipFile(workbook_path) as archive, pytest.raises(_UnsupportedWorkbook):
+        _read_sheet_layout(archive)
+    cases = list(iter_test_cases_xlsx(workbook_path))
+    assert [case.key for case in cases] == ["ES-T1"]
+    assert [step.description for step in cases[0].steps] == ["Open page", "Submit form"]
+
+
+@pytest.mark.skipif(openpyxl is None, reason="openpyxl is required for XLSX parsing")
+def test_xlsx_first_pass_matches_built_cases(tmp_path: Path) -> None:
+    workbook_path = tmp_path / "export.xlsx"
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.append(["Key", "Name", "Folder", "Folder Description", "Test Script (Step-by-Step) - Step"])
+    ws.append(["ES-T1", "One", "ui", None, "Open"])
+    ws.append([None, None, None, "UI checks", "Submit"])
+    ws.append(["ES-T2", "Two", None, None, "Open"])
+    ws.append([None, None, "api/auth", None, None])
+    ws.append(["ES-T1", "One again", "ui", "ignored", None])
+    ws.append(["ES-T3", "Three", "api", None, None])
+    wb.save(workbook_path)
+    wb.close()
+
+    for case_filter in (
+        None,
+        build_case_filter(folder_prefix="ui"),
+        build_case_filter(keys=["ES-T2"]),
+    ):
+        folders: dict = {}
+        cases = list(iter_test_cases_xlsx(workbook_path, folders=folders, case_filter=case_filter))
+        expected = (build_folders_from_cases(cases), build_duplicate_key_counts(cases))
+        assert folders == expected[0]
+        assert (
+            parse_xlsx_folders_and_duplicate_key_counts(workbook_path, case_filter=case_filter)
+            == expected
+        )
+
+    folders, counts = parse_xlsx_folders_and_duplicate_key_counts(workbook_path)
+    assert folders["ui"].description == "UI checks"
+    assert sorted(folders) == ["api", "api/auth", "ui"]
+    assert counts == {"ES-T1": 2, "ES-T2": 1, "ES-T3": 1}
+
+
+@pytest.mark.skipif(openpyxl is None, reason="openpyxl is required for XLSX parsing")
+def test_xlsx_label_tokens_cached_per_cell_text(tmp_path: Path) -> None:
+    workbook_path = tmp_path / "export.xlsx"
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.append(["Labels", "Key", "Coverage (Issues)"])
+    ws.append(["smoke; ui", "ES-T1", "ES-1"])
+    ws.append(["smoke; ui", "ES-T2", None])
+    ws.append([None, None, "ES-2, ES-1"])
+    ws.append([1, "ES-T3"])
+    ws.append([True, "ES-T4"])
+    ws.append([1.5, "ES-T5"])
+    wb.save(workbook_path)
+    wb.close()
+
+    cases = list(iter_test_cases_xlsx(workbook_path))
+    assert [case.labels for case in cases] == [
+        ["smoke", "ui"],
+        ["smoke", "ui"],
+        ["1"],
+        ["True"],
+        ["1.5"],
+    ]
+    assert cases[0].labels[0] is cases[1].labels[0]
+    assert [[issue.key for issue in case.issues] for case in cases[:2]] == [
+        ["ES-1"],
+        ["ES-2", "ES-1"],
+    ]
+
+
+@pytest.mark.skipif(openpyxl is None, reason="openpyxl is required for XLSX parsing")
+def test_xlsx_sheets_merge_in_workbook_order(tmp_path: Path) -> None:
+    paths = []
+    for book in range(2):
+        wb = openpyxl.Workbook()
+        wb.remove(wb.active)
+        for sheet in range(2):
+            ws = wb.create_sheet(f"part{sheet}")
+            ws.append(["Key", "Name", "Folder", "Test Script (Step-by-Step) - Step"])
+            ws.append([f"ES-T{book}{sheet}", "Case", f"book{book}/sheet{sheet}", "Open"])
+            ws.append([None, None, None, "Submit"])
+        wb.create_chartsheet("chart")
+        wb.active = 1
+        path = tmp_path / f"export{book}.xlsx"
+        wb.save(path)
+        wb.close()
+        paths.append(path)
+
+    assert xlsx_worksheet_count(paths[0]) == 2
+    assert [case.key for case in iter_test_cases_xlsx(paths[0], sheet=0)] == ["ES-T00"]
+    assert [case.key for case in iter_test_cases_xlsx_parallel(paths, workers=1)] == [
+        "ES-T01",
+        "ES-T11",
+    ]
+
+    sequential_folders: dict = {}
+    sequential = list(
+        iter_test_cases_xlsx_parallel(paths, all_sheets=True, folders=sequential_folders, workers=1)
+    )
+    assert [case.key for case in sequential] == ["ES-T00", "ES-T01", "ES-T10", "ES-T11"]
+    assert all(len(case.steps) == 2 for case in sequential)
+
+    parallel_folders: dict = {}
+    parallel = list(
+        iter_test_cases_xlsx_parallel(
+            [paths[0], paths[1].read_bytes()],
+            all_sheets=True,
+            folders=parallel_folders,
+            workers=2,
+            case_filter=build_case_filter(folder_prefix="book1"),
+        )
+    )
+    assert parallel == [case for case in sequential if case.folder.startswith("book1")]
+    assert sorted(parallel_folders) == ["book1/sheet0", "book1/sheet1"]
+    assert sequential_folders == build_folders_from_cases(sequential)
+
+
+@pytest.mark.skipif(openpyxl is None, reason="openpyxl is required for XLSX parsing")
+def test_xlsx_unknown_columns_are_never_read(tmp_path: Path) -> None:
+    workbook_path = tmp_path / "custom.xlsx"
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.append(["Custom A", "Key", "Name", "Custom Field", "Custom B"])
+    ws.append(["before", "K-1", "Case one", "some custom value", "after"])
+    ws.append(["before", "K-2", "Case two"])
+    wb.save(workbook_path)
+    wb.close()
+
+    cases = list(iter_test_cases_xlsx(workbook_path))
+
+    assert [(tc.key, tc.name) for tc in cases] == [("K-1", "Case one"), ("K-2", "Case two")]
+    for tc in cases:
+        assert (tc.folder, tc.objective, tc.precondition, tc.status) == (None, None, None, None)
+        assert (tc.priority, tc.owner, tc.labels, tc.issues, tc.steps) == (None, None, [], [], [])
+    folders, duplicate_key_counts = parse_xlsx_folders_and_duplicate_key_counts(workbook_path)
+    assert folders == {}
+    assert duplicate_key_counts == {"K-1": 1, "K-2": 1}
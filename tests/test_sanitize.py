@@ -1,4 +1,12 @@
-from zephyr_xml_importer.services.sanitize import sanitize_html
+import json
+import random
+from pathlib import Path
+
+from zephyr_xml_importer.services.sanitize import (
+    SanitizeCache,
+    _sanitize_html_by_rule,
+    sanitize_html,
+)
 
 
 def test_sanitize_br_and_paragraph():
@@ -15,3 +23,36 @@ def test_sanitize_table_cells():
 
 def test_sanitize_unescape_entities():
     assert sanitize_html("A&nbsp;B &amp; C") == "A B & C"
+
+
+def test_sanitize_matches_golden_corpus():
+    # Expected outputs were recorded from the rule-by-rule implementation.
+    corpus = json.loads((Path(__file__).parent / "fixtures" / "sanitize_golden.json").read_text())
+    assert [sanitize_html(item["input"]) for item in corpus] == [
+        item["expected"] for item in corpus
+    ]
+
+
+def test_sanitize_single_scan_matches_rule_by_rule():
+    pieces = ["<", ">", "/", "br", "P", "div", "li", "tr", "td", "th", " ", "\n", "\r"]
+    pieces += ["&amp;", "&nbsp;", "\u2060", "\xa0", "x", "<br/>", "</p>", "<LI>", "</td>"]
+    rng = random.Random(17)
+    for _ in range(5_000):
+        fragment = "".join(rng.choice(pieces) for _ in range(rng.randint(1, 12)))
+        assert sanitize_html(fragment) == _sanitize_html_by_rule(fragment), fragment
+
+
+def test_sanitize_cache_counts_hits_and_evicts_least_recent():
+    cache = SanitizeCache(2)
+    long_fragment = "<p>" + "x" * 500 + "</p>"
+    assert cache("<p>a</p>") == "a"
+    assert cache(long_fragment) == sanitize_html(long_fragment)
+    assert cache("<p>a</p>") == "a"
+    assert cache("") == "" and cache(None) == ""
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    # "a" was used last, so the long fragment is the one evicted.
+    cache("<b>c</b>")
+    cache("<p>a</p>")
+    cache(long_fragment)
+    assert (cache.hits, cache.misses) == (2, 4)
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from zephyr_xml_importer.services import testy_adapter
+from zephyr_xml_importer.services.importer import import_into_testy
+
+
+class FakeQuerySet:
+    def __init__(self, manager, rows):
+        self._manager = manager
+        self._rows = rows
+        self._fields = None
+
+    def order_by(self, *fields):
+        return self
+
+    def values_list(self, *fields):
+        self._fields = fields
+        return self
+
+    def iterator(self, chunk_size=None):
+        return iter(self._evaluate())
+
+    def __iter__(self):
+        return iter(self._evaluate())
+
+    def first(self):
+        rows = self._evaluate()
+        return rows[0] if rows else None
+
+    def _evaluate(self):
+        self._manager.queries.append(self._fields)
+        if self._fields is None:
+            return list(self._rows)
+        return [tuple(_field(row, name) for name in self._fields) for row in self._rows]
+
+
+def _field(row, name):
+    value = row
+    for part in name.split("__"):
+        value = value.get(part) if isinstance(value, dict) else getattr(value, part, None)
+    return value
+
+
+class FakeManager:
+    def __init__(self, queries):
+        self.queries = queries
+        self.rows = {}
+
+    def add(self, **fields):
+        row = SimpleNamespace(id=len(self.rows) + 1, **fields)
+        self.rows[row.id] = row
+        return row
+
+    def get(self, id):
+        self.queries.append(("get", id))
+        return self.rows[id]
+
+    def filter(self, project_id, **conditions):
+        rows = [row for row in self.rows.values() if row.project.id == project_id]
+        return FakeQuerySet(self, rows)
+
+
+def _fake_services(monkeypatch):
+    queries = []
+    models = {
+        name: SimpleNamespace(objects=FakeManager(queries))
+        for name in ("Project", "TestSuite", "TestCase")
+    }
+    models["Project"].objects.add(name="Demo")
+    suites, cases = models["TestSuite"].objects, models["TestCase"].objects
+
+    class TestSuiteService:
+        def suite_create(self, data):
+            return suites.add(**data)
+
+    class TestCaseService:
+        def case_with_steps_create(self, data):
+            return cases.add(**data)
+
+    class LabelService:
+        def set(self, labels, case, user):
+            case.labels = labels
+
+    services = {
+        "TestSuiteService": TestSuiteService,
+        "TestCaseService": TestCaseService,
+        "LabelService": LabelService,
+        "AttachmentService": object,
+    }
+    monkeypatch.setattr(testy_adapter, "_resolve_class", lambda name, modules: services[name])
+    monkeypatch.setattr(testy_adapter, "_resolve_model", lambda name, modules: models.get(name))
+    return queries, cases
+
+
+def _export(case_count: int) -> bytes:
+    cases = "".join(
+        f'<testCase id="{idx}" key="EX-{idx}"><name>Case {idx}</name>'
+        f"<folder>ui/forms</folder><labels><label>smoke</label></labels></testCase>"
+        for idx in range(case_count)
+    )
+    return (
+        '<project><folders><folder fullPath="ui/forms" index="1" /></folders>'
+        f"<testCases>{cases}</testCases></project>"
+    ).encode()
+
+
+def _record_cached_cases(adapter, cached_cases):
+    # Note how many cases the identity map holds whenever a case gets its labels.
+    set_labels = adapter.set_labels
+
+    def record(*args):
+        cached_cases.append(len(adapter._cases))
+        return set_labels(*args)
+
+    adapter.set_labels = record
+
+
+def test_service_adapter_queries_do_not_grow_with_cases(monkeypatch):
+    counts = []
+    for case_count in (1, 5):
+        queries, cases = _fake_services(monkeypatch)
+        adapter = testy_adapter.TestyServiceAdapter()
+        cached_cases = []
+        _record_cached_cases(adapter, cached_cases)
+
+        result = import_into_testy(_export(case_count), project_id=1, adapter=adapter)
+
+        assert result.summary.created == case_count
+        # Each case leaves the identity map once it is written.
+        assert cached_cases == [1] * case_count
+        assert all(case.labels == [{"name": "smoke"}] for case in cases.rows.values())
+        counts.append(len(queries))
+        assert adapter._cases == {}
+    # The suite tree, the existing Zephyr keys and the project, whatever the case count.
+    assert counts == [3, 3]
+
+
+class RecordingModel:
+    def __init__(self, **fields):
+        self.__dict__.update(fields)
+
+
+class RecordingManager:
+    def __init__(self):
+        self.created = []
+
+    def bulk_create(self, instances):
+        for instance in instances:
+            instance.id = len(self.created) + 1
+            self.created.append(instance)
+        return instances
+
+
+def test_bulk_case_insert_writes_only_model_fields(monkeypatch):
+    _fake_services(monkeypatch)
+    adapter = testy_adapter.TestyServiceAdapter()
+    adapter._case_model = type("TestCase", (RecordingModel,), {"objects": RecordingManager()})
+    adapter._step_model = type("TestCaseStep", (RecordingModel,), {"objects": RecordingManager()})
+    payload = {
+        "name": "Case",
+        "scenario": "Do it",
+        "is_steps": True,
+        "attributes": {"zephyr": {"key": "EX-1"}},
+        "labels": ["smoke"],
+        "estimate": None,
+        "steps": [{"name": "Step 1", "scenario": "Click", "comment": "extra"}],
+    }
+
+    assert adapter._bulk_create_cases(1, [(7, payload)]) == [1]
+
+    (case,) = adapter._case_model.objects.created
+    assert vars(case) == {
+        "project_id": 1,
+        "suite_id": 7,
+        "attributes": {"zephyr": {"key": "EX-1"}},
+        "name": "Case",
+        "setup": "",
+        "scenario": "Do it",
+        "expected": "",
+        "teardown": "",
+        "description": "",
+        "is_steps": True,
+        "id": 1,
+    }
+    (step,) = adapter._step_model.objects.created
+    assert vars(step) == {
+        "project_id": 1,
+        "test_case_id": 1,
+        "name": "Step 1",
+        "scenario": "Click",
+        "expected": "",
+        "sort_order": 0,
+        "id": 1,
+    }
@@ -1,10 +1,20 @@
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, BinaryIO, Mapping
 
+from ..services.filters import CaseFilter, build_case_filter
+
+try:
+    from django.conf import settings
+except ImportError:  # pragma: no cover - Django optional for unit tests
+    settings = None
+
 ON_DUPLICATE_CHOICES = {"skip", "upsert"}
+# Distinct HTML fragments one import may memoize; each holds its source and its text.
+MAX_SANITIZE_CACHE_SIZE = 100_000
 
 
 @dataclass(frozen=True, slots=True)
@@ -18,6 +28,13 @@ class ImportRequestData:
     append_jira_issues_to_description: bool
     embed_testdata_to_description: bool
     on_duplicate: str
+    single_pass: bool = False
+    parse_workers: int = 0
+    xlsx_all_sheets: bool = False
+    sanitize_cache_size: int = 0
+    map_workers: int = 0
+    bulk_batch_size: int = 0
+    case_filter: CaseFilter | None = None
 
 
 class ImportValidationError(ValueError):
@@ -49,6 +66,59 @@ def _coerce_bool(value: Any, *, default: bool, field: str, errors: dict[str, str
     return default
 
 
+def max_import_workers() -> int:
+    # ZEPHYR_IMPORT_MAX_WORKERS caps parse_workers and map_workers; unset or 0 means
+    # the number of CPUs.
+    configured = 0
+    if settings is not None:
+        try:
+            configured = int(getattr(settings, "ZEPHYR_IMPORT_MAX_WORKERS", 0) or 0)
+        except (TypeError, ValueError):
+            configured = 0
+    return configured if configured > 0 else os.cpu_count() or 1
+
+
+def _coerce_non_negative_int(
+    value: Any,
+    *,
+    default: int,
+    field: str,
+    errors: dict[str, str],
+    maximum: int | None = None,
+) -> int:
+    if value is None or value == "":
+        return default
+    if isinstance(value, int) and not isinstance(value, bool):
+        parsed = value
+    elif isinstance(value, str) and value.strip().isdigit():
+        parsed = int(value.strip())
+    else:
+        errors[field] = "must be a non-negative integer"
+        return default
+    if parsed < 0:
+        errors[field] = "must be a non-negative integer"
+        return default
+    if maximum is not None and parsed > maximum:
+        errors[field] = f"must be at most {maximum}"
+        return default
+    return parsed
+
+
+def _split_keys(value: Any) -> list[str]:
+    # Accept a list of keys or one comma/whitespace separated string.
+    if value is None:
+        return []
+    values = value if isinstance(value, (list, tuple)) else [value]
+    return [key for item in values for key in str(item).replace(",", " ").split()]
+
+
+def _optional_text(value: Any) -> str | None:
+    if value is None:
+        return None
+    text = str(value).strip()
+    return text or None
+
+
 def _is_file_source(value: Any) -> bool:
     if value is None:
         return False
@@ -59,6 +129,13 @@ def _is_file_source(value: Any) -> bool:
     return hasattr(value, "read")
 
 
+def validate_preflight_request(data: Mapping[str, Any]) -> str | Path | BinaryIO | bytes:
+    xml_file = _unwrap(data.get("xml_file"))
+    if not _is_file_source(xml_file):
+        raise ImportValidationError({"xml_file": "xml_file is required"})
+    return xml_file
+
+
 def validate_import_request(data: Mapping[str, Any]) -> ImportRequestData:
     errors: dict[str, str] = {}
 
@@ -115,6 +192,57 @@ def validate_import_request(data: Mapping[str, Any]) -> ImportRequestData:
         errors=errors,
     )
 
+    max_workers = max_import_workers()
+    single_pass = _coerce_bool(
+        _unwrap(data.get("single_pass")),
+        default=False,
+        field="single_pass",
+        errors=errors,
+    )
+    parse_workers = _coerce_non_negative_int(
+        _unwrap(data.get("parse_workers")),
+        default=0,
+        field="parse_workers",
+        errors=errors,
+        maximum=max_workers,
+    )
+    xlsx_all_sheets = _coerce_bool(
+        _unwrap(data.get("xlsx_all_sheets")),
+        default=False,
+        field="xlsx_all_sheets",
+        errors=errors,
+    )
+    sanitize_cache_size = _coerce_non_negative_int(
+        _unwrap(data.get("sanitize_cache_size")),
+        default=0,
+        field="sanitize_cache_size",
+        errors=errors,
+        maximum=MAX_SANITIZE_CACHE_SIZE,
+    )
+    map_workers = _coerce_non_negative_int(
+        _unwrap(data.get("map_workers")),
+        default=0,
+        field="map_workers",
+        errors=errors,
+        maximum=max_workers,
+    )
+    bulk_batch_size = _coerce_non_negative_int(
+        _unwrap(data.get("bulk_batch_size")),
+        default=0,
+        field="bulk_batch_size",
+        errors=errors,
+    )
+
+    case_filter: CaseFilter | None = None
+    try:
+        case_filter = build_case_filter(
+            folder_prefix=_optional_text(_unwrap(data.get("folder_prefix"))),
+            keys=_split_keys(data.get("zephyr_keys")),
+            updated_since=_optional_text(_unwrap(data.get("updated_since"))),
+        )
+    except ValueError:
+        errors["updated_since"] = "updated_since must be an ISO 8601 date or timestamp"
+
     on_duplicate_raw = _unwrap(data.get("on_duplicate", "skip"))
     on_duplicate = str(on_duplicate_raw).strip().lower() if on_duplicate_raw is not None else "skip"
     if on_duplicate not in ON_DUPLICATE_CHOICES:
@@ -133,6 +261,13 @@ def validate_import_request(data: Mapping[str, Any]) -> ImportRequestData:
         append_jira_issues_to_description=append_jira_issues_to_description,
         embed_testdata_to_description=embed_testdata_to_description,
         on_duplicate=on_duplicate,
+        single_pass=single_pass,
+        parse_workers=parse_workers,
+        xlsx_all_sheets=xlsx_all_sheets,
+        sanitize_cache_size=sanitize_cache_size,
+        map_workers=map_workers,
+        bulk_batch_size=bulk_batch_size,
+        case_filter=case_filter,
     )
 
 
@@ -157,3 +292,17 @@ if serializers:  # pragma: no cover - DRF optional for unit tests
             default="skip",
             choices=sorted(ON_DUPLICATE_CHOICES),
         )
+        single_pass = serializers.BooleanField(required=False, default=False)
+        parse_workers = serializers.IntegerField(required=False, default=0, min_value=0)
+        xlsx_all_sheets = serializers.BooleanField(required=False, default=False)
+        sanitize_cache_size = serializers.IntegerField(
+            required=False, default=0, min_value=0, max_value=MAX_SANITIZE_CACHE_SIZE
+        )
+        map_workers = serializers.IntegerField(required=False, default=0, min_value=0)
+        bulk_batch_size = serializers.IntegerField(required=False, default=0, min_value=0)
+        folder_prefix = serializers.CharField(required=False, allow_blank=True, allow_null=True)
+        zephyr_keys = serializers.CharField(required=False, allow_blank=True, allow_null=True)
+        updated_since = serializers.CharField(required=False, allow_blank=True, allow_null=True)
+
+    class PreflightRequestSerializer(serializers.Serializer):
+        xml_file = serializers.FileField()
@@ -3,7 +3,7 @@ from __future__ import annotations
 try:
     from django.urls import path
 
-    from .views import HealthView, ImportView
+    from .views import HealthView, ImportView, PreflightView
 except Exception:  # pragma: no cover - Django optional for unit tests
     path = None
     ImportView = None
@@ -11,6 +11,7 @@ except Exception:  # pragma: no cover - Django optional for unit tests
 if path and ImportView:
     urlpatterns = [
         path("import/", ImportView.as_view(), name="import"),
+        path("preflight/", PreflightView.as_view(), name="preflight"),
         path("health/", HealthView.as_view(), name="health"),
     ]
 else:  # pragma: no cover
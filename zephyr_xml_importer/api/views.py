@@ -1,12 +1,25 @@
 from __future__ import annotations
 
-from typing import Any, Mapping
+from pathlib import Path
+from typing import Any, BinaryIO, Mapping
+from zipfile import BadZipFile
 
-from .permissions import IsAdminForZephyrImport
-from .serializers import ImportRequestData, ImportValidationError, validate_import_request
 from .. import __version__
-from ..services.importer import DryRunImportResult, dry_run_import, import_into_testy
+from ..services.filters import CaseFilter
+from ..services.importer import (
+    DryRunImportResult,
+    dry_run_import,
+    import_into_testy,
+    preflight_export,
+)
 from ..services.testy_adapter import TestyAdapterError, load_project_choices
+from .permissions import IsAdminForZephyrImport
+from .serializers import (
+    ImportRequestData,
+    ImportValidationError,
+    validate_import_request,
+    validate_preflight_request,
+)
 
 try:
     from django.shortcuts import render
@@ -14,10 +27,15 @@ except Exception:  # pragma: no cover - Django optional for unit tests
     render = None
 
 try:
-    from rest_framework.response import Response
-    from rest_framework.views import APIView
+    from django.conf import settings
+except ImportError:  # pragma: no cover - Django optional for unit tests
+    settings = None
+
+try:
     from rest_framework import status as drf_status
     from rest_framework.exceptions import ValidationError as DrfValidationError
+    from rest_framework.response import Response
+    from rest_framework.views import APIView
 except Exception:  # pragma: no cover - DRF optional for unit tests
     Response = None
     APIView = object
@@ -25,9 +43,17 @@ except Exception:  # pragma: no cover - DRF optional for unit tests
     DrfValidationError = None
 
 try:
-    from .serializers import ImportRequestSerializer
+    from .serializers import ImportRequestSerializer, PreflightRequestSerializer
 except Exception:  # pragma: no cover
     ImportRequestSerializer = None
+    PreflightRequestSerializer = None
+
+# What reading a broken export raises: XML syntax errors, unreadable uploads and
+# damaged xlsx archives.
+_EXPORT_READ_ERRORS = (ValueError, SyntaxError, OSError, BadZipFile)
+_DRF_VALIDATION_ERRORS: tuple[type[Exception], ...] = (
+    (DrfValidationError,) if DrfValidationError is not None else ()
+)
 
 
 def _normalize_value(value: Any) -> Any:
@@ -95,42 +121,153 @@ def _error_response(errors: Any, payload: Mapping[str, Any]) -> Any:
 
 
 def _build_response_from_result(result: DryRunImportResult, *, dry_run: bool) -> dict[str, Any]:
+    summary: dict[str, Any] = {
+        "folders": result.summary.folders,
+        "cases": result.summary.cases,
+        "steps": result.summary.steps,
+        "labels": result.summary.labels,
+        "attachments": result.summary.attachments,
+        "created": result.summary.created,
+        "reused": result.summary.reused,
+        "updated": result.summary.updated,
+        "skipped": result.summary.skipped,
+        "failed": result.summary.failed,
+    }
+    if result.summary.sanitize_cache_hits is not None:
+        summary["sanitize_cache_hits"] = result.summary.sanitize_cache_hits
+        summary["sanitize_cache_misses"] = result.summary.sanitize_cache_misses
+    if result.summary.bulk_fallbacks is not None:
+        summary["bulk_fallbacks"] = result.summary.bulk_fallbacks
     return {
         "status": "success",
         "dry_run": dry_run,
-        "summary": {
-            "folders": result.summary.folders,
-            "cases": result.summary.cases,
-            "steps": result.summary.steps,
-            "labels": result.summary.labels,
-            "attachments": result.summary.attachments,
-            "created": result.summary.created,
-            "reused": result.summary.reused,
-            "updated": result.summary.updated,
-            "skipped": result.summary.skipped,
-            "failed": result.summary.failed,
-        },
+        "summary": summary,
         "report_csv": result.report_csv,
         "warnings": result.warnings,
     }
 
 
+def _max_cases() -> int | None:
+    # ZEPHYR_IMPORT_MAX_CASES caps the test cases per upload; unset or 0 means no cap.
+    if settings is None:
+        return None
+    try:
+        value = int(getattr(settings, "ZEPHYR_IMPORT_MAX_CASES", 0) or 0)
+    except (TypeError, ValueError):
+        return None
+    return value if value > 0 else None
+
+
+def _export_index_dir() -> str | None:
+    # ZEPHYR_IMPORT_INDEX_DIR keeps sidecar indexes of XML uploads for filtered imports.
+    if settings is None:
+        return None
+    return getattr(settings, "ZEPHYR_IMPORT_INDEX_DIR", None) or None
+
+
+def _upload_path(source: Any) -> Any:
+    # Large uploads are spooled to disk by Django; the index needs that file.
+    temporary_file_path = getattr(source, "temporary_file_path", None)
+    return temporary_file_path() if callable(temporary_file_path) else source
+
+
+def _is_rewindable(source: Any) -> bool:
+    if isinstance(source, (str, Path, bytes, bytearray)):
+        return True
+    try:
+        return bool(source.seekable())
+    except (AttributeError, OSError, ValueError):
+        return False
+
+
+def build_preflight_payload(
+    xml_file: str | Path | BinaryIO | bytes, *, max_cases: int | None = None
+) -> dict[str, Any]:
+    counts = preflight_export(xml_file)
+    return {
+        "status": "success",
+        "counts": {
+            "folders": counts.folders,
+            "cases": counts.cases,
+            "steps": counts.steps,
+            "attachments": counts.attachments,
+        },
+        "max_cases": max_cases,
+        "within_limit": max_cases is None or counts.cases <= max_cases,
+    }
+
+
+def _case_limit_error(
+    xml_file: Any,
+    max_cases: int | None,
+    *,
+    xlsx_all_sheets: bool = False,
+    case_filter: CaseFilter | None = None,
+) -> str | None:
+    if max_cases is None:
+        return None
+    # The preflight reads the upload once more; an upload that cannot be rewound for
+    # the import itself is refused rather than imported unchecked.
+    if not _is_rewindable(xml_file):
+        return "The upload cannot be read twice, so its size cannot be checked"
+    try:
+        cases = preflight_export(
+            xml_file, xlsx_all_sheets=xlsx_all_sheets, case_filter=case_filter
+        ).cases
+    finally:
+        if not isinstance(xml_file, (str, Path, bytes, bytearray)):
+            xml_file.seek(0)
+    if cases > max_cases:
+        return f"Export has {cases} test cases; the limit is {max_cases}"
+    return None
+
+
 def build_import_response(
-    request_data: ImportRequestData, *, user: Any | None = None
+    request_data: ImportRequestData,
+    *,
+    user: Any | None = None,
+    max_cases: int | None = None,
 ) -> dict[str, Any]:
+    try:
+        limit_error = _case_limit_error(
+            request_data.xml_file,
+            max_cases,
+            xlsx_all_sheets=request_data.xlsx_all_sheets,
+            case_filter=request_data.case_filter,
+        )
+    except _EXPORT_READ_ERRORS as exc:
+        # The export itself is unreadable; the import would fail on it the same way.
+        limit_error = f"Could not read the export: {exc}"
+    if limit_error is not None:
+        return {
+            "status": "failed",
+            "dry_run": request_data.dry_run,
+            "errors": [limit_error],
+        }
+    xml_source = request_data.xml_file
+    export_index_dir = _export_index_dir() if request_data.case_filter is not None else None
+    if export_index_dir is not None:
+        xml_source = _upload_path(xml_source)
     try:
         if request_data.dry_run:
             result = dry_run_import(
-                request_data.xml_file,
+                xml_source,
                 attachments_zip=request_data.attachments_zip,
                 prefix_with_zephyr_key=request_data.prefix_with_zephyr_key,
                 meta_labels=request_data.meta_labels,
                 append_jira_issues_to_description=request_data.append_jira_issues_to_description,
                 embed_testdata_to_description=request_data.embed_testdata_to_description,
+                single_pass=request_data.single_pass,
+                parse_workers=request_data.parse_workers,
+                xlsx_all_sheets=request_data.xlsx_all_sheets,
+                sanitize_cache_size=request_data.sanitize_cache_size,
+                map_workers=request_data.map_workers,
+                case_filter=request_data.case_filter,
+                export_index_dir=export_index_dir,
             )
         else:
             result = import_into_testy(
-                request_data.xml_file,
+                xml_source,
                 project_id=request_data.project_id,
                 attachments_zip=request_data.attachments_zip,
                 prefix_with_zephyr_key=request_data.prefix_with_zephyr_key,
@@ -139,6 +276,14 @@ def build_import_response(
                 embed_testdata_to_description=request_data.embed_testdata_to_description,
                 on_duplicate=request_data.on_duplicate,
                 user=user,
+                single_pass=request_data.single_pass,
+                parse_workers=request_data.parse_workers,
+                xlsx_all_sheets=request_data.xlsx_all_sheets,
+                sanitize_cache_size=request_data.sanitize_cache_size,
+                map_workers=request_data.map_workers,
+                bulk_batch_size=request_data.bulk_batch_size,
+                case_filter=request_data.case_filter,
+                export_index_dir=export_index_dir,
             )
         return _build_response_from_result(result, dry_run=request_data.dry_run)
     except TestyAdapterError as exc:
@@ -163,7 +308,7 @@ def build_health_payload() -> dict[str, Any]:
 
 
 class ImportView(APIView):  # type: ignore[misc]
-    permission_classes = [IsAdminForZephyrImport]
+    permission_classes = (IsAdminForZephyrImport,)
 
     def get(self, request, *args, **kwargs):  # type: ignore[override]
         projects: list[Any] | None = None
@@ -201,7 +346,9 @@ class ImportView(APIView):  # type: ignore[misc]
                 return _error_response(exc.detail, payload)
             return _error_response({"detail": str(exc)}, payload)
 
-        response_data = build_import_response(request_data, user=getattr(request, "user", None))
+        response_data = build_import_response(
+            request_data, user=getattr(request, "user", None), max_cases=_max_cases()
+        )
         if Response is None:
             return response_data
         status_code = (
@@ -212,8 +359,32 @@ class ImportView(APIView):  # type: ignore[misc]
         return Response(response_data, status=status_code)
 
 
+class PreflightView(APIView):  # type: ignore[misc]
+    permission_classes = (IsAdminForZephyrImport,)
+
+    def post(self, request, *args, **kwargs):  # type: ignore[override]
+        payload = _extract_payload(request)
+        try:
+            if PreflightRequestSerializer is not None:
+                serializer = PreflightRequestSerializer(data=payload)
+                serializer.is_valid(raise_exception=True)
+                xml_file = validate_preflight_request(serializer.validated_data)
+            else:
+                xml_file = validate_preflight_request(payload)
+            response_data = build_preflight_payload(xml_file, max_cases=_max_cases())
+        except ImportValidationError as exc:
+            return _error_response(exc.errors, payload)
+        except _DRF_VALIDATION_ERRORS as exc:
+            return _error_response(exc.detail, payload)
+        except _EXPORT_READ_ERRORS as exc:
+            return _error_response({"detail": str(exc)}, payload)
+        if Response is None:
+            return response_data
+        return Response(response_data, status=drf_status.HTTP_200_OK)
+
+
 class HealthView(APIView):  # type: ignore[misc]
-    permission_classes = [IsAdminForZephyrImport]
+    permission_classes = (IsAdminForZephyrImport,)
 
     def get(self, request, *args, **kwargs):  # type: ignore[override]
         payload = build_health_payload()
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import csv
+import io
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
+from itertools import chain
+from pathlib import Path
+from typing import Any, BinaryIO, TextIO
+
+from .filters import CaseFilter
+from .models import ZephyrFolder, ZephyrTestCase
+from .xlsx_parser import (
+    iter_test_cases_from_rows,
+    parse_folders_and_duplicate_key_counts_from_rows,
+)
+
+# Spreadsheet tools often save UTF-8 CSV with a byte-order mark.
+CSV_ENCODING = "utf-8-sig"
+# Field separators spreadsheet tools write, depending on the locale.
+CSV_DELIMITERS = ",;\t"
+
+
+@contextmanager
+def _open_csv_text(source: str | Path | BinaryIO | TextIO | bytes) -> Iterator[TextIO]:
+    if isinstance(source, (str, Path)):
+        with open(source, encoding=CSV_ENCODING, newline="") as handle:
+            yield handle
+        return
+    if isinstance(source, (bytes, bytearray)):
+        yield io.StringIO(bytes(source).decode(CSV_ENCODING), newline="")
+        return
+    stream: Any = source
+    with suppress(AttributeError, OSError, ValueError):
+        if stream.seekable():
+            stream.seek(0)
+    if isinstance(stream, io.TextIOBase):
+        yield stream
+        return
+    text = io.TextIOWrapper(stream, encoding=CSV_ENCODING, newline="")
+    try:
+        yield text
+    finally:
+        # Hand the binary stream back open; the caller owns it.
+        text.detach()
+
+
+def _sniff_delimiter(header: str) -> str:
+    # Only the header row is sniffed: case texts are free-form and would blur the guess.
+    try:
+        return csv.Sniffer().sniff(header, delimiters=CSV_DELIMITERS).delimiter
+    except csv.Error:
+        return ","
+
+
+def _iter_csv_rows(handle: TextIO) -> Iterator[tuple[str | None, ...]]:
+    # Empty cells read as None, as they do in a worksheet, so blank rows are skipped.
+    header = handle.readline()
+    rows = csv.reader(chain((header,), handle), delimiter=_sniff_delimiter(header))
+    for row in rows:
+        yield tuple(value or None for value in row)
+
+
+def iter_test_cases_csv(
+    source: str | Path | BinaryIO | TextIO | bytes,
+    *,
+    folders: dict[str, ZephyrFolder] | None = None,
+    case_filter: CaseFilter | None = None,
+) -> Iterator[ZephyrTestCase]:
+    """
+    Yield the cases of a CSV export one at a time.
+
+    The columns and the row layout are those of the XLSX export (see
+    `iter_test_cases_xlsx`): a header row, then a row per step, with the case fields on
+    the first one. Fields are separated by commas, semicolons or tabs, whichever the
+    header row uses. Rows are decoded and read one by one, so memory does not grow with
+    the file. `folders` and `case_filter` work as for XLSX.
+    """
+    with _open_csv_text(source) as handle:
+        yield from iter_test_cases_from_rows(
+            _iter_csv_rows(handle), folders=folders, case_filter=case_filter
+        )
+
+
+def parse_csv_folders_and_duplicate_key_counts(
+    source: str | Path | BinaryIO | TextIO | bytes,
+    *,
+    case_filter: CaseFilter | None = None,
+) -> tuple[dict[str, ZephyrFolder], dict[str, int]]:
+    """
+    Collect the folders and per-key case counts of a CSV export without building
+    cases, like `parse_xlsx_folders_and_duplicate_key_counts`.
+    """
+    with _open_csv_text(source) as handle:
+        return parse_folders_and_duplicate_key_counts_from_rows(
+            _iter_csv_rows(handle), case_filter=case_filter
+        )
@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Self
+
+from .filters import CaseFilter
+from .models import ZephyrFolder, ZephyrTestCase
+from .parser import iter_test_case_spans, read_test_cases_at
+
+# Bump when the table layout changes; older index files are then rebuilt.
+INDEX_FORMAT_VERSION = 2
+INDEX_SUFFIX = ".zephyr-index"
+
+_SCHEMA = """
+CREATE TABLE meta (name TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE cases (
+    position INTEGER PRIMARY KEY,
+    zephyr_key TEXT,
+    zephyr_id TEXT,
+    folder TEXT,
+    updated_on TEXT,
+    start_offset INTEGER NOT NULL,
+    end_offset INTEGER NOT NULL
+);
+CREATE INDEX cases_by_key ON cases (zephyr_key);
+CREATE INDEX cases_by_id ON cases (zephyr_id);
+CREATE INDEX cases_by_folder ON cases (folder);
+CREATE TABLE folders (
+    position INTEGER PRIMARY KEY,
+    full_path TEXT NOT NULL,
+    folder_index INTEGER
+);
+"""
+
+
+def export_content_hash(source: str | Path) -> str:
+    with open(source, "rb") as handle:
+        return hashlib.file_digest(handle, "sha256").hexdigest()
+
+
+class ExportIndex:
+    """
+    Random access to one Zephyr XML export through its sidecar index.
+
+    The index maps Zephyr key, id and folder to the byte range of each `<testCase>`, so
+    fetching a case parses just that range instead of scanning the export. Use
+    `open_export_index` to get one.
+    """
+
+    def __init__(
+        self,
+        source: Path,
+        connection: sqlite3.Connection,
+        *,
+        content_hash: str,
+        engine: str | None = None,
+    ) -> None:
+        self.source = source
+        self.content_hash = content_hash
+        self._connection = connection
+        self._engine = engine
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM cases").fetchone()[0]
+
+    def folders(self) -> dict[str, ZephyrFolder]:
+        rows = self._connection.execute(
+            "SELECT full_path, folder_index FROM folders ORDER BY position"
+        )
+        return {path: ZephyrFolder(full_path=path, index=index) for path, index in rows}
+
+    def get_test_case(
+        self,
+        *,
+        key: str | None = None,
+        zephyr_id: str | None = None,
+    ) -> ZephyrTestCase | None:
+        """
+        Return the case with this Zephyr key or id; with duplicates, the first one.
+        """
+        if (key is None) == (zephyr_id is None):
+            raise ValueError("Pass exactly one of key or zephyr_id")
+        column = "zephyr_key" if key is not None else "zephyr_id"
+        row = self._connection.execute(
+            f"SELECT start_offset, end_offset FROM cases WHERE {column} = ? ORDER BY position LIMIT 1",
+            (key if key is not None else zephyr_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        return next(read_test_cases_at(self.source, [row], engine=self._engine), None)
+
+    def iter_folder_test_cases(self, folder: str) -> Iterator[ZephyrTestCase]:
+        """
+        Yield the cases whose `<folder>` is `folder`, in document order.
+        """
+        ranges = self._connection.execute(
+            "SELECT start_offset, end_offset FROM cases WHERE folder = ? ORDER BY position",
+            (folder,),
+        ).fetchall()
+        yield from read_test_cases_at(self.source, ranges, engine=self._engine)
+
+    def select_ranges(
+        self, case_filter: CaseFilter | None = None
+    ) -> tuple[list[tuple[int, int]], dict[str, int]]:
+        """
+        Return the byte ranges of the cases `case_filter` keeps, in document order, and
+        how often each of their keys occurs, from the index alone; `read_test_cases`
+        then parses just those ranges.
+        """
+        query = "SELECT zephyr_key, folder, updated_on, start_offset, end_offset FROM cases"
+        params: tuple[str, ...] = ()
+        if case_filter is not None and case_filter.keys and case_filter.key_pattern is None:
+            params = tuple(sorted(case_filter.keys))
+            query += f" WHERE zephyr_key IN ({', '.join('?' * len(params))})"
+        ranges: list[tuple[int, int]] = []
+        duplicate_key_counts: dict[str, int] = {}
+        for key, folder, updated_on, start, end in self._connection.execute(
+            query + " ORDER BY position", params
+        ):
+            if case_filter is not None and not (
+                case_filter.match_key(key)
+                and case_filter.match_folder(folder)
+                and case_filter.match_updated(updated_on)
+            ):
+                continue
+            ranges.append((start, end))
+            if key:
+                duplicate_key_counts[key] = duplicate_key_counts.get(key, 0) + 1
+        return ranges, duplicate_key_counts
+
+    def read_test_cases(self, ranges: Iterable[tuple[int, int]]) -> Iterator[ZephyrTestCase]:
+        """Parse the cases at byte ranges from `select_ranges`, in the given order."""
+        yield from read_test_cases_at(self.source, ranges, engine=self._engine)
+
+
+def _read_meta(connection: sqlite3.Connection) -> dict[str, str]:
+    try:
+        return dict(connection.execute("SELECT name, value FROM meta"))
+    except sqlite3.DatabaseError:
+        return {}
+
+
+def _build_index_file(source: Path, target: Path, content_hash: str, engine: str | None) -> None:
+    # Build under a temporary name and move it into place, so readers never see a
+    # half-written index and concurrent builders simply race to the same result.
+    with NamedTemporaryFile(dir=target.parent, suffix=INDEX_SUFFIX, delete=False) as tmp:
+        tmp_path = Path(tmp.name)
+    try:
+        connection = sqlite3.connect(tmp_path)
+        try:
+            connection.executescript(_SCHEMA)
+            folders: dict[str, ZephyrFolder] = {}
+            connection.executemany(
+                "INSERT INTO cases "
+                "(zephyr_key, zephyr_id, folder, updated_on, start_offset, end_offset) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    (tc.key, tc.zephyr_id, tc.folder, tc.updated_on, start, end)
+                    for start, end, tc in iter_test_case_spans(
+                        source, folders=folders, engine=engine
+                    )
+                ),
+            )
+            connection.executemany(
+                "INSERT INTO folders (full_path, folder_index) VALUES (?, ?)",
+                ((folder.full_path, folder.index) for folder in folders.values()),
+            )
+            connection.executemany(
+                "INSERT INTO meta (name, value) VALUES (?, ?)",
+                [
+                    ("format_version", str(INDEX_FORMAT_VERSION)),
+                    ("content_hash", content_hash),
+                ],
+            )
+            connection.commit()
+        finally:
+            connection.close()
+        os.replace(tmp_path, target)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def open_export_index(
+    source: str | Path,
+    *,
+    index_dir: str | Path | None = None,
+    engine: str | None = None,
+) -> ExportIndex:
+    """
+    Open the sidecar index of an XML export, building it on first use.
+
+    Index files are named after the SHA-256 of the export content and live in
+    `index_dir` (the export's own directory by default), so an export is indexed once
+    however often it is re-uploaded or re-imported, and edited content gets a new index.
+    """
+    source = Path(source)
+    content_hash = export_content_hash(source)
+    directory = Path(index_dir) if index_dir is not None else source.parent
+    target = directory / f"{content_hash}{INDEX_SUFFIX}"
+
+    if target.exists():
+        connection = sqlite3.connect(target)
+        meta = _read_meta(connection)
+        if (
+            meta.get("format_version") == str(INDEX_FORMAT_VERSION)
+            and meta.get("content_hash") == content_hash
+        ):
+            return ExportIndex(source, connection, content_hash=content_hash, engine=engine)
+        connection.close()
+
+    directory.mkdir(parents=True, exist_ok=True)
+    _build_index_file(source, target, content_hash, engine)
+    return ExportIndex(source, sqlite3.connect(target), content_hash=content_hash, engine=engine)
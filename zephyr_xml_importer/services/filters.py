@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import UTC, date, datetime
+from fnmatch import translate
+
+from .models import ZephyrTestCase
+
+_GLOB_CHARS = frozenset("*?[")
+
+
+@dataclass(frozen=True, slots=True)
+class CaseFilter:
+    """
+    Which cases a partial import keeps; build one with `build_case_filter`.
+
+    Each check takes the raw value the parser has at hand (the key attribute, the
+    `<folder>` and `<updatedOn>` texts), so cases can be rejected before their steps,
+    test data and issues are built.
+    """
+
+    folder_prefix: str | None = None
+    keys: frozenset[str] = frozenset()
+    key_pattern: re.Pattern[str] | None = None
+    updated_since: datetime | None = None
+
+    def match_key(self, key: str | None) -> bool:
+        if not self.keys and self.key_pattern is None:
+            return True
+        if key is None:
+            return False
+        if key in self.keys:
+            return True
+        return self.key_pattern is not None and self.key_pattern.match(key) is not None
+
+    def match_folder(self, folder: str | None) -> bool:
+        prefix = self.folder_prefix
+        if prefix is None:
+            return True
+        path = _normalize_folder(folder)
+        return path == prefix or path.startswith(prefix + "/")
+
+    def match_updated(self, updated_on: str | None) -> bool:
+        # Cases without a readable `updatedOn` are kept: dropping them would silently
+        # lose data on exports that do not carry the field.
+        if self.updated_since is None:
+            return True
+        updated = parse_zephyr_datetime(updated_on)
+        return updated is None or updated >= self.updated_since
+
+    def matches(self, tc: ZephyrTestCase) -> bool:
+        return (
+            self.match_key(tc.key)
+            and self.match_folder(tc.folder)
+            and self.match_updated(tc.updated_on)
+        )
+
+
+def _normalize_folder(folder: str | None) -> str:
+    return "/".join(part.strip() for part in (folder or "").split("/") if part.strip())
+
+
+def parse_zephyr_datetime(value: str | date | None) -> datetime | None:
+    """
+    Parse an export timestamp (ISO 8601, optionally with a space and a ` UTC` or `Z`
+    suffix, or a bare date). Naive values are taken as UTC; unreadable ones give None.
+    """
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        parsed = value
+    elif isinstance(value, date):
+        parsed = datetime(value.year, value.month, value.day)
+    else:
+        text = value.strip()
+        if text.upper().endswith(" UTC"):
+            text = text[:-4]
+        elif text.upper().endswith("Z"):
+            text = text[:-1] + "+00:00"
+        try:
+            parsed = datetime.fromisoformat(text)
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=UTC)
+    return parsed
+
+
+def build_case_filter(
+    *,
+    folder_prefix: str | None = None,
+    keys: Iterable[str] | None = None,
+    updated_since: str | date | None = None,
+) -> CaseFilter | None:
+    """
+    Build a CaseFilter, or None when no criterion is set.
+
+    `folder_prefix` keeps that folder and its subfolders; `keys` are exact Zephyr keys
+    or globs (`ES-T5*`); `updated_since` is an inclusive lower bound on `updatedOn`.
+    Raises ValueError for an unreadable `updated_since`.
+    """
+    prefix = _normalize_folder(folder_prefix) or None
+    exact: set[str] = set()
+    globs: list[str] = []
+    for key in keys or ():
+        key = key.strip()
+        if not key:
+            continue
+        if _GLOB_CHARS.intersection(key):
+            globs.append(translate(key))
+        else:
+            exact.add(key)
+    since = parse_zephyr_datetime(updated_since)
+    if updated_since is not None and since is None:
+        raise ValueError(f"Invalid updated_since timestamp: {updated_since!r}")
+
+    if prefix is None and not exact and not globs and since is None:
+        return None
+    return CaseFilter(
+        folder_prefix=prefix,
+        keys=frozenset(exact),
+        key_pattern=re.compile("|".join(globs)) if globs else None,
+        updated_since=since,
+    )
@@ -1,25 +1,53 @@
 from __future__ import annotations
 
-from contextlib import contextmanager
-from dataclasses import dataclass, field
+import bz2
+import gzip
+import lzma
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from contextlib import ExitStack, closing, contextmanager
+from dataclasses import dataclass, field, replace
+from functools import partial
 from io import BytesIO
 from pathlib import Path
 from tempfile import NamedTemporaryFile
-from typing import Any, BinaryIO, Iterator, Mapping, cast
-from zipfile import ZipFile
+from typing import Any, BinaryIO, cast
+from zipfile import BadZipFile, ZipFile
 
-from .attachments import AttachmentZipIndex, build_zip_index
-from .mapping import build_testy_payload_from_zephyr, match_attachments_for_testcase
-from .parser import iter_test_cases, parse_folders_and_duplicate_key_counts
+from .attachments import AttachmentMatchResult, AttachmentZipIndex, build_zip_index
+from .csv_parser import iter_test_cases_csv, parse_csv_folders_and_duplicate_key_counts
+from .export_index import ExportIndex, open_export_index
+from .filters import CaseFilter
+from .mapping import iter_testy_payloads, match_attachments_for_testcase
+from .models import ZephyrExportCounts, ZephyrFolder, ZephyrTestCase
+from .parser import (
+    count_export,
+    iter_test_cases,
+    iter_test_cases_parallel,
+    parse_folders_and_duplicate_key_counts,
+)
 from .report import ReportRow, build_csv_report
-from .testy_adapter import BaseTestyAdapter, TestyAdapterError, TestyServiceAdapter
-from .validation import build_case_warnings, build_duplicate_key_counts
-from .xlsx_parser import build_folders_from_cases, iter_test_cases_xlsx
-
+from .sanitize import SanitizeCache
+from .testy_adapter import (
+    BaseTestyAdapter,
+    NewSuite,
+    TestyServiceAdapter,
+)
+from .validation import DeferredCaseWarnings, build_case_warnings
+from .xlsx_parser import (
+    iter_test_cases_xlsx,
+    iter_test_cases_xlsx_parallel,
+    parse_xlsx_folders_and_duplicate_key_counts,
+)
 
 NO_FOLDER_SUITE_NAME = "(No folder)"
 MAX_WARNING_PREVIEW = 50
 
+# Row-based exports: case reader and first-pass scan, by source kind.
+_SPREADSHEET_READERS = {
+    "xlsx": (iter_test_cases_xlsx, parse_xlsx_folders_and_duplicate_key_counts),
+    "csv": (iter_test_cases_csv, parse_csv_folders_and_duplicate_key_counts),
+}
+
 
 @dataclass(frozen=True, slots=True)
 class ImportSummary:
@@ -33,6 +61,12 @@ class ImportSummary:
     updated: int = 0
     skipped: int = 0
     failed: int = 0
+    # Counted only when the import ran with a sanitize cache.
+    sanitize_cache_hits: int | None = None
+    sanitize_cache_misses: int | None = None
+    # New cases created one at a time after their bulk batch failed; counted only when
+    # the import ran with bulk_batch_size.
+    bulk_fallbacks: int | None = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -118,27 +152,118 @@ def _peek_head(source: Any, size: int = 4) -> tuple[bytes, BinaryIO | None]:
     return bytes(head), buffer
 
 
+# Compressed exports are recognised by magic bytes, whatever the upload is called.
+_COMPRESSION_MAGIC = (
+    (b"\x1f\x8b", "gzip"),
+    (b"BZh", "bz2"),
+    (b"\xfd7zXZ\x00", "xz"),
+)
+_DECOMPRESSORS = {
+    "gzip": lambda raw: gzip.GzipFile(fileobj=raw, mode="rb"),
+    "bz2": bz2.BZ2File,
+    "xz": lzma.LZMAFile,
+}
+_MAGIC_SIZE = max(len(magic) for magic, _ in _COMPRESSION_MAGIC)
+
+
+@dataclass(frozen=True, slots=True)
+class _CompressedXmlSource:
+    source: str | Path | BinaryIO | bytes
+    codec: str
+    member: str | None = None
+
+
+@contextmanager
+def _open_raw(source: str | Path | BinaryIO | bytes) -> Iterator[BinaryIO]:
+    if isinstance(source, (str, Path)):
+        with open(source, "rb") as handle:
+            yield handle
+        return
+    if isinstance(source, (bytes, bytearray)):
+        yield BytesIO(bytes(source))
+        return
+    stream = cast(BinaryIO, source)
+    stream.seek(0)
+    try:
+        yield stream
+    finally:
+        stream.seek(0)
+
+
+@contextmanager
+def _open_decompressed(source: _CompressedXmlSource) -> Iterator[BinaryIO]:
+    # The stdlib readers decompress incrementally and emulate seek(0) by restarting
+    # from the compressed stream, so a second pass never needs the XML spilled to disk.
+    with _open_raw(source.source) as raw:
+        if source.member is not None:
+            with ZipFile(raw) as archive, archive.open(source.member) as stream:
+                yield cast(BinaryIO, stream)
+        else:
+            with _DECOMPRESSORS[source.codec](raw) as stream:
+                yield cast(BinaryIO, stream)
+
+
+@dataclass(frozen=True, slots=True)
+class _XlsxWorkbooks:
+    # Several workbooks imported as one export: given directly, or as the members of
+    # a ZIP upload.
+    sources: tuple[str | Path | BinaryIO | bytes, ...] = ()
+    archive: str | Path | BinaryIO | bytes | None = None
+    members: tuple[str, ...] = ()
+
+
+def _zip_member_names(source: str | Path | BinaryIO | bytes) -> list[str] | None:
+    try:
+        with _open_raw(source) as raw, ZipFile(raw) as archive:
+            return [info.filename for info in archive.infolist() if not info.is_dir()]
+    except (BadZipFile, OSError):
+        return None
+
+
 def _prepare_source(
-    source: str | Path | BinaryIO | bytes,
-) -> tuple[str, str | Path | BinaryIO | bytes]:
+    source: str | Path | BinaryIO | bytes | Sequence[str | Path | BinaryIO | bytes],
+) -> tuple[str, str | Path | BinaryIO | bytes | _CompressedXmlSource | _XlsxWorkbooks]:
+    if isinstance(source, (list, tuple)):
+        return "xlsx", _XlsxWorkbooks(sources=tuple(source))
+    source = cast("str | Path | BinaryIO | bytes", source)
     ext = _extract_extension(source)
     if ext == ".xlsx":
         return "xlsx", source
     if ext == ".xml":
         return "xml", source
+    if ext == ".csv":
+        return "csv", source
     if isinstance(source, (bytes, bytearray)):
-        return ("xlsx" if bytes(source).startswith(b"PK") else "xml"), source
-    head, buffered = _peek_head(source)
-    if buffered is not None:
-        source = buffered
-    kind = "xlsx" if head.startswith(b"PK") else "xml"
-    return kind, source
+        head = bytes(source[:_MAGIC_SIZE])
+    elif isinstance(source, (str, Path)):
+        with open(source, "rb") as handle:
+            head = handle.read(_MAGIC_SIZE)
+    else:
+        head, buffered = _peek_head(source, _MAGIC_SIZE)
+        if buffered is not None:
+            source = buffered
+    for magic, codec in _COMPRESSION_MAGIC:
+        if head.startswith(magic):
+            return "xml", _CompressedXmlSource(source, codec)
+    if head.startswith(b"PK"):
+        members = _zip_member_names(source) or []
+        if members and all(name.lower().endswith(".xlsx") for name in members):
+            return "xlsx", _XlsxWorkbooks(archive=source, members=tuple(members))
+        # A zip holding a single file is a wrapped export; an XLSX workbook has many parts.
+        if len(members) == 1:
+            return "xml", _CompressedXmlSource(source, "zip", members[0])
+        return "xlsx", source
+    return "xml", source
 
 
 @contextmanager
-def _open_seekable_xml_source(
-    source: str | Path | BinaryIO | bytes,
+def _open_seekable_source(
+    source: str | Path | BinaryIO | bytes | _CompressedXmlSource,
 ) -> Iterator[BinaryIO]:
+    if isinstance(source, _CompressedXmlSource):
+        with _open_decompressed(source) as stream:
+            yield stream
+        return
     if isinstance(source, (str, Path)):
         with open(source, "rb") as handle:
             yield handle
@@ -168,6 +293,146 @@ def _open_seekable_xml_source(
         yield tmp
 
 
+@contextmanager
+def _single_pass_xml_cases(
+    source: str | Path | BinaryIO | bytes | _CompressedXmlSource,
+    folders: dict[str, ZephyrFolder],
+    *,
+    parse_workers: int = 0,
+    case_filter: CaseFilter | None = None,
+) -> Iterator[Iterator[ZephyrTestCase]]:
+    if isinstance(source, _CompressedXmlSource):
+        # Decompressed bytes cannot be memory-mapped for the byte-offset index, so
+        # compressed exports always parse sequentially.
+        with _open_decompressed(source) as xml_stream:
+            yield iter_test_cases(xml_stream, folders=folders, case_filter=case_filter)
+        return
+    if parse_workers <= 0:
+        yield iter_test_cases(source, folders=folders, case_filter=case_filter)
+        return
+    # The byte-offset index needs random access to the export.
+    with _open_seekable_source(source) as xml_stream:
+        yield iter_test_cases_parallel(
+            xml_stream, folders=folders, workers=parse_workers, case_filter=case_filter
+        )
+
+
+@contextmanager
+def _open_xlsx_workbooks(
+    source: str | Path | BinaryIO | bytes | _XlsxWorkbooks,
+) -> Iterator[list[str | Path | BinaryIO | bytes]]:
+    if not isinstance(source, _XlsxWorkbooks):
+        yield [source]
+        return
+    if source.archive is None:
+        yield list(source.sources)
+        return
+    # Workbooks are read by seeking, which compressed zip members cannot do.
+    with ExitStack() as stack:
+        raw = stack.enter_context(_open_raw(source.archive))
+        archive = stack.enter_context(ZipFile(raw))
+        workbooks: list[str | Path | BinaryIO | bytes] = []
+        for member in source.members:
+            tmp = stack.enter_context(NamedTemporaryFile(suffix=".xlsx"))
+            with archive.open(member) as stream:
+                _copy_stream(cast(BinaryIO, stream), tmp)
+            tmp.flush()
+            workbooks.append(tmp.name)
+        yield workbooks
+
+
+@contextmanager
+def _merged_xlsx_cases(
+    source: str | Path | BinaryIO | bytes | _XlsxWorkbooks,
+    folders: dict[str, ZephyrFolder],
+    *,
+    all_sheets: bool = False,
+    parse_workers: int = 0,
+    case_filter: CaseFilter | None = None,
+) -> Iterator[Iterator[ZephyrTestCase]]:
+    with _open_xlsx_workbooks(source) as workbooks:
+        yield iter_test_cases_xlsx_parallel(
+            workbooks,
+            all_sheets=all_sheets,
+            folders=folders,
+            workers=max(parse_workers, 1),
+            case_filter=case_filter,
+        )
+
+
+def _merges_xlsx_sheets(
+    source: object, *, single_pass: bool, parse_workers: int, xlsx_all_sheets: bool
+) -> bool:
+    # Several sheets, or a single pass over one, reconcile warnings at the end; one
+    # active sheet otherwise gets the two-pass treatment.
+    return single_pass or parse_workers > 0 or xlsx_all_sheets or isinstance(source, _XlsxWorkbooks)
+
+
+def _count_cases(
+    case_iter: Iterable[ZephyrTestCase], folders: Mapping[str, ZephyrFolder]
+) -> ZephyrExportCounts:
+    cases = steps = attachments = 0
+    for tc in case_iter:
+        cases += 1
+        steps += len(tc.steps)
+        attachments += len(tc.attachments)
+    return ZephyrExportCounts(
+        folders=len(folders), cases=cases, steps=steps, attachments=attachments
+    )
+
+
+def preflight_export(
+    xml_source: str | Path | BinaryIO | bytes | Sequence[str | Path | BinaryIO | bytes],
+    *,
+    xlsx_all_sheets: bool = False,
+    case_filter: CaseFilter | None = None,
+) -> ZephyrExportCounts:
+    """
+    Count what an upload holds before importing it (see `count_export`).
+
+    XML, including compressed XML, is scanned without building test cases; XLSX and CSV
+    have no cheaper path than reading their rows, so their cases are streamed and
+    counted, from every workbook and, with `xlsx_all_sheets`, every worksheet. With a
+    `case_filter`, only the cases and folders it keeps are counted, which for XML takes
+    a full parse.
+    """
+    source_kind, prepared_source = _prepare_source(xml_source)
+    folders: dict[str, ZephyrFolder] = {}
+    if source_kind == "xlsx":
+        with _merged_xlsx_cases(
+            cast("str | Path | BinaryIO | bytes | _XlsxWorkbooks", prepared_source),
+            folders,
+            all_sheets=xlsx_all_sheets,
+            case_filter=case_filter,
+        ) as case_iter:
+            return _count_cases(case_iter, folders)
+    if source_kind == "csv":
+        case_iter = iter_test_cases_csv(
+            cast("str | Path | BinaryIO | bytes", prepared_source),
+            folders=folders,
+            case_filter=case_filter,
+        )
+        return replace(_count_cases(case_iter, folders), attachments=0)
+    with ExitStack() as stack:
+        if isinstance(prepared_source, _CompressedXmlSource):
+            xml_stream = stack.enter_context(_open_decompressed(prepared_source))
+        else:
+            xml_stream = cast("str | Path | BinaryIO | bytes", prepared_source)
+        if case_filter is None:
+            return count_export(xml_stream)
+        case_iter = iter_test_cases(xml_stream, folders=folders, case_filter=case_filter)
+        return _count_cases(case_iter, folders)
+
+
+def _filter_folders(
+    folders: dict[str, ZephyrFolder], case_filter: CaseFilter | None
+) -> dict[str, ZephyrFolder]:
+    # A folder-prefix import creates only the suites of that subtree.
+    if case_filter is None:
+        return folders
+    return {path: folder for path, folder in folders.items() if case_filter.match_folder(path)}
+
+
 def _collect_warnings(
     row_warnings: list[str],
     warnings: list[str],
@@ -180,16 +445,153 @@ def _collect_warnings(
             warnings.append(cleaned)
 
 
+def _reconcile_deferred_warnings(
+    rows: list[ReportRow],
+    deferred: DeferredCaseWarnings,
+    warnings: list[str],
+    seen: set[str],
+) -> None:
+    for index, row_warnings in deferred.reconcile(lambda i: rows[i].warnings).items():
+        rows[index] = replace(rows[index], warnings=row_warnings)
+    warnings.clear()
+    seen.clear()
+    for row in rows:
+        _collect_warnings(row.warnings, warnings, seen)
+
+
+def _make_sanitize_cache(size: int) -> SanitizeCache | None:
+    return SanitizeCache(size) if size > 0 else None
+
+
+def _open_export_index(source: str | Path, index_dir: str | Path) -> ExportIndex | None:
+    try:
+        return open_export_index(source, index_dir=index_dir)
+    except ValueError:
+        # Exports the byte index cannot cover (see `iter_test_case_spans`) are read in
+        # full, which also reports any real parse error.
+        return None
+
+
+@dataclass(frozen=True, slots=True)
+class _CaseSource:
+    """Cases of an export, with the folders and duplicate key counts their warnings need.
+
+    `deferred` is set when folders and keys are only known once every case has been
+    read; its warnings are reconciled with the report rows afterwards.
+    """
+
+    folders: Mapping[str, ZephyrFolder]
+    duplicate_key_counts: Mapping[str, int]
+    cases: Iterator[ZephyrTestCase]
+    deferred: DeferredCaseWarnings | None = None
+
+
+@contextmanager
+def _open_case_source(
+    xml_source: str | Path | BinaryIO | bytes | Sequence[str | Path | BinaryIO | bytes],
+    *,
+    single_pass: bool = False,
+    parse_workers: int = 0,
+    xlsx_all_sheets: bool = False,
+    case_filter: CaseFilter | None = None,
+    export_index_dir: str | Path | None = None,
+) -> Iterator[_CaseSource]:
+    source_kind, prepared_source = _prepare_source(xml_source)
+    index = None
+    if (
+        export_index_dir is not None
+        and case_filter is not None
+        and source_kind == "xml"
+        and isinstance(prepared_source, (str, Path))
+    ):
+        index = _open_export_index(prepared_source, export_index_dir)
+    if index is not None:
+        # A filtered import of an indexed export reads only the cases it keeps.
+        with index:
+            ranges, duplicate_key_counts = index.select_ranges(case_filter)
+            folders = _filter_folders(index.folders(), case_filter)
+            yield _CaseSource(folders, duplicate_key_counts, index.read_test_cases(ranges))
+    elif source_kind == "xlsx" and _merges_xlsx_sheets(
+        prepared_source,
+        single_pass=single_pass,
+        parse_workers=parse_workers,
+        xlsx_all_sheets=xlsx_all_sheets,
+    ):
+        folders: dict[str, ZephyrFolder] = {}
+        deferred = DeferredCaseWarnings(folders)
+        with _merged_xlsx_cases(
+            cast("str | Path | BinaryIO | bytes | _XlsxWorkbooks", prepared_source),
+            folders,
+            all_sheets=xlsx_all_sheets,
+            parse_workers=parse_workers,
+            case_filter=case_filter,
+        ) as case_iter:
+            yield _CaseSource(folders, deferred.duplicate_key_counts, case_iter, deferred)
+    elif source_kind == "csv" and (single_pass or parse_workers > 0):
+        folders = {}
+        deferred = DeferredCaseWarnings(folders)
+        case_iter = iter_test_cases_csv(
+            cast("str | Path | BinaryIO | bytes", prepared_source),
+            folders=folders,
+            case_filter=case_filter,
+        )
+        yield _CaseSource(folders, deferred.duplicate_key_counts, case_iter, deferred)
+    elif source_kind in _SPREADSHEET_READERS:
+        # Folders and duplicate keys come from a first pass over the key and folder
+        # columns, so cases are then built and handled one at a time.
+        iter_cases, scan_folders = _SPREADSHEET_READERS[source_kind]
+        with _open_seekable_source(prepared_source) as rows_stream:
+            folders, duplicate_key_counts = scan_folders(rows_stream, case_filter=case_filter)
+            yield _CaseSource(
+                folders, duplicate_key_counts, iter_cases(rows_stream, case_filter=case_filter)
+            )
+    elif single_pass or parse_workers > 0:
+        folders = {}
+        deferred = DeferredCaseWarnings(folders)
+        with _single_pass_xml_cases(
+            prepared_source, folders, parse_workers=parse_workers, case_filter=case_filter
+        ) as case_iter:
+            yield _CaseSource(folders, deferred.duplicate_key_counts, case_iter, deferred)
+    else:
+        with _open_seekable_source(prepared_source) as xml_stream:
+            folders, duplicate_key_counts = parse_folders_and_duplicate_key_counts(
+                xml_stream, case_filter=case_filter
+            )
+            folders = _filter_folders(folders, case_filter)
+            xml_stream.seek(0)
+            yield _CaseSource(
+                folders, duplicate_key_counts, iter_test_cases(xml_stream, case_filter=case_filter)
+            )
+
+
 def dry_run_import(
-    xml_source: str | Path | BinaryIO | bytes,
+    xml_source: str | Path | BinaryIO | bytes | Sequence[str | Path | BinaryIO | bytes],
     *,
     attachments_zip: str | Path | BinaryIO | bytes | None = None,
     prefix_with_zephyr_key: bool = True,
     meta_labels: bool = True,
     append_jira_issues_to_description: bool = True,
     embed_testdata_to_description: bool = True,
+    single_pass: bool = False,
+    parse_workers: int = 0,
+    xlsx_all_sheets: bool = False,
+    sanitize_cache_size: int = 0,
+    map_workers: int = 0,
+    case_filter: CaseFilter | None = None,
+    export_index_dir: str | Path | None = None,
 ) -> DryRunImportResult:
     zip_index = _build_zip_index(attachments_zip)
+    sanitize_cache = _make_sanitize_cache(sanitize_cache_size)
+    # Each case is sanitized once for both its payload and its warnings.
+    map_payloads = partial(
+        iter_testy_payloads,
+        prefix_with_zephyr_key=prefix_with_zephyr_key,
+        meta_labels=meta_labels,
+        append_jira_issues_to_description=append_jira_issues_to_description,
+        embed_testdata_to_description=embed_testdata_to_description,
+        sanitize_cache=sanitize_cache,
+        workers=map_workers,
+    )
 
     rows: list[ReportRow] = []
     warnings: list[str] = []
@@ -204,66 +606,67 @@ def dry_run_import(
         case_iter: Iterator[Any],
         folders: Mapping[str, Any],
         duplicate_key_counts: Mapping[str, int],
+        deferred: DeferredCaseWarnings | None = None,
     ) -> None:
         nonlocal case_count, step_count, label_count, attachment_count
-        for tc in case_iter:
-            case_count += 1
-            payload = build_testy_payload_from_zephyr(
-                tc,
-                prefix_with_zephyr_key=prefix_with_zephyr_key,
-                meta_labels=meta_labels,
-                append_jira_issues_to_description=append_jira_issues_to_description,
-                embed_testdata_to_description=embed_testdata_to_description,
-            )
-            steps = payload.get("steps", [])
-            labels = payload.get("labels", [])
-            step_count += len(steps)
-            label_count += len(labels)
-
-            attachment_result = match_attachments_for_testcase(tc, zip_index)
-            case_warnings = build_case_warnings(
-                tc,
-                payload["name"],
-                duplicate_key_counts,
-                folders=folders,
-            )
-            attachment_count += attachment_result.attachments_in_xml
+        with closing(map_payloads(case_iter)) as payloads:
+            for tc, sanitized, payload in payloads:
+                case_count += 1
+                steps = payload.get("steps", [])
+                labels = payload.get("labels", [])
+                step_count += len(steps)
+                label_count += len(labels)
 
-            row_warnings = [*case_warnings, *attachment_result.warnings]
-            _collect_warnings(row_warnings, warnings, seen_warnings)
+                attachment_result = match_attachments_for_testcase(tc, zip_index)
+                if deferred is not None:
+                    case_warnings = deferred.case_warnings(
+                        tc, payload["name"], len(rows), sanitized=sanitized
+                    )
+                else:
+                    case_warnings = build_case_warnings(
+                        tc,
+                        payload["name"],
+                        duplicate_key_counts,
+                        folders=folders,
+                        sanitized=sanitized,
+                    )
+                attachment_count += attachment_result.attachments_in_xml
 
-            rows.append(
-                ReportRow(
-                    zephyr_key=tc.key,
-                    zephyr_id=tc.zephyr_id,
-                    folder_full_path=tc.folder,
-                    testy_suite_id=None,
-                    testy_case_id=None,
-                    action="created",
-                    steps_count=len(steps),
-                    labels_count=len(labels),
-                    attachments_in_xml=attachment_result.attachments_in_xml,
-                    attachments_attached=attachment_result.attachments_attached,
-                    attachments_missing=attachment_result.attachments_missing,
-                    warnings=row_warnings,
-                    error=None,
+                row_warnings = [*case_warnings, *attachment_result.warnings]
+                _collect_warnings(row_warnings, warnings, seen_warnings)
+
+                rows.append(
+                    ReportRow(
+                        zephyr_key=tc.key,
+                        zephyr_id=tc.zephyr_id,
+                        folder_full_path=tc.folder,
+                        testy_suite_id=None,
+                        testy_case_id=None,
+                        action="created",
+                        steps_count=len(steps),
+                        labels_count=len(labels),
+                        attachments_in_xml=attachment_result.attachments_in_xml,
+                        attachments_attached=attachment_result.attachments_attached,
+                        attachments_missing=attachment_result.attachments_missing,
+                        warnings=row_warnings,
+                        error=None,
+                    )
                 )
-            )
 
-    source_kind, prepared_source = _prepare_source(xml_source)
-    if source_kind == "xlsx":
-        cases = list(iter_test_cases_xlsx(prepared_source))
-        folders = build_folders_from_cases(cases)
-        duplicate_key_counts = build_duplicate_key_counts(cases)
-        handle_cases(iter(cases), folders, duplicate_key_counts)
-    else:
-        with _open_seekable_xml_source(prepared_source) as xml_stream:
-            folders, duplicate_key_counts = parse_folders_and_duplicate_key_counts(xml_stream)
-            xml_stream.seek(0)
-            handle_cases(iter_test_cases(xml_stream), folders, duplicate_key_counts)
+    with _open_case_source(
+        xml_source,
+        single_pass=single_pass,
+        parse_workers=parse_workers,
+        xlsx_all_sheets=xlsx_all_sheets,
+        case_filter=case_filter,
+        export_index_dir=export_index_dir,
+    ) as source:
+        handle_cases(source.cases, source.folders, source.duplicate_key_counts, source.deferred)
+    if source.deferred is not None:
+        _reconcile_deferred_warnings(rows, source.deferred, warnings, seen_warnings)
 
     summary = ImportSummary(
-        folders=len(folders),
+        folders=len(source.folders),
         cases=case_count,
         steps=step_count,
         labels=label_count,
@@ -273,6 +676,8 @@ def dry_run_import(
         updated=0,
         skipped=0,
         failed=0,
+        sanitize_cache_hits=sanitize_cache.hits if sanitize_cache is not None else None,
+        sanitize_cache_misses=sanitize_cache.misses if sanitize_cache is not None else None,
     )
     report_csv = build_csv_report(rows)
     warnings_preview = warnings[:MAX_WARNING_PREVIEW]
@@ -288,6 +693,23 @@ def _suite_attributes(folder_path: str | None, folder_index: int | None) -> dict
     }
 
 
+@dataclass(slots=True)
+class _WrittenCase:
+    """A case on its way to TestY, with what its report row needs."""
+
+    tc: ZephyrTestCase
+    payload: dict[str, Any]
+    steps_count: int
+    labels: list[str]
+    attachments: AttachmentMatchResult
+    warnings: list[str]
+    action: str = "created"
+    suite_id: int | None = None
+    case_id: int | None = None
+    error: str | None = None
+    attachments_attached: int = 0
+
+
 def _payload_without_labels(payload: Mapping[str, Any]) -> dict[str, Any]:
     cleaned = dict(payload)
     cleaned.pop("labels", None)
@@ -295,7 +717,7 @@ def _payload_without_labels(payload: Mapping[str, Any]) -> dict[str, Any]:
 
 
 def import_into_testy(
-    xml_source: str | Path | BinaryIO | bytes,
+    xml_source: str | Path | BinaryIO | bytes | Sequence[str | Path | BinaryIO | bytes],
     *,
     project_id: int,
     attachments_zip: str | Path | BinaryIO | bytes | None = None,
@@ -306,6 +728,14 @@ def import_into_testy(
     on_duplicate: str = "skip",
     adapter: BaseTestyAdapter | None = None,
     user: Any | None = None,
+    single_pass: bool = False,
+    parse_workers: int = 0,
+    xlsx_all_sheets: bool = False,
+    sanitize_cache_size: int = 0,
+    map_workers: int = 0,
+    bulk_batch_size: int = 0,
+    case_filter: CaseFilter | None = None,
+    export_index_dir: str | Path | None = None,
 ) -> DryRunImportResult:
     zip_bytes = _read_source_bytes(attachments_zip) if attachments_zip is not None else None
     zip_index = build_zip_index(zip_bytes) if zip_bytes is not None else None
@@ -313,6 +743,17 @@ def import_into_testy(
 
     if adapter is None:
         adapter = TestyServiceAdapter(user=user)
+    sanitize_cache = _make_sanitize_cache(sanitize_cache_size)
+    # Each case is sanitized once for both its payload and its warnings.
+    map_payloads = partial(
+        iter_testy_payloads,
+        prefix_with_zephyr_key=prefix_with_zephyr_key,
+        meta_labels=meta_labels,
+        append_jira_issues_to_description=append_jira_issues_to_description,
+        embed_testdata_to_description=embed_testdata_to_description,
+        sanitize_cache=sanitize_cache,
+        workers=map_workers,
+    )
 
     rows: list[ReportRow] = []
     warnings: list[str] = []
@@ -327,37 +768,72 @@ def import_into_testy(
     updated_count = 0
     skipped_count = 0
     failed_count = 0
+    bulk_fallback_count = 0
 
     def run_import(
         case_iter: Iterator[Any],
         folders: Mapping[str, Any],
         duplicate_key_counts: Mapping[str, int],
+        deferred: DeferredCaseWarnings | None = None,
     ) -> None:
         nonlocal case_count, step_count, label_count, attachment_count
         nonlocal created_count, reused_count, updated_count, skipped_count, failed_count
 
-        suite_cache: dict[tuple[int | None, str], int] = {}
+        # The project's suites are indexed up front when the adapter can list them, so
+        # only suites missing from the index are created; otherwise each new
+        # (parent, name) pair is looked up once.
+        try:
+            suite_cache = adapter.load_suite_tree(project_id)
+            suite_tree_loaded = True
+        except NotImplementedError:
+            suite_cache = {}
+            suite_tree_loaded = False
+
+        # Existing Zephyr keys are loaded in one go and kept up to date with the cases
+        # created below; adapters without that lookup are asked case by case.
+        try:
+            known_case_ids: dict[str, int] | None = adapter.case_ids_by_zephyr_key(project_id)
+        except NotImplementedError:
+            known_case_ids = None
+
+        def find_existing_case(zephyr_key: str) -> int | None:
+            if known_case_ids is None:
+                return adapter.find_case_id_by_zephyr_key(project_id, zephyr_key)
+            return known_case_ids.get(zephyr_key)
 
         def ensure_suite(name: str, parent_id: int | None, folder_path: str | None) -> int:
             cache_key = (parent_id, name)
             cached = suite_cache.get(cache_key)
             if cached is not None:
                 return cached
-            existing = adapter.get_suite_id(project_id, name, parent_id)
+            existing = None
+            if not suite_tree_loaded:
+                existing = adapter.get_suite_id(project_id, name, parent_id)
             if existing is None:
-                folder_meta = folders.get(folder_path or "")
+                suite = new_suite(name, parent_id, folder_path)
                 suite_id = adapter.create_suite(
                     project_id,
-                    name,
-                    parent_id,
-                    _suite_attributes(folder_path, folder_meta.index if folder_meta else None),
-                    description=folder_meta.description if folder_meta else None,
+                    suite.name,
+                    suite.parent_id,
+                    suite.attributes,
+                    description=suite.description,
                 )
             else:
                 suite_id = existing
             suite_cache[cache_key] = suite_id
             return suite_id
 
+        def new_suite(name: str, parent_id: int | None, folder_path: str | None) -> NewSuite:
+            folder_meta = folders.get(folder_path or "")
+            return NewSuite(
+                name=name,
+                parent_id=parent_id,
+                attributes=_suite_attributes(
+                    folder_path, folder_meta.index if folder_meta else None
+                ),
+                description=folder_meta.description if folder_meta else None,
+            )
+
         def suite_id_for_folder(folder_path: str | None) -> int:
             cleaned = (folder_path or "").strip()
             if not cleaned:
@@ -370,157 +846,251 @@ def import_into_testy(
                 parent_id = ensure_suite(part, parent_id, current_path)
             return parent_id or ensure_suite(NO_FOLDER_SUITE_NAME, None, None)
 
+        precreated_folders: set[str] = set()
+
         def precreate_folder_suites() -> None:
+            # Single-pass imports discover folders while streaming, so this may run again
+            # for folders that showed up after the previous call. Suites are created a
+            # tree level at a time, so each level knows the ids of its parents; with
+            # bulk_batch_size a level is one create_suites_bulk call.
+            levels: list[list[tuple[str, ...]]] = []
+            seen_paths: set[tuple[str, ...]] = set()
             for folder_path in sorted(folders):
-                cleaned = folder_path.strip()
-                if not cleaned:
+                if folder_path in precreated_folders:
                     continue
-                parts = [part.strip() for part in cleaned.split("/") if part.strip()]
-                parent_id: int | None = None
-                current_path = ""
-                for part in parts:
-                    current_path = f"{current_path}/{part}" if current_path else part
-                    parent_id = ensure_suite(part, parent_id, current_path)
-
-        precreate_folder_suites()
-
-        for tc in case_iter:
-            case_count += 1
-            payload = build_testy_payload_from_zephyr(
-                tc,
-                prefix_with_zephyr_key=prefix_with_zephyr_key,
-                meta_labels=meta_labels,
-                append_jira_issues_to_description=append_jira_issues_to_description,
-                embed_testdata_to_description=embed_testdata_to_description,
-            )
-            payload_for_write = _payload_without_labels(payload)
-            steps = payload.get("steps", [])
-            labels = payload.get("labels", [])
-            step_count += len(steps)
-            label_count += len(labels)
-
-            attachment_result = match_attachments_for_testcase(tc, zip_index)
-            case_warnings = build_case_warnings(
-                tc,
-                payload["name"],
-                duplicate_key_counts,
-                folders=folders,
-            )
-            attachment_count += attachment_result.attachments_in_xml
-
-            row_warnings = [*case_warnings, *attachment_result.warnings]
+                precreated_folders.add(folder_path)
+                parts = tuple(part.strip() for part in folder_path.split("/") if part.strip())
+                for depth in range(len(parts)):
+                    path = parts[: depth + 1]
+                    if path in seen_paths:
+                        continue
+                    seen_paths.add(path)
+                    if depth == len(levels):
+                        levels.append([])
+                    levels[depth].append(path)
 
-            action = "created"
-            case_id: int | None = None
-            suite_id: int | None = None
-            error: str | None = None
-            attachments_attached = 0
+            suite_ids: dict[tuple[str, ...], int | None] = {(): None}
+            for paths in levels:
+                missing: list[tuple[str, ...]] = []
+                for path in paths:
+                    parent_id = suite_ids[path[:-1]]
+                    suite_id = suite_cache.get((parent_id, path[-1]))
+                    if suite_id is None and not suite_tree_loaded:
+                        suite_id = adapter.get_suite_id(project_id, path[-1], parent_id)
+                    if suite_id is None:
+                        missing.append(path)
+                    else:
+                        suite_ids[path] = suite_cache[(parent_id, path[-1])] = suite_id
+                if not missing:
+                    continue
+                suites = [
+                    new_suite(path[-1], suite_ids[path[:-1]], "/".join(path)) for path in missing
+                ]
+                if bulk_batch_size > 0:
+                    created = adapter.create_suites_bulk(project_id, suites)
+                else:
+                    # Bulk inserts bypass TestY's services, so by default each suite is
+                    # still created through create_suite.
+                    created = adapter.create_suites(project_id, suites)
+                for path, suite_id in zip(missing, created):
+                    suite_ids[path] = suite_cache[(suite_ids[path[:-1]], path[-1])] = suite_id
 
-            try:
-                existing_case_id = None
-                zephyr_key = (tc.key or "").strip()
-                if zephyr_key:
-                    existing_case_id = adapter.find_case_id_by_zephyr_key(project_id, zephyr_key)
+        precreate_folder_suites()
 
-                if existing_case_id and on_duplicate == "skip":
-                    action = "skipped"
-                    case_id = existing_case_id
-                else:
-                    suite_id = suite_id_for_folder(tc.folder)
-                    if existing_case_id and on_duplicate == "upsert":
-                        try:
-                            case_id = adapter.update_case_with_steps(
-                                project_id,
-                                existing_case_id,
-                                suite_id,
-                                payload_for_write,
-                            )
-                            action = "updated"
-                        except NotImplementedError:
-                            action = "skipped"
-                            case_id = existing_case_id
-                            row_warnings.append(
-                                "Upsert requested but adapter does not support updates"
-                            )
-                    else:
-                        case_id = adapter.create_case_with_steps(
-                            project_id,
-                            suite_id,
-                            payload_for_write,
-                        )
-                        action = "created"
+        def finish_case(case: _WrittenCase) -> None:
+            nonlocal created_count, reused_count, updated_count, skipped_count, failed_count
+            zephyr_key = (case.tc.key or "").strip()
+            if known_case_ids is not None and zephyr_key and case.case_id is not None:
+                known_case_ids.setdefault(zephyr_key, case.case_id)
+            if case.action in ("created", "updated") and case.case_id is not None:
+                try:
+                    adapter.set_labels(project_id, case.case_id, case.labels)
+                except Exception as exc:
+                    case.warnings.append(f"Failed to set labels: {exc}")
 
-                    if case_id is not None:
+                if zip_archive is not None and case.attachments.matched:
+                    for matched in case.attachments.matched:
                         try:
-                            adapter.set_labels(project_id, case_id, labels)
+                            data = zip_archive.read(matched)
+                            filename = Path(matched).name or matched
+                            adapter.attach_file(project_id, case.case_id, filename, data)
+                            case.attachments_attached += 1
                         except Exception as exc:
-                            row_warnings.append(f"Failed to set labels: {exc}")
-
-                        if zip_archive is not None and attachment_result.matched:
-                            for matched in attachment_result.matched:
-                                try:
-                                    data = zip_archive.read(matched)
-                                    filename = Path(matched).name or matched
-                                    adapter.attach_file(project_id, case_id, filename, data)
-                                    attachments_attached += 1
-                                except Exception as exc:
-                                    row_warnings.append(f"Failed to attach '{matched}': {exc}")
-            except TestyAdapterError as exc:
-                action = "failed"
-                error = str(exc)
-            except Exception as exc:
-                action = "failed"
-                error = str(exc)
-
-            if action == "created":
+                            case.warnings.append(f"Failed to attach '{matched}': {exc}")
+            if case.case_id is not None:
+                adapter.release_case(case.case_id)
+
+            if case.action == "created":
                 created_count += 1
-            elif action == "updated":
+            elif case.action == "updated":
                 updated_count += 1
-            elif action == "skipped":
+            elif case.action == "skipped":
                 skipped_count += 1
-                if case_id is not None:
+                if case.case_id is not None:
                     reused_count += 1
-            elif action == "failed":
+            elif case.action == "failed":
                 failed_count += 1
 
-            _collect_warnings(row_warnings, warnings, seen_warnings)
+            _collect_warnings(case.warnings, warnings, seen_warnings)
 
+            tc = case.tc
             rows.append(
                 ReportRow(
                     zephyr_key=tc.key,
                     zephyr_id=tc.zephyr_id,
                     folder_full_path=tc.folder,
-                    testy_suite_id=suite_id,
-                    testy_case_id=case_id,
-                    action=action,
-                    steps_count=len(steps),
-                    labels_count=len(labels),
-                    attachments_in_xml=attachment_result.attachments_in_xml,
-                    attachments_attached=attachments_attached,
-                    attachments_missing=attachment_result.attachments_missing,
-                    warnings=row_warnings,
-                    error=error,
+                    testy_suite_id=case.suite_id,
+                    testy_case_id=case.case_id,
+                    action=case.action,
+                    steps_count=case.steps_count,
+                    labels_count=len(case.labels),
+                    attachments_in_xml=case.attachments.attachments_in_xml,
+                    attachments_attached=case.attachments_attached,
+                    attachments_missing=case.attachments.attachments_missing,
+                    warnings=case.warnings,
+                    error=case.error,
                 )
             )
 
+        # With bulk_batch_size, new cases wait here until a batch of them is created in
+        # one call, and cases after the first of them wait too, to keep the report in
+        # import order. A Zephyr key of a waiting new case flushes the batch before it is
+        # looked up again.
+        pending: list[_WrittenCase] = []
+        pending_creates: list[_WrittenCase] = []
+        pending_keys: set[str] = set()
+
+        def flush_pending() -> None:
+            nonlocal bulk_fallback_count
+            if pending_creates:
+                # Failing items come back as results; the adapter does not raise for them.
+                results = adapter.create_cases_with_steps_bulk(
+                    project_id,
+                    [(case.suite_id, case.payload) for case in pending_creates],
+                    batch_size=bulk_batch_size,
+                )
+                for case, result in zip(pending_creates, results):
+                    case.case_id = result.case_id
+                    if result.bulk_error is not None:
+                        bulk_fallback_count += 1
+                        case.warnings.append(
+                            f"Bulk insert failed, created on its own: {result.bulk_error}"
+                        )
+                    if result.error is not None:
+                        case.action = "failed"
+                        case.error = result.error
+            for case in pending:
+                finish_case(case)
+            pending.clear()
+            pending_creates.clear()
+            pending_keys.clear()
+
+        with closing(map_payloads(case_iter)) as payloads:
+            for tc, sanitized, payload in payloads:
+                if len(precreated_folders) < len(folders):
+                    precreate_folder_suites()
+                case_count += 1
+                payload_for_write = _payload_without_labels(payload)
+                steps = payload.get("steps", [])
+                labels = payload.get("labels", [])
+                step_count += len(steps)
+                label_count += len(labels)
+
+                attachment_result = match_attachments_for_testcase(tc, zip_index)
+                if deferred is not None:
+                    case_warnings = deferred.case_warnings(
+                        tc, payload["name"], case_count - 1, sanitized=sanitized
+                    )
+                else:
+                    case_warnings = build_case_warnings(
+                        tc,
+                        payload["name"],
+                        duplicate_key_counts,
+                        folders=folders,
+                        sanitized=sanitized,
+                    )
+                attachment_count += attachment_result.attachments_in_xml
+
+                case = _WrittenCase(
+                    tc=tc,
+                    payload=payload_for_write,
+                    steps_count=len(steps),
+                    labels=labels,
+                    attachments=attachment_result,
+                    warnings=[*case_warnings, *attachment_result.warnings],
+                )
+                zephyr_key = (tc.key or "").strip()
+
+                try:
+                    existing_case_id = None
+                    if zephyr_key:
+                        if zephyr_key in pending_keys:
+                            flush_pending()
+                        existing_case_id = find_existing_case(zephyr_key)
+
+                    if existing_case_id and on_duplicate == "skip":
+                        case.action = "skipped"
+                        case.case_id = existing_case_id
+                    else:
+                        case.suite_id = suite_id_for_folder(tc.folder)
+                        if existing_case_id and on_duplicate == "upsert":
+                            try:
+                                case.case_id = adapter.update_case_with_steps(
+                                    project_id,
+                                    existing_case_id,
+                                    case.suite_id,
+                                    payload_for_write,
+                                )
+                                case.action = "updated"
+                            except NotImplementedError:
+                                case.action = "skipped"
+                                case.case_id = existing_case_id
+                                case.warnings.append(
+                                    "Upsert requested but adapter does not support updates"
+                                )
+                        elif bulk_batch_size > 0:
+                            pending_creates.append(case)
+                            if zephyr_key:
+                                pending_keys.add(zephyr_key)
+                        else:
+                            case.case_id = adapter.create_case_with_steps(
+                                project_id,
+                                case.suite_id,
+                                payload_for_write,
+                            )
+                except Exception as exc:
+                    case.action = "failed"
+                    case.error = str(exc)
+
+                if pending_creates:
+                    pending.append(case)
+                    if len(pending_creates) >= bulk_batch_size:
+                        flush_pending()
+                else:
+                    finish_case(case)
+            flush_pending()
+
+        precreate_folder_suites()
+
     try:
-        source_kind, prepared_source = _prepare_source(xml_source)
-        if source_kind == "xlsx":
-            cases = list(iter_test_cases_xlsx(prepared_source))
-            folders = build_folders_from_cases(cases)
-            duplicate_key_counts = build_duplicate_key_counts(cases)
-            run_import(iter(cases), folders, duplicate_key_counts)
-        else:
-            with _open_seekable_xml_source(prepared_source) as xml_stream:
-                folders, duplicate_key_counts = parse_folders_and_duplicate_key_counts(xml_stream)
-                xml_stream.seek(0)
-                run_import(iter_test_cases(xml_stream), folders, duplicate_key_counts)
+        with _open_case_source(
+            xml_source,
+            single_pass=single_pass,
+            parse_workers=parse_workers,
+            xlsx_all_sheets=xlsx_all_sheets,
+            case_filter=case_filter,
+            export_index_dir=export_index_dir,
+        ) as source:
+            run_import(source.cases, source.folders, source.duplicate_key_counts, source.deferred)
+        if source.deferred is not None:
+            _reconcile_deferred_warnings(rows, source.deferred, warnings, seen_warnings)
     finally:
+        adapter.clear_cache()
         if zip_archive is not None:
             zip_archive.close()
 
     summary = ImportSummary(
-        folders=len(folders),
+        folders=len(source.folders),
         cases=case_count,
         steps=step_count,
         labels=label_count,
@@ -530,6 +1100,9 @@ def import_into_testy(
         updated=updated_count,
         skipped=skipped_count,
         failed=failed_count,
+        sanitize_cache_hits=sanitize_cache.hits if sanitize_cache is not None else None,
+        sanitize_cache_misses=sanitize_cache.misses if sanitize_cache is not None else None,
+        bulk_fallbacks=bulk_fallback_count if bulk_batch_size > 0 else None,
     )
     report_csv = build_csv_report(rows)
     return DryRunImportResult(summary=summary, report_csv=report_csv, warnings=warnings)
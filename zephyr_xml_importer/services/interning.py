@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+
+# Enough for the statuses, owners, folders, labels and issue keys of a large export;
+# past it new values simply stay uninterned, so memory stays bounded per import.
+INTERN_TABLE_SIZE = 16_384
+# Longer values are free text rather than repeated vocabulary.
+INTERN_MAX_LENGTH = 256
+
+
+def make_interner(
+    size: int = INTERN_TABLE_SIZE,
+) -> Callable[[str | None], str | None]:
+    """
+    Return a function mapping equal strings to one shared object.
+
+    Unlike `sys.intern`, the table belongs to one import and is dropped with it, and it
+    never holds more than `size` values.
+    """
+    table: dict[str, str] = {}
+
+    def intern(value: str | None) -> str | None:
+        if value is None or len(value) > INTERN_MAX_LENGTH:
+            return value
+        shared = table.get(value)
+        if shared is not None:
+            return shared
+        if len(table) < size:
+            table[value] = value
+        return value
+
+    return intern
@@ -1,11 +1,25 @@
 from __future__ import annotations
 
+import marshal
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import asdict, is_dataclass
+from itertools import islice
+from operator import attrgetter
 from typing import Any
 
 from .attachments import AttachmentMatchResult, AttachmentZipIndex, match_attachments
-from .models import ZephyrIssue, ZephyrTestCase, ZephyrStep, ZephyrTestDataTable
-from .sanitize import sanitize_html
+from .models import ZephyrIssue, ZephyrStep, ZephyrTestCase, ZephyrTestDataTable
+from .records import dump_case_batch, load_case_batch
+from .sanitize import (
+    SanitizeCache,
+    SanitizedStep,
+    SanitizedTestCase,
+    sanitize_case,
+    sanitize_html,
+    sanitize_steps,
+)
 
 
 def _normalize_label(label: str) -> str:
@@ -61,14 +75,17 @@ def _issue_keys(issues: list[ZephyrIssue]) -> list[str]:
     return keys
 
 
-def _format_test_data_wrapper(wrapper: ZephyrTestDataTable) -> str:
+def _format_test_data_wrapper(
+    wrapper: ZephyrTestDataTable,
+    sanitize: Callable[[str | None], str] = sanitize_html,
+) -> str:
     rows: list[str] = []
     for row_index, row in enumerate(wrapper.rows, start=1):
         cells: list[str] = []
         for cell in row.cells:
-            name = sanitize_html(cell.name)
-            value = sanitize_html(cell.value)
-            data_type = sanitize_html(cell.data_type)
+            name = sanitize(cell.name)
+            value = sanitize(cell.value)
+            data_type = sanitize(cell.data_type)
             if name and value:
                 cells.append(f"{name}={value}")
             elif name:
@@ -94,12 +111,13 @@ def _json_safe_test_data_wrapper(wrapper: ZephyrTestDataTable | None) -> Any:
 
 def _build_description(
     tc: ZephyrTestCase,
+    base: str,
     *,
     append_jira_issues_to_description: bool,
     embed_testdata_to_description: bool,
+    sanitize: Callable[[str | None], str] = sanitize_html,
 ) -> str:
     parts: list[str] = []
-    base = sanitize_html(tc.objective)
     if base:
         parts.append(base)
 
@@ -116,16 +134,16 @@ def _build_description(
         if parameters:
             parts.append(f"Parameters: {', '.join(parameters)}")
         if tc.test_data_wrapper:
-            table_block = _format_test_data_wrapper(tc.test_data_wrapper)
+            table_block = _format_test_data_wrapper(tc.test_data_wrapper, sanitize)
             if table_block:
                 parts.append(table_block)
 
     return "\n\n".join(parts).strip()
 
 
-def _build_step_scenario(step: ZephyrStep) -> str:
-    desc = sanitize_html(step.description)
-    test_data = sanitize_html(step.test_data)
+def _build_step_scenario(step: SanitizedStep) -> str:
+    desc = step.description
+    test_data = step.test_data
     if desc:
         if test_data:
             return f"{desc}\n\nTest data:\n{test_data}"
@@ -135,11 +153,18 @@ def _build_step_scenario(step: ZephyrStep) -> str:
     return f"Step {step.index + 1} (empty in Zephyr)"
 
 
+_by_index = attrgetter("index")
+
+
 def flatten_steps_to_scenario(steps: list[ZephyrStep]) -> str:
+    ordered = sorted(sanitize_steps(steps), key=_by_index)
+    return _join_step_scenarios(ordered, [_build_step_scenario(s) for s in ordered])
+
+
+def _join_step_scenarios(steps: list[SanitizedStep], scenarios: list[str]) -> str:
     parts: list[str] = []
-    for s in sorted(steps, key=lambda x: x.index):
-        step_scenario = _build_step_scenario(s)
-        exp = sanitize_html(s.expected_result)
+    for s, step_scenario in zip(steps, scenarios):
+        exp = s.expected_result
 
         chunk = []
         chunk.append(f"Step {s.index + 1}")
@@ -158,31 +183,41 @@ def build_testy_payload_from_zephyr(
     meta_labels: bool = True,
     append_jira_issues_to_description: bool = True,
     embed_testdata_to_description: bool = True,
+    sanitized: SanitizedTestCase | None = None,
+    sanitize: Callable[[str | None], str] = sanitize_html,
 ) -> dict[str, Any]:
     """
     Pure mapping helper: build a dictionary that a future importer can translate into
     TestCaseService().case_with_steps_create(...) kwargs.
 
-    This repo starts without TestY installed; integration happens later.
+    This repo starts without TestY installed; integration happens later. Pass the
+    case's `sanitize_case` result as `sanitized` when validation needs it as well, and
+    a `SanitizeCache` as `sanitize` to memoize fragments across cases.
     """
+    if sanitized is None:
+        sanitized = sanitize_case(tc, sanitize)
     zephyr_key = (tc.key or "").strip()
     name = (tc.name or "").strip() or "(Unnamed test case)"
     if prefix_with_zephyr_key and zephyr_key:
         name = f"[{zephyr_key}] {name}"
 
-    setup = sanitize_html(tc.precondition)
+    setup = sanitized.precondition
     description = _build_description(
         tc,
+        sanitized.objective,
         append_jira_issues_to_description=append_jira_issues_to_description,
         embed_testdata_to_description=embed_testdata_to_description,
+        sanitize=sanitize,
     )
 
     # Steps-based default (Zephyr export commonly uses steps)
     is_steps = (tc.test_script_type or "").lower() == "steps" or bool(tc.steps)
+    steps = sorted(sanitized.steps, key=_by_index)
+    step_scenarios = [_build_step_scenario(s) for s in steps]
     if is_steps:
-        scenario = flatten_steps_to_scenario(tc.steps)
+        scenario = _join_step_scenarios(steps, step_scenarios)
     else:
-        scenario = sanitize_html(tc.test_script_text)
+        scenario = sanitized.test_script_text
     if not scenario:
         # Required by TestY model: scenario must be non-empty
         scenario = f"(Imported from Zephyr {zephyr_key or 'unknown'}; no scenario content)"
@@ -235,14 +270,123 @@ def build_testy_payload_from_zephyr(
             {
                 "sort_order": s.index,
                 "name": f"Step {s.index + 1}",
-                "scenario": _build_step_scenario(s),
-                "expected": sanitize_html(s.expected_result),
+                "scenario": step_scenario,
+                "expected": s.expected_result,
             }
-            for s in sorted(tc.steps, key=lambda x: x.index)
+            for s, step_scenario in zip(steps, step_scenarios)
         ],
     }
 
 
+# Cases per batch handed to a mapping worker: enough to amortize the round trip, few
+# enough that the first payloads come back while the export is still being parsed.
+_MAP_BATCH_CASES = 200
+
+# Set in each mapping worker process by `_init_map_worker`.
+_worker_options: dict[str, bool] = {}
+_worker_cache: SanitizeCache | None = None
+
+
+def _init_map_worker(options: dict[str, bool], sanitize_cache_size: int) -> None:
+    global _worker_options, _worker_cache
+    _worker_options = options
+    _worker_cache = SanitizeCache(sanitize_cache_size) if sanitize_cache_size > 0 else None
+
+
+def _map_case_batch(data: bytes) -> bytes:
+    cache = _worker_cache
+    sanitize = cache or sanitize_html
+    hits, misses = (cache.hits, cache.misses) if cache is not None else (0, 0)
+    mapped = []
+    for tc in load_case_batch(data):
+        sanitized = sanitize_case(tc, sanitize)
+        payload = build_testy_payload_from_zephyr(
+            tc, sanitized=sanitized, sanitize=sanitize, **_worker_options
+        )
+        steps = [(s.index, s.description, s.test_data, s.expected_result) for s in sanitized.steps]
+        record = (sanitized.objective, sanitized.precondition, sanitized.test_script_text, steps)
+        mapped.append((record, payload))
+    if cache is not None:
+        hits, misses = cache.hits - hits, cache.misses - misses
+    return marshal.dumps((mapped, hits, misses))
+
+
+def _load_mapped_batch(
+    cases: list[ZephyrTestCase], data: bytes, sanitize_cache: SanitizeCache | None
+) -> Iterator[tuple[ZephyrTestCase, SanitizedTestCase, dict[str, Any]]]:
+    mapped, hits, misses = marshal.loads(data)
+    if sanitize_cache is not None:
+        sanitize_cache.hits += hits
+        sanitize_cache.misses += misses
+    for tc, ((objective, precondition, script, steps), payload) in zip(cases, mapped):
+        sanitized = SanitizedTestCase(
+            objective, precondition, script, tuple(SanitizedStep(*step) for step in steps)
+        )
+        yield tc, sanitized, payload
+
+
+def iter_testy_payloads(
+    cases: Iterable[ZephyrTestCase],
+    *,
+    prefix_with_zephyr_key: bool = True,
+    meta_labels: bool = True,
+    append_jira_issues_to_description: bool = True,
+    embed_testdata_to_description: bool = True,
+    sanitize_cache: SanitizeCache | None = None,
+    workers: int = 0,
+) -> Iterator[tuple[ZephyrTestCase, SanitizedTestCase, dict[str, Any]]]:
+    """
+    Yield `(tc, sanitized, payload)` for every case, in order, with the payload of
+    `build_testy_payload_from_zephyr`.
+
+    With `workers` > 0 the cases are mapped in batches by a pool of that many processes
+    while the caller consumes earlier payloads; only a bounded window of batches is in
+    flight. Each worker then keeps its own cache of `sanitize_cache.size` fragments, and
+    their hit and miss counts are added to `sanitize_cache`.
+
+    Case warnings and attachment matching stay with the caller: the duplicate-key and
+    folder checks read state it builds while streaming, and, given `sanitized`, the
+    rest costs a few percent of mapping a case, less than shipping the results back.
+    """
+    options = {
+        "prefix_with_zephyr_key": prefix_with_zephyr_key,
+        "meta_labels": meta_labels,
+        "append_jira_issues_to_description": append_jira_issues_to_description,
+        "embed_testdata_to_description": embed_testdata_to_description,
+    }
+    if workers <= 0:
+        sanitize = sanitize_cache or sanitize_html
+        for tc in cases:
+            sanitized = sanitize_case(tc, sanitize)
+            yield (
+                tc,
+                sanitized,
+                build_testy_payload_from_zephyr(
+                    tc, sanitized=sanitized, sanitize=sanitize, **options
+                ),
+            )
+        return
+
+    cache_size = sanitize_cache.size if sanitize_cache is not None else 0
+    pool = ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_map_worker, initargs=(options, cache_size)
+    )
+    pending: deque[tuple[list[ZephyrTestCase], Future[bytes]]] = deque()
+    case_iter = iter(cases)
+    try:
+        while batch := list(islice(case_iter, _MAP_BATCH_CASES)):
+            data = dump_case_batch(batch)
+            pending.append((batch, pool.submit(_map_case_batch, data)))
+            if len(pending) >= workers * 2:
+                done, future = pending.popleft()
+                yield from _load_mapped_batch(done, future.result(), sanitize_cache)
+        while pending:
+            done, future = pending.popleft()
+            yield from _load_mapped_batch(done, future.result(), sanitize_cache)
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
 def match_attachments_for_testcase(
     tc: ZephyrTestCase,
     zip_index: AttachmentZipIndex | None,
@@ -75,6 +75,14 @@ class ZephyrTestCase:
     steps: list[ZephyrStep] = field(default_factory=list)
 
 
+@dataclass(frozen=True, slots=True)
+class ZephyrExportCounts:
+    folders: int = 0
+    cases: int = 0
+    steps: int = 0
+    attachments: int = 0
+
+
 @dataclass(frozen=True, slots=True)
 class ZephyrParseResult:
     folders: dict[str, ZephyrFolder] = field(default_factory=dict)
@@ -1,16 +1,36 @@
 from __future__ import annotations
 
-from collections.abc import Iterator
+import bz2
+import codecs
+import gzip
+import io
+import lzma
+import mmap
+import os
+import re
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import partial
 from io import BytesIO
 from pathlib import Path
-from typing import BinaryIO, cast
+from typing import Any, BinaryIO, cast
 
 try:
     from defusedxml import ElementTree as DefusedET
 except ImportError:  # pragma: no cover - fallback for test environments without defusedxml
     import xml.etree.ElementTree as DefusedET
 
+try:
+    from lxml import etree as LxmlET
+except ImportError:  # pragma: no cover - lxml is an optional speedup
+    LxmlET = None
+
+from .filters import CaseFilter
+from .interning import make_interner
 from .models import (
+    ZephyrExportCounts,
     ZephyrFolder,
     ZephyrIssue,
     ZephyrStep,
@@ -19,6 +39,32 @@ from .models import (
     ZephyrTestDataRow,
     ZephyrTestDataTable,
 )
+from .records import dump_case_batch, load_case_batch
+
+PARSER_ENGINE_AUTO = "auto"
+PARSER_ENGINE_LXML = "lxml"
+PARSER_ENGINE_DEFUSEDXML = "defusedxml"
+PARSER_ENGINES = (PARSER_ENGINE_AUTO, PARSER_ENGINE_LXML, PARSER_ENGINE_DEFUSEDXML)
+
+# Elements the streaming readers act on; everything else is consumed inside them.
+_STREAM_TAGS = ("folder", "testCase")
+# Bytes read from a source and fed to a target parser at a time.
+FEED_CHUNK_SIZE = 64 * 1024
+# Target size of the case slices handed to one worker in `iter_test_cases_parallel`.
+_PARALLEL_BATCH_BYTES = 4 * 1024 * 1024
+
+# Byte-level case index: CDATA sections and comments are skipped whole so markup quoted
+# inside them never counts as a case boundary.
+_QUOTED_OPEN_RE = re.compile(rb"<!(?:(?P<cdata>\[CDATA\[)|--)")
+_TAG_END_RE = re.compile(rb"(?:[^>\"']|\"[^\"]*\"|'[^']*')*>")
+_XML_DECLARATION_RE = re.compile(rb"\s*<\?xml\s[^>]*\?>")
+_XML_ENCODING_RE = re.compile(rb"""\sencoding\s*=\s*["']([A-Za-z0-9._-]+)["']""")
+# Byte-order marks of the encodings the byte index cannot read; UTF-8's is harmless.
+_WIDE_BOMS = (b"\xff\xfe", b"\xfe\xff", b"\x00\x00\xfe\xff")
+
+
+class UnsafeXmlError(ValueError):
+    pass
 
 
 def _open_binary(source: str | Path | BinaryIO | bytes) -> BinaryIO:
@@ -29,30 +75,238 @@ def _open_binary(source: str | Path | BinaryIO | bytes) -> BinaryIO:
     return cast(BinaryIO, source)
 
 
-def parse_folders(source: str | Path | BinaryIO | bytes) -> dict[str, ZephyrFolder]:
+def resolve_parser_engine(engine: str | None = None) -> str:
+    """
+    Pick the XML engine: lxml when installed (or requested), defusedxml otherwise.
+    """
+    requested = (engine or PARSER_ENGINE_AUTO).strip().lower()
+    if requested not in PARSER_ENGINES:
+        raise ValueError(f"Unknown XML parser engine: {engine}")
+    if requested == PARSER_ENGINE_DEFUSEDXML:
+        return PARSER_ENGINE_DEFUSEDXML
+    if LxmlET is None:
+        if requested == PARSER_ENGINE_LXML:
+            raise RuntimeError("lxml is required for the 'lxml' XML parser engine")
+        return PARSER_ENGINE_DEFUSEDXML
+    return PARSER_ENGINE_LXML
+
+
+def _reject_entity_declarations(elem: Any) -> None:
+    # defusedxml refuses documents that declare entities; lxml only stops resolving them.
+    dtd = elem.getroottree().docinfo.internalDTD
+    if dtd is not None and any(True for _ in dtd.iterentities()):
+        raise UnsafeXmlError("Entity declarations are not allowed in Zephyr exports")
+
+
+def _iterparse_lxml(
+    f: BinaryIO,
+    events: tuple[str, ...],
+    tags: tuple[str, ...] | None,
+) -> Iterator[tuple[str, Any]]:
+    context = LxmlET.iterparse(
+        f,
+        events=events,
+        tag=tags,
+        resolve_entities=False,
+        no_network=True,
+        load_dtd=False,
+        remove_comments=True,
+        remove_pis=True,
+    )
+    checked = False
+    for event, elem in context:
+        if not checked:
+            _reject_entity_declarations(elem)
+            checked = True
+        yield event, elem
+
+
+def _iter_elements(
+    f: BinaryIO,
+    engine: str | None = None,
+    tags: tuple[str, ...] = _STREAM_TAGS,
+) -> Iterator[Any]:
+    """
+    Yield each complete `tags` element, then prune it from the tree.
+
+    Once the caller asks for the next element, the previous one is cleared and detached
+    from its parent together with anything skipped before it, so memory stays bounded
+    by the largest single element rather than growing with the export. Elements nested
+    in another `tags` element are kept until the enclosing one is done.
+    """
+    depth = 0
+    if resolve_parser_engine(engine) == PARSER_ENGINE_LXML:
+        # lxml filters on `tags` natively and knows each element's parent.
+        for event, elem in _iterparse_lxml(f, ("start", "end"), tags):
+            if event == "start":
+                depth += 1
+                continue
+            depth -= 1
+            yield elem
+            if depth == 0:
+                elem.clear()
+                parent = elem.getparent()
+                if parent is not None:
+                    while elem.getprevious() is not None:
+                        del parent[0]
+                    parent.remove(elem)
+        return
+
+    # ElementTree has no parent pointers; track open elements to find them.
+    open_elems: list[Any] = []
+    for event, elem in DefusedET.iterparse(f, events=("start", "end")):
+        if event == "start":
+            open_elems.append(elem)
+            if elem.tag in tags:
+                depth += 1
+            continue
+        open_elems.pop()
+        if elem.tag in tags:
+            depth -= 1
+            yield elem
+        if depth == 0 and open_elems:
+            elem.clear()
+            open_elems[-1].remove(elem)
+
+
+class _LxmlEntityGuard:
+    """
+    An lxml target parser that refuses entity declarations, as `_iterparse_lxml` does.
+
+    Targets get no view of the DTD internal subset, and lxml expands declared entities
+    for them even with resolve_entities=False. Until the root element starts, the same
+    bytes also go through a pull parser, whose tree shows the declarations.
+    """
+
+    __slots__ = ("_parser", "_probe")
+
+    def __init__(self, parser: Any) -> None:
+        self._parser = parser
+        self._probe = LxmlET.XMLPullParser(
+            events=("start",), resolve_entities=False, no_network=True, load_dtd=False
+        )
+
+    def feed(self, data: bytes) -> None:
+        probe = self._probe
+        if probe is not None:
+            probe.feed(data)
+            for _, elem in probe.read_events():
+                _reject_entity_declarations(elem)
+                self._probe = None
+                break
+        self._parser.feed(data)
+
+    def close(self) -> Any:
+        self._probe = None
+        return self._parser.close()
+
+
+def new_target_parser(target: Any, engine: str | None = None) -> Any:
+    """
+    Build a hardened XML parser that feeds its events to `target`'s start/end/data
+    callbacks. Documents declaring entities are refused with either engine.
+    """
+    if resolve_parser_engine(engine) == PARSER_ENGINE_LXML:
+        return _LxmlEntityGuard(
+            LxmlET.XMLParser(
+                target=target,
+                resolve_entities=False,
+                no_network=True,
+                load_dtd=False,
+                remove_comments=True,
+                remove_pis=True,
+            )
+        )
+    parser = DefusedET.XMLParser(target=target)
+    # Route element events from expat straight to the target, skipping the per-event
+    # Python wrappers of XMLParser; the entity/DTD guards defusedxml installed stay.
+    expat = parser.parser
+    expat.ordered_attributes = False
+    expat.StartElementHandler = target.start
+    expat.EndElementHandler = target.end
+    expat.CharacterDataHandler = getattr(target, "data", None)
+    return parser
+
+
+def _new_case_parser(
+    engine: str | None = None,
+    *,
+    collect_folders: bool = False,
+    case_filter: CaseFilter | None = None,
+) -> tuple[_TestCaseBuilder, Any]:
+    builder = _TestCaseBuilder(collect_folders=collect_folders, case_filter=case_filter)
+    return builder, new_target_parser(builder, engine)
+
+
+def _feed_case_parser(
+    builder: _TestCaseBuilder,
+    parser: Any,
+    chunks: Iterable[bytes],
+) -> Iterator[list[ZephyrTestCase | ZephyrFolder]]:
+    for chunk in chunks:
+        parser.feed(chunk)
+        ready = builder.take_ready()
+        if ready:
+            yield ready
+    parser.close()
+    ready = builder.take_ready()
+    if ready:
+        yield ready
+
+
+def _iter_built(
+    f: BinaryIO,
+    *,
+    engine: str | None = None,
+    collect_folders: bool = False,
+    case_filter: CaseFilter | None = None,
+) -> Iterator[list[ZephyrTestCase | ZephyrFolder]]:
+    """
+    Push `f` through a parser whose target is a `_TestCaseBuilder`, yielding its output.
+
+    The source is fed in chunks, and after each one the items the builder completed are
+    handed out in document order; nothing but the currently open case is held.
+    """
+    builder, parser = _new_case_parser(
+        engine, collect_folders=collect_folders, case_filter=case_filter
+    )
+    yield from _feed_case_parser(builder, parser, iter(partial(f.read, FEED_CHUNK_SIZE), b""))
+
+
+def _folder_from_attrib(attrib: Any) -> ZephyrFolder | None:
+    full_path = (attrib.get("fullPath") or "").strip()
+    if not full_path:
+        return None
+    index_raw = attrib.get("index")
+    idx = None
+    if index_raw is not None:
+        try:
+            idx = int(index_raw)
+        except ValueError:
+            idx = None
+    return ZephyrFolder(full_path=full_path, index=idx)
+
+
+def parse_folders(
+    source: str | Path | BinaryIO | bytes,
+    *,
+    engine: str | None = None,
+) -> dict[str, ZephyrFolder]:
     """
     Parse `<folders>` into a mapping full_path -> ZephyrFolder.
 
-    Streaming requirement: use iterparse and clear elements.
+    Streaming requirement: use iterparse and prune elements.
     """
     folders: dict[str, ZephyrFolder] = {}
     f = _open_binary(source)
     close_me = isinstance(source, (str, Path))
     try:
         # iterparse yields elements; we watch for end of <folder>
-        for event, elem in DefusedET.iterparse(f, events=("end",)):
+        for elem in _iter_elements(f, engine=engine):
             if elem.tag == "folder":
-                full_path = (elem.attrib.get("fullPath") or "").strip()
-                index_raw = elem.attrib.get("index")
-                idx = None
-                if index_raw is not None:
-                    try:
-                        idx = int(index_raw)
-                    except ValueError:
-                        idx = None
-                if full_path:
-                    folders[full_path] = ZephyrFolder(full_path=full_path, index=idx)
-            elem.clear()
+                folder = _folder_from_attrib(elem.attrib)
+                if folder is not None:
+                    folders[folder.full_path] = folder
         return folders
     finally:
         if close_me:
@@ -61,227 +315,894 @@ def parse_folders(source: str | Path | BinaryIO | bytes) -> dict[str, ZephyrFold
 
 def parse_folders_and_duplicate_key_counts(
     source: str | Path | BinaryIO | bytes,
+    *,
+    engine: str | None = None,
+    case_filter: CaseFilter | None = None,
 ) -> tuple[dict[str, ZephyrFolder], dict[str, int]]:
     """
     Parse `<folders>` and count `<testCase key="...">` in a single streaming pass.
+
+    With a `case_filter`, only keys of cases it keeps are counted; folders are all
+    returned.
     """
     folders: dict[str, ZephyrFolder] = {}
     duplicate_key_counts: dict[str, int] = {}
     f = _open_binary(source)
     close_me = isinstance(source, (str, Path))
     try:
-        for event, elem in DefusedET.iterparse(f, events=("end",)):
+        for elem in _iter_elements(f, engine=engine):
             if elem.tag == "folder":
-                full_path = (elem.attrib.get("fullPath") or "").strip()
-                index_raw = elem.attrib.get("index")
-                idx = None
-                if index_raw is not None:
-                    try:
-                        idx = int(index_raw)
-                    except ValueError:
-                        idx = None
-                if full_path:
-                    folders[full_path] = ZephyrFolder(full_path=full_path, index=idx)
+                folder = _folder_from_attrib(elem.attrib)
+                if folder is not None:
+                    folders[folder.full_path] = folder
             elif elem.tag == "testCase":
                 key = (elem.attrib.get("key") or "").strip()
-                if key:
+                if key and (case_filter is None or _element_matches(elem, case_filter)):
                     duplicate_key_counts[key] = duplicate_key_counts.get(key, 0) + 1
-            elem.clear()
         return folders, duplicate_key_counts
     finally:
         if close_me:
             f.close()
 
 
-def iter_test_cases(source: str | Path | BinaryIO | bytes) -> Iterator[ZephyrTestCase]:
+def _element_matches(elem: Any, case_filter: CaseFilter) -> bool:
+    # The checks the case builder makes, on a complete but unbuilt `<testCase>`.
+    return (
+        case_filter.match_key(_clean_text(elem.get("key")))
+        and case_filter.match_folder(_clean_text(elem.findtext("folder")))
+        and case_filter.match_updated(_clean_text(elem.findtext("updatedOn")))
+    )
+
+
+def count_export(
+    source: str | Path | BinaryIO | bytes,
+    *,
+    engine: str | None = None,
+) -> ZephyrExportCounts:
+    """
+    Count folders, test cases, steps and attachment references without building cases.
+
+    A preflight for progress totals and size limits: the parser target sees element
+    starts and ends only (no text), so this runs well ahead of `iter_test_cases`.
+    Counts follow the parser: folders are unique `fullPath` entries, cases are
+    top-level `<testCase>` elements, steps and attachments are those directly under a
+    case's `<testScript><steps>` and `<attachments>`.
+    """
+    counter = _ExportCounter()
+    parser = new_target_parser(counter, engine)
+    f = _open_binary(source)
+    close_me = isinstance(source, (str, Path))
+    try:
+        for chunk in iter(partial(f.read, FEED_CHUNK_SIZE), b""):
+            parser.feed(chunk)
+        parser.close()
+    finally:
+        if close_me:
+            f.close()
+    return ZephyrExportCounts(
+        folders=len(counter.folder_paths),
+        cases=counter.cases,
+        steps=counter.steps,
+        attachments=counter.attachments,
+    )
+
+
+def iter_test_cases(
+    source: str | Path | BinaryIO | bytes,
+    *,
+    folders: dict[str, ZephyrFolder] | None = None,
+    engine: str | None = None,
+    case_filter: CaseFilter | None = None,
+) -> Iterator[ZephyrTestCase]:
     """
     Yield ZephyrTestCase objects streaming from `<testCases>`.
 
-    This is intentionally partial; the loop will extend it (steps, labels, issues, etc.).
+    When `folders` is given, `<folder>` elements are collected into it while streaming,
+    so callers can read folders and cases in a single pass over the export.
+
+    `engine` selects the XML backend (see `resolve_parser_engine`); both produce
+    identical ZephyrTestCase streams.
+
+    With a `case_filter`, only matching cases (and, into `folders`, matching folders)
+    come out. Cases are rejected as soon as their key attribute, `<folder>` or
+    `<updatedOn>` rules them out, and the rest of a rejected case is skipped unbuilt.
     """
     f = _open_binary(source)
     close_me = isinstance(source, (str, Path))
     try:
-        for event, elem in DefusedET.iterparse(f, events=("end",)):
-            if elem.tag != "testCase":
+        for ready in _iter_built(
+            f, engine=engine, collect_folders=folders is not None, case_filter=case_filter
+        ):
+            for item in ready:
+                if isinstance(item, ZephyrFolder):
+                    folders[item.full_path] = item
+                else:
+                    yield item
+    finally:
+        if close_me:
+            f.close()
+
+
+@contextmanager
+def _mapped_source(source: str | Path | BinaryIO | bytes) -> Iterator[Any]:
+    # Random access to the whole export: memory-mapped when it is a real file.
+    if isinstance(source, (bytes, bytearray)):
+        yield source
+        return
+    if isinstance(source, (str, Path)):
+        with open(source, "rb") as handle, _mapped_source(handle) as buffer:
+            yield buffer
+        return
+    stream = cast(BinaryIO, source)
+    try:
+        fileno = stream.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        fileno = None
+    if isinstance(stream, (gzip.GzipFile, bz2.BZ2File, lzma.LZMAFile)):
+        # Their fileno() is the compressed file's, which holds no XML to map.
+        fileno = None
+    if fileno is None or os.fstat(fileno).st_size == 0:
+        yield stream.read()
+        return
+    with mmap.mmap(fileno, 0, access=mmap.ACCESS_READ) as buffer:
+        yield buffer
+
+
+def _quoted_section_end(buffer: Any, pos: int, at: int) -> int:
+    """
+    Return where the CDATA section or comment enclosing `at` ends, or -1 if `at` is
+    outside one. `pos` must itself be outside any.
+    """
+    find = buffer.find
+    while (match := _QUOTED_OPEN_RE.search(buffer, pos, at)) is not None:
+        closer = find(b"]]>" if match.lastgroup == "cdata" else b"-->", match.end())
+        if closer == -1 or closer >= at:
+            return len(buffer) if closer == -1 else closer + 3
+        pos = closer + 3
+    return -1
+
+
+def _maybe_quoted(buffer: Any, pos: int, at: int) -> bool:
+    # Cheap test: only an opener after `pos` whose terminator is not yet in sight can
+    # enclose `at`. False positives are settled by `_quoted_section_end`.
+    for opener, closer in ((b"<![CDATA[", b"]]>"), (b"<!--", b"-->")):
+        last = buffer.rfind(opener, pos, at)
+        if last != -1 and buffer.find(closer, last, at) == -1:
+            return True
+    return False
+
+
+def iter_test_case_ranges(buffer: Any) -> Iterator[tuple[int, int]]:
+    """
+    Yield the `[start, end)` byte range of every outermost `<testCase>` in `buffer`.
+
+    A byte-level scan, no XML parsing: `buffer` is any bytes-like object (bytes, mmap).
+    Cases nested inside another case are part of the outer range, which matches what
+    `iter_test_cases` yields.
+    """
+    find = buffer.find
+    size = len(buffer)
+    depth = 0
+    begin = 0
+    # `pos` only ever moves to points known to be outside CDATA/comments; `cursor` is
+    # where the search for the next candidate resumes.
+    pos = 0
+    cursor = 0
+    while (at := find(b"testCase", cursor)) != -1:
+        after = at + 8
+        if after >= size:
+            return
+        cursor = after
+        closing = buffer[at - 1] == 0x2F
+        start = at - 2 if closing else at - 1
+        if (
+            start < pos
+            or buffer[start] != 0x3C
+            or buffer[after] not in b" \t\r\n/>"
+            or (closing and buffer[after] == 0x2F)
+        ):
+            continue
+        if _maybe_quoted(buffer, pos, start):
+            quoted_end = _quoted_section_end(buffer, pos, start)
+            if quoted_end != -1:
+                pos = cursor = quoted_end
                 continue
+        if buffer[after] == 0x3E:
+            tag_end = after + 1
+        else:
+            # Attribute values may contain `>`; skip them as quoted strings.
+            end_match = _TAG_END_RE.match(buffer, after)
+            if end_match is None:
+                return
+            tag_end = end_match.end()
+        pos = cursor = tag_end
+        if closing:
+            if depth:
+                depth -= 1
+                if depth == 0:
+                    yield begin, tag_end
+        elif buffer[tag_end - 2] == 0x2F:  # `<testCase .../>`
+            if depth == 0:
+                yield start, tag_end
+        else:
+            if depth == 0:
+                begin = start
+            depth += 1
 
-            def clean_text(text: str | None) -> str | None:
-                if text is None:
-                    return None
-                cleaned = text.strip()
-                return cleaned if cleaned else None
-
-            def parse_int(value: str | None) -> int | None:
-                if value is None:
-                    return None
-                try:
-                    return int(value)
-                except ValueError:
-                    return None
-
-            zephyr_id = clean_text(elem.attrib.get("id"))
-            key = clean_text(elem.attrib.get("key"))
-            param_type = clean_text(elem.attrib.get("paramType"))
-
-            # helper: find direct children by tag
-            def text_of(tag: str) -> str | None:
-                child = elem.find(tag)
-                if child is None:
-                    return None
-                return clean_text(child.text)
-
-            def text_of_child(parent: DefusedET.Element, tag: str) -> str | None:
-                child = parent.find(tag)
-                if child is None:
-                    return None
-                return clean_text(child.text)
-
-            labels: list[str] = []
-            labels_elem = elem.find("labels")
-            if labels_elem is not None:
-                for label_elem in labels_elem.findall("label"):
-                    label = clean_text(label_elem.text)
-                    if label:
-                        labels.append(label)
-
-            issues: list[ZephyrIssue] = []
-            issues_elem = elem.find("issues")
-            if issues_elem is not None:
-                for issue_elem in issues_elem.findall("issue"):
-                    issue_key = text_of_child(issue_elem, "key")
-                    if issue_key:
-                        issues.append(
-                            ZephyrIssue(
-                                key=issue_key,
-                                summary=text_of_child(issue_elem, "summary"),
-                            )
-                        )
-
-            attachments: list[str] = []
-            attachments_elem = elem.find("attachments")
-            if attachments_elem is not None:
-                for attachment_elem in attachments_elem.findall("attachment"):
-                    name = text_of_child(attachment_elem, "name")
-                    if name:
-                        attachments.append(name)
-
-            parameters: list[str] = []
-            parameters_elem = elem.find("parameters")
-            if parameters_elem is not None:
-                param_entries: list[tuple[int | None, int, str]] = []
-                for order, param_elem in enumerate(parameters_elem.findall("parameter")):
-                    name = text_of_child(param_elem, "name")
-                    if not name:
-                        continue
-                    idx = parse_int(param_elem.attrib.get("index"))
-                    param_entries.append((idx, order, name))
-                if param_entries:
-                    if any(idx is not None for idx, _, _ in param_entries):
-                        param_entries.sort(
-                            key=lambda entry: (
-                                entry[0] is None,
-                                entry[0] if entry[0] is not None else entry[1],
-                                entry[1],
-                            )
-                        )
-                    parameters = [name for _, _, name in param_entries]
-
-            test_data_wrapper: ZephyrTestDataTable | None = None
-            wrapper_elem = elem.find("testDataWrapper")
-            if wrapper_elem is not None:
-                rows: list[ZephyrTestDataRow] = []
-                for row_elem in wrapper_elem.findall("testDataRow"):
-                    columns_elem = row_elem.find("testDataColumns")
-                    if columns_elem is None:
-                        continue
-                    cell_entries: list[tuple[int | None, int, ZephyrTestDataCell]] = []
-                    for order, cell_elem in enumerate(columns_elem.findall("testData")):
-                        idx = parse_int(cell_elem.attrib.get("index"))
-                        name = text_of_child(cell_elem, "name")
-                        data_type = text_of_child(cell_elem, "type")
-                        value = text_of_child(cell_elem, "value")
-                        if idx is None and not (name or data_type or value):
-                            continue
-                        cell_entries.append(
-                            (
-                                idx,
-                                order,
-                                ZephyrTestDataCell(
-                                    index=idx,
-                                    name=name,
-                                    data_type=data_type,
-                                    value=value,
-                                ),
-                            )
-                        )
-                    if cell_entries:
-                        if any(idx is not None for idx, _, _ in cell_entries):
-                            cell_entries.sort(
-                                key=lambda entry: (
-                                    entry[0] is None,
-                                    entry[0] if entry[0] is not None else entry[1],
-                                    entry[1],
-                                )
-                            )
-                        rows.append(ZephyrTestDataRow(cells=[cell for _, _, cell in cell_entries]))
-                if rows:
-                    test_data_wrapper = ZephyrTestDataTable(rows=rows)
-
-            test_script_type = None
-            test_script_text = None
-            steps: list[ZephyrStep] = []
-            test_script_elem = elem.find("testScript")
-            if test_script_elem is not None:
-                test_script_type = clean_text(test_script_elem.attrib.get("type"))
-                text_elem = test_script_elem.find("text")
-                if text_elem is not None:
-                    test_script_text = clean_text(text_elem.text)
-                else:
-                    test_script_text = clean_text(test_script_elem.text)
-
-                steps_elem = test_script_elem.find("steps")
-                if steps_elem is not None:
-                    for order, step_elem in enumerate(steps_elem.findall("step")):
-                        idx = parse_int(step_elem.attrib.get("index"))
-                        if idx is None:
-                            idx = order
-                        steps.append(
-                            ZephyrStep(
-                                index=idx,
-                                description=text_of_child(step_elem, "description"),
-                                expected_result=text_of_child(step_elem, "expectedResult"),
-                                test_data=text_of_child(step_elem, "testData"),
-                            )
-                        )
-
-            tc = ZephyrTestCase(
-                zephyr_id=zephyr_id,
-                key=key,
-                name=text_of("name"),
-                folder=text_of("folder"),
-                objective=text_of("objective"),
-                precondition=text_of("precondition"),
-                status=text_of("status"),
-                priority=text_of("priority"),
-                owner=text_of("owner"),
-                created_by=text_of("createdBy"),
-                created_on=text_of("createdOn"),
-                updated_by=text_of("updatedBy"),
-                updated_on=text_of("updatedOn"),
-                param_type=param_type,
-                parameters=parameters,
-                test_data_wrapper=test_data_wrapper,
-                labels=labels,
-                issues=issues,
-                attachments=attachments,
-                test_script_type=test_script_type,
-                test_script_text=test_script_text,
-                steps=steps,
+
+def _parse_case_batch(document: bytes, engine: str, case_filter: CaseFilter | None) -> bytes:
+    cases = iter_test_cases(document, engine=engine, case_filter=case_filter)
+    return dump_case_batch(cases)
+
+
+def _xml_prolog(head: Any) -> bytes:
+    # The XML declaration carries the encoding; case slices parsed on their own need it.
+    declaration = _XML_DECLARATION_RE.match(head)
+    return declaration.group().lstrip() if declaration else b""
+
+
+def _byte_scan_supported(buffer: Any) -> bool:
+    """
+    Tell whether `iter_test_case_ranges` sees the same cases in `buffer` as a parse.
+
+    The scan matches ASCII bytes, so the export must be in an ASCII-compatible
+    encoding, and it compares bare tag names, so no namespace may be declared before
+    the first case: the cases would then not be `<testCase>` elements to the parser.
+    """
+    head = buffer[:1024]
+    if head.startswith(_WIDE_BOMS) or b"\x00" in head[:4]:
+        return False
+    declaration = _XML_DECLARATION_RE.match(head)
+    encoding = _XML_ENCODING_RE.search(declaration.group()) if declaration else None
+    if encoding is not None:
+        try:
+            codec = codecs.lookup(encoding.group(1).decode("ascii"))
+        except LookupError:
+            return False
+        if "<testCase/>".encode(codec.name) != b"<testCase/>":
+            return False
+    first = next(iter_test_case_ranges(buffer), None)
+    prefix_end = first[0] if first is not None else len(buffer)
+    return buffer.find(b"xmlns", 0, prefix_end) == -1
+
+
+def _iter_checked_ranges(
+    buffer: Any,
+    engine: str,
+    folders: dict[str, ZephyrFolder] | None,
+    case_filter: CaseFilter | None = None,
+) -> Iterator[tuple[int, int]]:
+    """
+    Yield `iter_test_case_ranges(buffer)`, feeding everything between the cases to the
+    regular hardened parser.
+
+    That validates the document skeleton (and refuses DTDs exactly like a full parse)
+    and, when `folders` is given, collects `<folder>` entries into it as the scan goes.
+    """
+    skeleton, parser = _new_case_parser(
+        engine, collect_folders=folders is not None, case_filter=case_filter
+    )
+
+    def feed(chunk: bytes | None) -> None:
+        if chunk is None:
+            parser.close()
+        else:
+            parser.feed(chunk)
+        for item in skeleton.take_ready():
+            if isinstance(item, ZephyrFolder):
+                folders[item.full_path] = item
+                continue
+            # A case the byte scan did not see would otherwise be lost silently; the
+            # export is malformed, not the caller's argument, hence ValueError.
+            raise ValueError("Zephyr export has a testCase the byte index missed")
+
+    pos = 0
+    for start, end in iter_test_case_ranges(buffer):
+        feed(buffer[pos:start])
+        pos = end
+        yield start, end
+    feed(buffer[pos:])
+    feed(None)
+
+
+def iter_test_case_spans(
+    source: str | Path | BinaryIO | bytes,
+    *,
+    folders: dict[str, ZephyrFolder] | None = None,
+    engine: str | None = None,
+) -> Iterator[tuple[int, int, ZephyrTestCase]]:
+    """
+    Yield `(start, end, case)` for every case, with its byte range in `source`.
+
+    The cases are those of `iter_test_cases`, in the same order; the ranges can be
+    handed back to `read_test_cases_at` to parse single cases again without a scan.
+    """
+    engine = resolve_parser_engine(engine)
+    with _mapped_source(source) as buffer:
+        if not _byte_scan_supported(buffer):
+            raise ValueError(
+                "Byte ranges need an ASCII-compatible Zephyr export without namespaces"
             )
+        prolog = _xml_prolog(buffer)
+        for start, end in _iter_checked_ranges(buffer, engine, folders):
+            for tc in iter_test_cases(prolog + buffer[start:end], engine=engine):
+                yield start, end, tc
 
-            yield tc
-            elem.clear()
+
+def read_test_cases_at(
+    source: str | Path | BinaryIO,
+    ranges: Iterable[tuple[int, int]],
+    *,
+    engine: str | None = None,
+) -> Iterator[ZephyrTestCase]:
+    """
+    Parse only the given `(start, end)` byte ranges of `source`, one seek each.
+
+    Ranges come from `iter_test_case_ranges`/`iter_test_case_spans` over the same
+    content; cases are yielded in the order of `ranges`.
+    """
+    engine = resolve_parser_engine(engine)
+    f = _open_binary(source)
+    close_me = isinstance(source, (str, Path))
+    try:
+        f.seek(0)
+        prolog = _xml_prolog(f.read(1024))
+        for start, end in ranges:
+            f.seek(start)
+            yield from iter_test_cases(prolog + f.read(end - start), engine=engine)
     finally:
         if close_me:
             f.close()
+
+
+def iter_test_cases_parallel(
+    source: str | Path | BinaryIO | bytes,
+    *,
+    folders: dict[str, ZephyrFolder] | None = None,
+    workers: int | None = None,
+    engine: str | None = None,
+    case_filter: CaseFilter | None = None,
+) -> Iterator[ZephyrTestCase]:
+    """
+    Yield the same ZephyrTestCase stream as `iter_test_cases`, parsed by worker processes.
+
+    `iter_test_case_ranges` indexes the export, the case slices are batched into small
+    standalone documents and parsed by a pool of `workers` processes (all CPUs when None;
+    1 parses in-process), and results come back in document order. Only a bounded
+    window of batches is in flight at a time.
+
+    Everything outside the cases goes through the regular hardened parser, which
+    validates the document skeleton and, when `folders` is given, collects `<folder>`
+    entries into it. That scan runs ahead of the yielded cases, so `folders` can
+    already hold entries declared after the current case.
+
+    The export is memory-mapped when `source` is a path or a real file; other streams
+    are read into memory. `case_filter` applies as in `iter_test_cases`, in the workers.
+    Exports the byte index cannot read (see `_byte_scan_supported`) are parsed
+    sequentially with `iter_test_cases` instead.
+    """
+    engine = resolve_parser_engine(engine)
+    workers = workers or os.cpu_count() or 1
+    with _mapped_source(source) as buffer:
+        if not _byte_scan_supported(buffer):
+            # mmap objects read like files; bytes are wrapped by `_open_binary`.
+            yield from iter_test_cases(
+                buffer, folders=folders, engine=engine, case_filter=case_filter
+            )
+            return
+        prolog = _xml_prolog(buffer)
+
+        def batches() -> Iterator[bytes]:
+            batch: list[bytes] = []
+            size = 0
+            for start, end in _iter_checked_ranges(buffer, engine, folders, case_filter):
+                batch.append(buffer[start:end])
+                size += end - start
+                if size >= _PARALLEL_BATCH_BYTES:
+                    yield b"".join((prolog, b"<testCases>", *batch, b"</testCases>"))
+                    batch = []
+                    size = 0
+            if batch:
+                yield b"".join((prolog, b"<testCases>", *batch, b"</testCases>"))
+
+        if workers == 1:
+            for document in batches():
+                yield from iter_test_cases(document, engine=engine, case_filter=case_filter)
+            return
+
+        pool = ProcessPoolExecutor(max_workers=workers)
+        pending: deque[Future[bytes]] = deque()
+        try:
+            for document in batches():
+                pending.append(pool.submit(_parse_case_batch, document, engine, case_filter))
+                if len(pending) >= workers * 2:
+                    yield from load_case_batch(pending.popleft().result())
+            while pending:
+                yield from load_case_batch(pending.popleft().result())
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _clean_text(text: str | None) -> str | None:
+    if text is None:
+        return None
+    cleaned = text.strip()
+    return cleaned if cleaned else None
+
+
+def _parse_int(value: str | None) -> int | None:
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def _in_index_order(entries: list[tuple[int | None, int, Any]]) -> list[Any]:
+    # Explicit `index` attributes win; entries without one keep their document order.
+    if any(idx is not None for idx, _, _ in entries):
+        entries.sort(
+            key=lambda entry: (
+                entry[0] is None,
+                entry[0] if entry[0] is not None else entry[1],
+                entry[1],
+            )
+        )
+    return [item for _, _, item in entries]
+
+
+class _TestCaseBuilder:
+    """
+    Parser target that builds ZephyrTestCase objects from element events.
+
+    The XML parser calls `start`/`data`/`end` directly (the ElementTree target protocol),
+    so no element tree is built at all. Events dispatch on (parent tag, tag) through
+    `_CASE_EVENTS`; elements outside that table, and repeats of single-valued children,
+    are skipped with their whole subtree, which keeps the first-match semantics of
+    `find`. Finished cases, and `<folders>` entries when `collect_folders` is set, are
+    queued in document order for the caller to drain with `take_ready`.
+    """
+
+    __slots__ = (
+        "_attachments",
+        "_cells",
+        "_collect_folders",
+        "_fields",
+        "_filter",
+        "_intern",
+        "_issues",
+        "_labels",
+        "_order",
+        "_parameters",
+        "_ready",
+        "_record",
+        "_rows",
+        "_script",
+        "_stack",
+        "_steps",
+        "_text",
+    )
+
+    _fields: dict[str, str | None]
+    _record: dict[str, Any]
+    _order: int
+    _labels: list[str] | None
+    _issues: list[ZephyrIssue] | None
+    _attachments: list[str] | None
+    _parameters: list[tuple[int | None, int, str]] | None
+    _rows: list[ZephyrTestDataRow] | None
+    _cells: list[tuple[int | None, int, ZephyrTestDataCell]] | None
+    _script: dict[str, str | None] | None
+    _steps: list[ZephyrStep] | None
+
+    def __init__(
+        self,
+        *,
+        collect_folders: bool = False,
+        case_filter: CaseFilter | None = None,
+    ) -> None:
+        self._collect_folders = collect_folders
+        self._filter = case_filter
+        # Shared by every case this builder produces; see `_INTERNED_CASE_FIELDS`.
+        self._intern = make_interner()
+        self._ready: list[ZephyrTestCase | ZephyrFolder] = []
+        # Per open element: its children's handlers, its end handler and its leading
+        # text (the text before its first child, i.e. `elem.text`), or None when the
+        # element is skipped.
+        self._stack: list[tuple[dict[str, Any], Any, list[str]] | None] = []
+        self._text: list[str] = []
+        self._fields = {}
+        self._record = self._fields
+        self._order = 0
+
+    def start(self, tag: str, attrib: dict[str, str]) -> None:
+        # Text after this point belongs to the new element, not to its parent.
+        self._text = text = []
+        stack = self._stack
+        if stack:
+            parent = stack[-1]
+            if parent is None:
+                stack.append(None)
+                return
+            handlers = parent[0].get(tag)
+        elif tag == "testCase":
+            handlers = _CASE_ROOT
+        else:
+            if tag == "folder" and self._collect_folders:
+                # `<folders>` entries; a case's own `<folder>` child is inside the case.
+                folder = _folder_from_attrib(attrib)
+                if folder is not None and (
+                    self._filter is None or self._filter.match_folder(folder.full_path)
+                ):
+                    self._ready.append(folder)
+            return
+        if handlers is None:
+            stack.append(None)
+            return
+        on_start, on_end, children = handlers
+        if on_start is not None and on_start(self, attrib) is False:
+            stack.append(None)
+            return
+        stack.append((children, on_end, text))
+
+    def data(self, data: str) -> None:
+        self._text.append(data)
+
+    def end(self, tag: str) -> None:
+        # Any tail text that follows lands in this element's spent buffer and is dropped.
+        stack = self._stack
+        if not stack:
+            return
+        entry = stack.pop()
+        if entry is not None and entry[1] is not None:
+            entry[1](self, entry[2])
+
+    def close(self) -> None:
+        return None
+
+    def take_ready(self) -> list[ZephyrTestCase | ZephyrFolder]:
+        ready = self._ready
+        self._ready = []
+        return ready
+
+    # <testCase>
+    def _start_case(self, attrib: dict[str, str]) -> bool:
+        key = _clean_text(attrib.get("key"))
+        if self._filter is not None and not self._filter.match_key(key):
+            return False
+        # Attributes live beside the child texts; no case-level child uses these names.
+        self._fields = {
+            "@id": _clean_text(attrib.get("id")),
+            "@key": key,
+            "@paramType": self._intern(_clean_text(attrib.get("paramType"))),
+        }
+        self._record = self._fields
+        self._labels = None
+        self._issues = None
+        self._attachments = None
+        self._parameters = None
+        self._rows = None
+        self._cells = None
+        self._script = None
+        self._steps = None
+        return True
+
+    def _end_case(self, text: list[str]) -> None:
+        fields = self._fields
+        get = fields.get
+        case_filter = self._filter
+        if case_filter is not None and not (
+            case_filter.match_folder(get("folder")) and case_filter.match_updated(get("updatedOn"))
+        ):
+            # Also covers cases that have no `<folder>`/`<updatedOn>` element at all.
+            self._fields = {}
+            self._record = self._fields
+            return
+        script = self._script or {}
+        self._ready.append(
+            ZephyrTestCase(
+                zephyr_id=fields["@id"],
+                key=fields["@key"],
+                name=get("name"),
+                folder=get("folder"),
+                objective=get("objective"),
+                precondition=get("precondition"),
+                status=get("status"),
+                priority=get("priority"),
+                owner=get("owner"),
+                created_by=get("createdBy"),
+                created_on=get("createdOn"),
+                updated_by=get("updatedBy"),
+                updated_on=get("updatedOn"),
+                param_type=fields["@paramType"],
+                parameters=_in_index_order(self._parameters) if self._parameters else [],
+                test_data_wrapper=ZephyrTestDataTable(rows=self._rows) if self._rows else None,
+                labels=self._labels or [],
+                issues=self._issues or [],
+                attachments=self._attachments or [],
+                test_script_type=script.get("type"),
+                test_script_text=script.get("text"),
+                steps=self._steps or [],
+            )
+        )
+        self._fields = {}
+        self._record = self._fields
+
+    def _start_labels(self, attrib: dict[str, str]) -> bool:
+        if self._labels is not None:
+            return False
+        self._labels = []
+        return True
+
+    def _end_label(self, text: list[str]) -> None:
+        label = self._intern(_clean_text("".join(text)))
+        if label:
+            self._labels.append(label)
+
+    def _start_issues(self, attrib: dict[str, str]) -> bool:
+        if self._issues is not None:
+            return False
+        self._issues = []
+        return True
+
+    def _start_record(self, attrib: dict[str, str]) -> None:
+        # Repeated child of a list container: remember its index and sibling position.
+        self._record = {"index": _parse_int(attrib.get("index")), "order": self._order}
+        self._order += 1
+
+    def _end_issue(self, text: list[str]) -> None:
+        record = self._record
+        self._record = self._fields
+        issue_key = record.get("key")
+        if issue_key:
+            self._issues.append(ZephyrIssue(key=issue_key, summary=record.get("summary")))
+
+    def _start_attachments(self, attrib: dict[str, str]) -> bool:
+        if self._attachments is not None:
+            return False
+        self._attachments = []
+        return True
+
+    def _end_attachment(self, text: list[str]) -> None:
+        record = self._record
+        self._record = self._fields
+        name = record.get("name")
+        if name:
+            self._attachments.append(name)
+
+    def _start_parameters(self, attrib: dict[str, str]) -> bool:
+        if self._parameters is not None:
+            return False
+        self._parameters = []
+        self._order = 0
+        return True
+
+    def _end_parameter(self, text: list[str]) -> None:
+        record = self._record
+        self._record = self._fields
+        name = record.get("name")
+        if name:
+            self._parameters.append((record["index"], record["order"], name))
+
+    def _start_wrapper(self, attrib: dict[str, str]) -> bool:
+        if self._rows is not None:
+            return False
+        self._rows = []
+        return True
+
+    def _start_row(self, attrib: dict[str, str]) -> None:
+        self._cells = None
+
+    def _end_row(self, text: list[str]) -> None:
+        if self._cells:
+            self._rows.append(ZephyrTestDataRow(cells=_in_index_order(self._cells)))
+        self._cells = None
+
+    def _start_columns(self, attrib: dict[str, str]) -> bool:
+        if self._cells is not None:
+            return False
+        self._cells = []
+        self._order = 0
+        return True
+
+    def _end_cell(self, text: list[str]) -> None:
+        record = self._record
+        self._record = self._fields
+        idx = record["index"]
+        name = record.get("name")
+        data_type = record.get("type")
+        value = record.get("value")
+        if idx is None and not (name or data_type or value):
+            return
+        self._cells.append(
+            (
+                idx,
+                record["order"],
+                ZephyrTestDataCell(index=idx, name=name, data_type=data_type, value=value),
+            )
+        )
+
+    def _start_script(self, attrib: dict[str, str]) -> bool:
+        if self._script is not None:
+            return False
+        self._script = {"type": self._intern(_clean_text(attrib.get("type")))}
+        return True
+
+    def _end_script_text(self, text: list[str]) -> None:
+        if "text" not in self._script:
+            self._script["text"] = _clean_text("".join(text))
+
+    def _end_script(self, text: list[str]) -> None:
+        # Without a `<text>` child the script body is the element's own leading text.
+        if "text" not in self._script:
+            self._script["text"] = _clean_text("".join(text))
+
+    def _start_steps(self, attrib: dict[str, str]) -> bool:
+        if self._steps is not None:
+            return False
+        self._steps = []
+        self._order = 0
+        return True
+
+    def _end_step(self, text: list[str]) -> None:
+        record = self._record
+        self._record = self._fields
+        idx = record["index"]
+        self._steps.append(
+            ZephyrStep(
+                index=record["order"] if idx is None else idx,
+                description=record.get("description"),
+                expected_result=record.get("expectedResult"),
+                test_data=record.get("testData"),
+            )
+        )
+
+
+_CASE_TEXT_FIELDS = (
+    "name",
+    "folder",
+    "objective",
+    "precondition",
+    "status",
+    "priority",
+    "owner",
+    "createdBy",
+    "createdOn",
+    "updatedBy",
+    "updatedOn",
+)
+
+
+class _ExportCounter:
+    """
+    Parser target behind `count_export`: tracks the open element path, nothing else.
+    """
+
+    __slots__ = ("_case_at", "_path", "attachments", "cases", "folder_paths", "steps")
+
+    def __init__(self) -> None:
+        self.folder_paths: set[str] = set()
+        self.cases = 0
+        self.steps = 0
+        self.attachments = 0
+        self._path: list[str] = []
+        # Depth of the open `<testCase>`, or -1 outside of cases.
+        self._case_at = -1
+
+    def start(self, tag: str, attrib: dict[str, str]) -> None:
+        path = self._path
+        case_at = self._case_at
+        if case_at < 0:
+            if tag == "testCase":
+                self.cases += 1
+                self._case_at = len(path)
+            elif tag == "folder":
+                full_path = (attrib.get("fullPath") or "").strip()
+                if full_path:
+                    self.folder_paths.add(full_path)
+        else:
+            depth = len(path) - case_at
+            if depth == 3 and tag == "step" and path[-1] == "steps" and path[-2] == "testScript":
+                self.steps += 1
+            elif depth == 2 and tag == "attachment" and path[-1] == "attachments":
+                self.attachments += 1
+        path.append(tag)
+
+    def end(self, tag: str) -> None:
+        path = self._path
+        path.pop()
+        if len(path) == self._case_at:
+            self._case_at = -1
+
+    def close(self) -> None:
+        return None
+
+
+def _end_text(name: str, *, interned: bool = False) -> Any:
+    # Leaf text: first occurrence wins, stored on the innermost open record.
+    if interned:
+
+        def end_interned_text(builder: _TestCaseBuilder, text: list[str]) -> None:
+            record = builder._record
+            if name not in record:
+                record[name] = builder._intern(_clean_text("".join(text)))
+
+        return end_interned_text
+
+    def end_text(builder: _TestCaseBuilder, text: list[str]) -> None:
+        record = builder._record
+        if name not in record:
+            record[name] = _clean_text("".join(text))
+
+    return end_text
+
+
+def _end_filtered_text(name: str, check: Any) -> Any:
+    # Leaf text a CaseFilter looks at: once it rules the case out, the case's stack
+    # entry is dropped, so its remaining children are skipped and it is never built.
+    end_text = _end_text(name, interned=name in _INTERNED_CASE_FIELDS)
+
+    def end_filtered_text(builder: _TestCaseBuilder, text: list[str]) -> None:
+        end_text(builder, text)
+        case_filter = builder._filter
+        if case_filter is not None and not check(case_filter, builder._record.get(name)):
+            builder._stack[-1] = None
+
+    return end_filtered_text
+
+
+# Low-cardinality case texts, which repeat across thousands of cases of an export.
+_INTERNED_CASE_FIELDS = frozenset(
+    {"folder", "status", "priority", "owner", "createdBy", "updatedBy"}
+)
+
+_B = _TestCaseBuilder
+_CASE_EVENTS: dict[tuple[str | None, str], tuple[Any, Any]] = {
+    (None, "testCase"): (_B._start_case, _B._end_case),
+    **{
+        ("testCase", tag): (None, _end_text(tag, interned=tag in _INTERNED_CASE_FIELDS))
+        for tag in _CASE_TEXT_FIELDS
+    },
+    ("testCase", "folder"): (None, _end_filtered_text("folder", CaseFilter.match_folder)),
+    ("testCase", "updatedOn"): (None, _end_filtered_text("updatedOn", CaseFilter.match_updated)),
+    ("testCase", "labels"): (_B._start_labels, None),
+    ("labels", "label"): (None, _B._end_label),
+    ("testCase", "issues"): (_B._start_issues, None),
+    ("issues", "issue"): (_B._start_record, _B._end_issue),
+    ("issue", "key"): (None, _end_text("key", interned=True)),
+    ("issue", "summary"): (None, _end_text("summary", interned=True)),
+    ("testCase", "attachments"): (_B._start_attachments, None),
+    ("attachments", "attachment"): (_B._start_record, _B._end_attachment),
+    ("attachment", "name"): (None, _end_text("name")),
+    ("testCase", "parameters"): (_B._start_parameters, None),
+    ("parameters", "parameter"): (_B._start_record, _B._end_parameter),
+    ("parameter", "name"): (None, _end_text("name", interned=True)),
+    ("testCase", "testDataWrapper"): (_B._start_wrapper, None),
+    ("testDataWrapper", "testDataRow"): (_B._start_row, _B._end_row),
+    ("testDataRow", "testDataColumns"): (_B._start_columns, None),
+    ("testDataColumns", "testData"): (_B._start_record, _B._end_cell),
+    ("testData", "name"): (None, _end_text("name", interned=True)),
+    ("testData", "type"): (None, _end_text("type", interned=True)),
+    ("testData", "value"): (None, _end_text("value")),
+    ("testCase", "testScript"): (_B._start_script, _B._end_script),
+    ("testScript", "text"): (None, _B._end_script_text),
+    ("testScript", "steps"): (_B._start_steps, None),
+    ("steps", "step"): (_B._start_record, _B._end_step),
+    ("step", "description"): (None, _end_text("description")),
+    ("step", "expectedResult"): (None, _end_text("expectedResult")),
+    ("step", "testData"): (None, _end_text("testData")),
+}
+del _B
+
+# `_CASE_EVENTS` nested by parent tag, each entry carrying the handlers of its own
+# children, so dispatch is a single dict lookup per element.
+_CASE_CHILDREN: dict[str | None, dict[str, tuple[Any, Any, dict[str, Any]]]] = {}
+for (_parent, _tag), (_on_start, _on_end) in _CASE_EVENTS.items():
+    _CASE_CHILDREN.setdefault(_parent, {})[_tag] = (
+        _on_start,
+        _on_end,
+        _CASE_CHILDREN.setdefault(_tag, {}),
+    )
+_CASE_ROOT = _CASE_CHILDREN[None]["testCase"]
+del _parent, _tag, _on_start, _on_end
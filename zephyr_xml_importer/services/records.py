@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import marshal
+from collections.abc import Iterable
+from dataclasses import fields
+from typing import Any
+
+from .models import (
+    ZephyrIssue,
+    ZephyrStep,
+    ZephyrTestCase,
+    ZephyrTestDataCell,
+    ZephyrTestDataRow,
+    ZephyrTestDataTable,
+)
+
+# Cases travel between processes as marshalled tuples in dataclass field order:
+# unpickling frozen dataclasses field by field costs the parent process several times
+# more than rebuilding them positionally.
+_CASE_FIELDS = tuple(f.name for f in fields(ZephyrTestCase))
+_WRAPPER_AT = _CASE_FIELDS.index("test_data_wrapper")
+_ISSUES_AT = _CASE_FIELDS.index("issues")
+_STEPS_AT = _CASE_FIELDS.index("steps")
+
+
+def case_to_record(tc: ZephyrTestCase) -> tuple[Any, ...]:
+    """Flatten a case into a tuple of plain values that `marshal` can write."""
+    values = [getattr(tc, name) for name in _CASE_FIELDS]
+    table = tc.test_data_wrapper
+    if table is not None:
+        values[_WRAPPER_AT] = [
+            [(cell.index, cell.name, cell.data_type, cell.value) for cell in row.cells]
+            for row in table.rows
+        ]
+    values[_ISSUES_AT] = [(issue.key, issue.summary) for issue in tc.issues]
+    values[_STEPS_AT] = [
+        (step.index, step.description, step.expected_result, step.test_data) for step in tc.steps
+    ]
+    return tuple(values)
+
+
+def case_from_record(record: tuple[Any, ...]) -> ZephyrTestCase:
+    """Rebuild the case `case_to_record` flattened."""
+    values = list(record)
+    rows = values[_WRAPPER_AT]
+    if rows is not None:
+        values[_WRAPPER_AT] = ZephyrTestDataTable(
+            rows=[
+                ZephyrTestDataRow(cells=[ZephyrTestDataCell(*cell) for cell in cells])
+                for cells in rows
+            ]
+        )
+    values[_ISSUES_AT] = [ZephyrIssue(*issue) for issue in values[_ISSUES_AT]]
+    values[_STEPS_AT] = [ZephyrStep(*step) for step in values[_STEPS_AT]]
+    return ZephyrTestCase(*values)
+
+
+def dump_case_batch(cases: Iterable[ZephyrTestCase]) -> bytes:
+    """Serialize cases for another process; `load_case_batch` reads them back."""
+    return marshal.dumps([case_to_record(tc) for tc in cases])
+
+
+def load_case_batch(data: bytes) -> list[ZephyrTestCase]:
+    return [case_from_record(record) for record in marshal.loads(data)]
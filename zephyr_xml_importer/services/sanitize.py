@@ -1,12 +1,43 @@
 from __future__ import annotations
 
+import hashlib
 import html
 import re
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
 
+from .models import ZephyrStep, ZephyrTestCase
 
 # NOTE: This is intentionally minimal; the loop will evolve it.
 _TAG_RE = re.compile(r"<[^>]+>")
 
+# One alternation for every tag rule, tried left to right in a single scan. The group
+# that matched picks the replacement. A "<" opened inside an unclosed "<" matches
+# `nested`: there the rules, applied one after another, can rewrite a tag into the
+# whitespace of an enclosing one, so such fragments take the rule-by-rule path.
+_TOKEN_RE = re.compile(
+    r"(?P<newline><(?:br\s*/?|/\s*(?:p|div|li|tr)\s*)>)"
+    r"|(?P<item><\s*li\s*>)"
+    r"|(?P<cell></\s*(?:td|th)\s*>)"
+    r"|(?P<tag><[^<>]+>)"
+    r"|(?P<nested><[^<>]*<)",
+    re.IGNORECASE,
+)
+_TOKEN_TEXT = {"newline": "\n", "item": "- ", "cell": "\t", "tag": ""}
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+
+class _NestedTag(Exception):
+    pass
+
+
+def _token_text(match: re.Match[str]) -> str:
+    text = _TOKEN_TEXT.get(match.lastgroup or "")
+    if text is None:
+        raise _NestedTag
+    return text
+
 
 def sanitize_html(fragment: str | None) -> str:
     """
@@ -20,11 +51,38 @@ def sanitize_html(fragment: str | None) -> str:
     - remove remaining tags
     - html.unescape
     - normalize blank lines and trim
+
+    Tags are rewritten in one scan; the output is that of `_sanitize_html_by_rule`,
+    which applies the rules in the order listed.
     """
     if not fragment:
         return ""
 
     s = fragment
+    if "<" in s:
+        try:
+            s = _TOKEN_RE.sub(_token_text, s)
+        except _NestedTag:
+            return _sanitize_html_by_rule(fragment)
+
+    s = html.unescape(s)
+
+    # Remove some invisible unicode chars (Word joiner etc.); none of them is ASCII.
+    if not s.isascii():
+        s = s.replace("\u2060", "").replace("\ufeff", "")
+        s = s.replace("\xa0", " ")
+
+    # Normalize line endings and collapse excessive blank lines
+    if "\r" in s:
+        s = s.replace("\r\n", "\n").replace("\r", "\n")
+    if "\n\n\n" in s:
+        s = _BLANK_LINES_RE.sub("\n\n", s)
+
+    return s.strip()
+
+
+def _sanitize_html_by_rule(fragment: str) -> str:
+    s = fragment
 
     # Normalize common tags to placeholders/newlines/tabs
     s = re.sub(r"(?i)<br\s*/?>", "\n", s)
@@ -53,3 +111,100 @@ def sanitize_html(fragment: str | None) -> str:
     s = re.sub(r"\n{3,}", "\n\n", s)
 
     return s.strip()
+
+
+# Longer fragments are cached under a digest, so the cache does not keep them alive.
+SANITIZE_CACHE_KEY_LENGTH = 256
+
+
+class SanitizeCache:
+    """
+    A bounded LRU memo of `sanitize_html` for one import, with hit and miss counts.
+
+    Exports repeat the same step, expected-result and precondition texts across many
+    cases; each distinct fragment is then sanitized once while it stays among the
+    `size` most recently used.
+    """
+
+    __slots__ = ("_entries", "hits", "misses", "size")
+
+    def __init__(self, size: int) -> None:
+        if size < 1:
+            raise ValueError("size must be positive")
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str | bytes, str] = OrderedDict()
+
+    def __call__(self, fragment: str | None) -> str:
+        if not fragment:
+            return ""
+        key: str | bytes = fragment
+        if len(fragment) > SANITIZE_CACHE_KEY_LENGTH:
+            key = hashlib.blake2b(
+                fragment.encode("utf-8", "surrogatepass"), digest_size=16
+            ).digest()
+        entries = self._entries
+        text = entries.get(key)
+        if text is not None:
+            entries.move_to_end(key)
+            self.hits += 1
+            return text
+        self.misses += 1
+        text = sanitize_html(fragment)
+        entries[key] = text
+        if len(entries) > self.size:
+            entries.popitem(last=False)
+        return text
+
+
+@dataclass(frozen=True, slots=True)
+class SanitizedStep:
+    index: int
+    description: str
+    test_data: str
+    expected_result: str
+
+
+@dataclass(frozen=True, slots=True)
+class SanitizedTestCase:
+    """
+    The HTML fields of a test case as plain text, sanitized once per import and shared
+    by the mapping and the validation of the case. Steps keep the case's order.
+    """
+
+    objective: str
+    precondition: str
+    test_script_text: str
+    steps: tuple[SanitizedStep, ...]
+
+
+def sanitize_steps(
+    steps: Iterable[ZephyrStep],
+    sanitize: Callable[[str | None], str] = sanitize_html,
+) -> tuple[SanitizedStep, ...]:
+    return tuple(
+        SanitizedStep(
+            index=step.index,
+            description=sanitize(step.description),
+            test_data=sanitize(step.test_data),
+            expected_result=sanitize(step.expected_result),
+        )
+        for step in steps
+    )
+
+
+def sanitize_case(
+    tc: ZephyrTestCase,
+    sanitize: Callable[[str | None], str] = sanitize_html,
+) -> SanitizedTestCase:
+    """
+    Sanitize the HTML fields of `tc`; pass a `SanitizeCache` as `sanitize` to share
+    results across the cases of an import.
+    """
+    return SanitizedTestCase(
+        objective=sanitize(tc.objective),
+        precondition=sanitize(tc.precondition),
+        test_script_text=sanitize(tc.test_script_text),
+        steps=sanitize_steps(tc.steps, sanitize),
+    )
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from io import BytesIO
 import importlib
 import mimetypes
 import os
+from dataclasses import dataclass, field, replace
+from io import BytesIO
 from typing import Any, Mapping, Sequence
 
 
@@ -12,10 +12,65 @@ class TestyAdapterError(RuntimeError):
     pass
 
 
+# Cases written per transaction by `create_cases_with_steps_bulk`.
+DEFAULT_BULK_BATCH_SIZE = 500
+# Rows fetched per round trip while `case_ids_by_zephyr_key` streams a project's keys.
+CASE_KEY_CHUNK_SIZE = 5_000
+
+
+# The model fields `create_cases_with_steps_bulk` fills from a case payload and from
+# each of its steps, with the value used when the payload lacks one.
+_BULK_CASE_FIELDS: dict[str, Any] = {
+    "name": "",
+    "setup": "",
+    "scenario": "",
+    "expected": "",
+    "teardown": "",
+    "description": "",
+    "is_steps": False,
+}
+_BULK_STEP_FIELDS: dict[str, Any] = {
+    "name": "",
+    "scenario": "",
+    "expected": "",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class BulkCaseResult:
+    """
+    The id of one case created by `create_cases_with_steps_bulk`, or why it failed.
+
+    `bulk_error` is set when the item's batch could not be inserted at once and the
+    item was created on its own instead.
+    """
+
+    case_id: int | None = None
+    error: str | None = None
+    bulk_error: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class NewSuite:
+    """A suite for `create_suites`, with the arguments of `create_suite`."""
+
+    name: str
+    parent_id: int | None
+    attributes: Mapping[str, Any] | None = None
+    description: str | None = None
+
+
 class BaseTestyAdapter:
     def get_suite_id(self, project_id: int, name: str, parent_id: int | None) -> int | None:
         raise NotImplementedError
 
+    def load_suite_tree(self, project_id: int) -> dict[tuple[int | None, str], int]:
+        """
+        Index every suite of the project by `(parent_id, name)`, resolving each pair as
+        `get_suite_id` would, in one round trip.
+        """
+        raise NotImplementedError
+
     def create_suite(
         self,
         project_id: int,
@@ -26,9 +81,41 @@ class BaseTestyAdapter:
     ) -> int:
         raise NotImplementedError
 
+    def create_suites(self, project_id: int, suites: Sequence[NewSuite]) -> list[int]:
+        """
+        Create the suites one `create_suite` call at a time and return their ids in
+        order. Parents must exist already, so a tree is created one level at a time.
+        """
+        return [
+            self.create_suite(
+                project_id,
+                suite.name,
+                suite.parent_id,
+                suite.attributes,
+                description=suite.description,
+            )
+            for suite in suites
+        ]
+
+    def create_suites_bulk(self, project_id: int, suites: Sequence[NewSuite]) -> list[int]:
+        """
+        Create the suites as `create_suites` does, for imports that opted into bulk
+        inserts. Adapters that can insert many suites at once override this; by default
+        it is `create_suites`.
+        """
+        return self.create_suites(project_id, suites)
+
     def find_case_id_by_zephyr_key(self, project_id: int, zephyr_key: str) -> int | None:
         raise NotImplementedError
 
+    def case_ids_by_zephyr_key(self, project_id: int) -> dict[str, int]:
+        """
+        Map every Zephyr key already imported into the project to its case id, as
+        `find_case_id_by_zephyr_key` would resolve it, so an import can look keys up
+        without a query per case.
+        """
+        raise NotImplementedError
+
     def create_case_with_steps(
         self,
         project_id: int,
@@ -37,6 +124,30 @@ class BaseTestyAdapter:
     ) -> int:
         raise NotImplementedError
 
+    def create_cases_with_steps_bulk(
+        self,
+        project_id: int,
+        items: Sequence[tuple[int, Mapping[str, Any]]],
+        *,
+        batch_size: int = DEFAULT_BULK_BATCH_SIZE,
+    ) -> list[BulkCaseResult]:
+        """
+        Create a case with steps for every `(suite_id, payload)` item and return one
+        result per item, in order; a failing item does not stop the others.
+
+        Adapters that can write many cases at once override this, `batch_size` cases
+        per transaction. By default each item goes through `create_case_with_steps`.
+        """
+        results: list[BulkCaseResult] = []
+        for suite_id, payload in items:
+            try:
+                case_id = self.create_case_with_steps(project_id, suite_id, payload)
+            except Exception as exc:  # noqa: BLE001 - an item fails like a case in the import loop
+                results.append(BulkCaseResult(error=str(exc)))
+            else:
+                results.append(BulkCaseResult(case_id=case_id))
+        return results
+
     def update_case_with_steps(
         self,
         project_id: int,
@@ -52,6 +163,15 @@ class BaseTestyAdapter:
     def attach_file(self, project_id: int, case_id: int, filename: str, content: bytes) -> None:
         raise NotImplementedError
 
+    def release_case(self, case_id: int) -> None:
+        """
+        Forget whatever the adapter cached for a case; called once its labels and
+        attachments are written, as the import does not touch it again.
+        """
+
+    def clear_cache(self) -> None:
+        """Forget whatever the adapter cached during an import; called when one ends."""
+
 
 def _resolve_class(class_name: str, module_candidates: Sequence[str]) -> type:
     for module_name in module_candidates:
@@ -232,9 +352,17 @@ class TestyServiceAdapter(BaseTestyAdapter):
         self._attachment_service = attachment_service_cls()
         self._suite_model = _resolve_model("TestSuite", SUITE_MODEL_CANDIDATES)
         self._case_model = _resolve_model("TestCase", CASE_MODEL_CANDIDATES)
+        self._step_model = _resolve_model("TestCaseStep", CASE_MODEL_CANDIDATES)
         self._project_model = _resolve_project_model()
         self._attachment_model = _resolve_model("Attachment", ATTACHMENT_MODEL_CANDIDATES)
         self._user = user
+        # Identity map of the model instances an import has loaded or created, so each
+        # is fetched at most once; `clear_cache` drops it when the import ends. Cases
+        # leave it through `release_case` as soon as they are written, so only the
+        # projects and suites stay for the whole import.
+        self._projects: dict[int, Any] = {}
+        self._suites: dict[int, Any] = {}
+        self._cases: dict[int, Any] = {}
 
     def get_suite_id(self, project_id: int, name: str, parent_id: int | None) -> int | None:
         if self._suite_model is None:  # pragma: no cover - requires TestY
@@ -250,20 +378,50 @@ class TestyServiceAdapter(BaseTestyAdapter):
         )
         return existing.id if existing else None
 
+    def load_suite_tree(self, project_id: int) -> dict[tuple[int | None, str], int]:
+        if self._suite_model is None:  # pragma: no cover - requires TestY
+            return {}
+        rows = (
+            self._suite_model.objects.filter(project_id=project_id)
+            .order_by("id")
+            .values_list("parent_id", "name", "id")
+        )
+        suites: dict[tuple[int | None, str], int] = {}
+        for parent_id, name, suite_id in rows:
+            suites.setdefault((parent_id, name), int(suite_id))
+        return suites
+
+    def release_case(self, case_id: int) -> None:
+        self._cases.pop(case_id, None)
+
+    def clear_cache(self) -> None:
+        self._projects.clear()
+        self._suites.clear()
+        self._cases.clear()
+
     def _get_project(self, project_id: int):
-        if self._project_model is None:  # pragma: no cover - requires TestY
-            raise TestyAdapterError("Project model is not available")
-        return self._project_model.objects.get(id=project_id)
+        project = self._projects.get(project_id)
+        if project is None:
+            if self._project_model is None:  # pragma: no cover - requires TestY
+                raise TestyAdapterError("Project model is not available")
+            project = self._projects[project_id] = self._project_model.objects.get(id=project_id)
+        return project
 
     def _get_suite(self, suite_id: int):
-        if self._suite_model is None:  # pragma: no cover - requires TestY
-            raise TestyAdapterError("TestSuite model is not available")
-        return self._suite_model.objects.get(id=suite_id)
+        suite = self._suites.get(suite_id)
+        if suite is None:
+            if self._suite_model is None:  # pragma: no cover - requires TestY
+                raise TestyAdapterError("TestSuite model is not available")
+            suite = self._suites[suite_id] = self._suite_model.objects.get(id=suite_id)
+        return suite
 
     def _get_case(self, case_id: int):
-        if self._case_model is None:  # pragma: no cover - requires TestY
-            raise TestyAdapterError("TestCase model is not available")
-        return self._case_model.objects.get(id=case_id)
+        case = self._cases.get(case_id)
+        if case is None:
+            if self._case_model is None:  # pragma: no cover - requires TestY
+                raise TestyAdapterError("TestCase model is not available")
+            case = self._cases[case_id] = self._case_model.objects.get(id=case_id)
+        return case
 
     def _labels_payload(self, labels: Sequence[str]) -> list[dict[str, Any]]:
         payload: list[dict[str, Any]] = []
@@ -294,8 +452,82 @@ class TestyServiceAdapter(BaseTestyAdapter):
         suite_id = getattr(suite, "id", None)
         if suite_id is None:  # pragma: no cover - depends on TestY runtime
             raise TestyAdapterError("TestSuiteService.suite_create did not return an id")
+        self._suites[int(suite_id)] = suite
         return int(suite_id)
 
+    def create_suites_bulk(self, project_id: int, suites: Sequence[NewSuite]) -> list[int]:
+        """
+        Insert the suites with one `bulk_create` in a transaction.
+
+        This writes the model directly rather than through `TestSuiteService`, so no
+        history records are kept for the suites. TestY keeps suites in MPTT trees, whose
+        bookkeeping fields bulk inserts do not maintain. A new root starts a tree whose id
+        is left to MPTT's own save, as everywhere else in TestY, so roots are still
+        created through `create_suite`; the trees that got new children are rebuilt with
+        `partial_rebuild`.
+        """
+        if self._suite_model is None:  # pragma: no cover - requires TestY
+            return self.create_suites(project_id, suites)
+        try:
+            from django.db import transaction  # pragma: no cover - depends on TestY runtime
+        except ImportError:  # pragma: no cover - depends on TestY runtime
+            return self.create_suites(project_id, suites)
+
+        suite_ids: list[int] = []
+        children: list[int] = []
+        for index, suite in enumerate(suites):
+            if suite.parent_id is None:
+                suite_ids.append(
+                    self.create_suite(
+                        project_id,
+                        suite.name,
+                        None,
+                        suite.attributes,
+                        description=suite.description,
+                    )
+                )
+            else:
+                suite_ids.append(0)
+                children.append(index)
+        if not children:
+            return suite_ids
+
+        mptt_meta = getattr(self._suite_model, "_mptt_meta", None)
+        with transaction.atomic():
+            touched_trees: set[int] = set()
+            instances = []
+            for index in children:
+                suite = suites[index]
+                instance = self._suite_model(
+                    project_id=project_id,
+                    parent_id=suite.parent_id,
+                    name=suite.name,
+                    description=suite.description or "",
+                    attributes=dict(suite.attributes or {}),
+                )
+                if mptt_meta is not None:
+                    parent = self._get_suite(suite.parent_id)
+                    tree_id = getattr(parent, mptt_meta.tree_id_attr)
+                    level = getattr(parent, mptt_meta.level_attr) + 1
+                    setattr(instance, mptt_meta.tree_id_attr, tree_id)
+                    setattr(instance, mptt_meta.level_attr, level)
+                    # Placeholders until the tree is rebuilt below.
+                    setattr(instance, mptt_meta.left_attr, 0)
+                    setattr(instance, mptt_meta.right_attr, 0)
+                    touched_trees.add(tree_id)
+                instances.append(instance)
+            created = self._suite_model.objects.bulk_create(instances)
+            for tree_id in sorted(touched_trees):
+                self._suite_model.objects.partial_rebuild(tree_id)
+        if touched_trees:
+            # The rebuilds rewrote the tree fields of suites loaded before them.
+            for suite_id, cached in list(self._suites.items()):
+                if getattr(cached, mptt_meta.tree_id_attr, None) in touched_trees:
+                    del self._suites[suite_id]
+        for index, instance in zip(children, created):
+            suite_ids[index] = int(instance.id)
+        return suite_ids
+
     def find_case_id_by_zephyr_key(self, project_id: int, zephyr_key: str) -> int | None:
         if self._case_model is None:  # pragma: no cover - requires TestY
             return None
@@ -309,6 +541,25 @@ class TestyServiceAdapter(BaseTestyAdapter):
         )
         return existing.id if existing else None
 
+    def case_ids_by_zephyr_key(self, project_id: int) -> dict[str, int]:
+        if self._case_model is None:  # pragma: no cover - requires TestY
+            return {}
+        # Streamed in id order so the oldest case wins, as in find_case_id_by_zephyr_key.
+        rows = (
+            self._case_model.objects.filter(
+                project_id=project_id,
+                attributes__zephyr__key__isnull=False,
+            )
+            .order_by("id")
+            .values_list("attributes__zephyr__key", "id")
+            .iterator(chunk_size=CASE_KEY_CHUNK_SIZE)
+        )
+        case_ids: dict[str, int] = {}
+        for key, case_id in rows:
+            if isinstance(key, str) and key:
+                case_ids.setdefault(key, int(case_id))
+        return case_ids
+
     def create_case_with_steps(
         self,
         project_id: int,
@@ -323,8 +574,90 @@ class TestyServiceAdapter(BaseTestyAdapter):
         case_id = getattr(case, "id", None)
         if case_id is None:  # pragma: no cover - depends on TestY runtime
             raise TestyAdapterError("TestCaseService.case_with_steps_create did not return an id")
+        self._cases[int(case_id)] = case
         return int(case_id)
 
+    def create_cases_with_steps_bulk(
+        self,
+        project_id: int,
+        items: Sequence[tuple[int, Mapping[str, Any]]],
+        *,
+        batch_size: int = DEFAULT_BULK_BATCH_SIZE,
+    ) -> list[BulkCaseResult]:
+        """
+        Insert cases and their steps with `bulk_create`, one transaction per
+        `batch_size` items.
+
+        This writes the models directly rather than through `TestCaseService`, so no
+        history records are kept for the cases, and only the payload keys listed in
+        `_BULK_CASE_FIELDS` and `_BULK_STEP_FIELDS` are written. When a batch fails with
+        a database error, it is rolled back and its items are created one at a time to
+        tell which of them failed; their results carry that error as `bulk_error`.
+        """
+        if self._case_model is None or self._step_model is None:  # pragma: no cover
+            return super().create_cases_with_steps_bulk(project_id, items)
+        try:
+            from django.db import (  # pragma: no cover - depends on TestY runtime
+                DatabaseError,
+                transaction,
+            )
+        except ImportError:  # pragma: no cover - depends on TestY runtime
+            return super().create_cases_with_steps_bulk(project_id, items)
+
+        batch_size = max(batch_size, 1)
+        results: list[BulkCaseResult] = []
+        for start in range(0, len(items), batch_size):
+            batch = items[start : start + batch_size]
+            try:
+                with transaction.atomic():
+                    case_ids = self._bulk_create_cases(project_id, batch)
+            except (DatabaseError, TypeError, ValueError) as exc:
+                # Rejected by the database, or a value the model fields cannot convert.
+                results += [
+                    replace(result, bulk_error=str(exc))
+                    for result in super().create_cases_with_steps_bulk(project_id, batch)
+                ]
+            else:
+                results += [BulkCaseResult(case_id=case_id) for case_id in case_ids]
+        return results
+
+    def _bulk_create_cases(
+        self,
+        project_id: int,
+        items: Sequence[tuple[int, Mapping[str, Any]]],
+    ) -> list[int]:
+        cases = self._case_model.objects.bulk_create(
+            [
+                self._case_model(
+                    project_id=project_id,
+                    suite_id=suite_id,
+                    attributes=dict(payload.get("attributes") or {}),
+                    **{
+                        name: payload.get(name, default)
+                        for name, default in _BULK_CASE_FIELDS.items()
+                    },
+                )
+                for suite_id, payload in items
+            ]
+        )
+        self._step_model.objects.bulk_create(
+            [
+                self._step_model(
+                    project_id=project_id,
+                    test_case_id=case.id,
+                    **{
+                        name: step.get(name, default) for name, default in _BULK_STEP_FIELDS.items()
+                    },
+                    sort_order=step.get("sort_order", index),
+                )
+                for case, (_, payload) in zip(cases, items)
+                for index, step in enumerate(payload.get("steps") or ())
+            ]
+        )
+        for case in cases:
+            self._cases[int(case.id)] = case
+        return [int(case.id) for case in cases]
+
     def update_case_with_steps(
         self,
         project_id: int,
@@ -341,6 +674,7 @@ class TestyServiceAdapter(BaseTestyAdapter):
         updated_id = getattr(case, "id", None)
         if updated_id is None:  # pragma: no cover - depends on TestY runtime
             raise TestyAdapterError("TestCaseService.case_with_steps_update did not return an id")
+        self._cases[int(updated_id)] = case
         return int(updated_id)
 
     def set_labels(self, project_id: int, case_id: int, labels: Sequence[str]) -> int:
@@ -348,7 +682,7 @@ class TestyServiceAdapter(BaseTestyAdapter):
             return 0
         if self._case_model is None:  # pragma: no cover - requires TestY
             raise TestyAdapterError("TestCase model is not available for label assignment")
-        case_obj = self._case_model.objects.get(id=case_id)
+        case_obj = self._get_case(case_id)
         label_payload = self._labels_payload(labels)
         if not label_payload:
             return 0
@@ -360,7 +694,7 @@ class TestyServiceAdapter(BaseTestyAdapter):
             raise TestyAdapterError("TestCase model is not available for attachments")
         if self._attachment_model is None:  # pragma: no cover - requires TestY
             raise TestyAdapterError("Attachment model is not available for attachments")
-        case_obj = self._case_model.objects.get(id=case_id)
+        case_obj = self._get_case(case_id)
         project = case_obj.project
         try:
             from django.core.files.base import (
@@ -420,6 +754,13 @@ class InMemoryTestyAdapter(BaseTestyAdapter):
     def get_suite_id(self, project_id: int, name: str, parent_id: int | None) -> int | None:
         return self._suite_index.get((project_id, parent_id, name))
 
+    def load_suite_tree(self, project_id: int) -> dict[tuple[int | None, str], int]:
+        return {
+            (parent_id, name): suite_id
+            for (suite_project_id, parent_id, name), suite_id in self._suite_index.items()
+            if suite_project_id == project_id
+        }
+
     def create_suite(
         self,
         project_id: int,
@@ -448,6 +789,13 @@ class InMemoryTestyAdapter(BaseTestyAdapter):
             return None
         return self._case_index.get((project_id, key))
 
+    def case_ids_by_zephyr_key(self, project_id: int) -> dict[str, int]:
+        return {
+            key: case_id
+            for (case_project_id, key), case_id in self._case_index.items()
+            if case_project_id == project_id
+        }
+
     def create_case_with_steps(
         self,
         project_id: int,
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping
-
-from .models import ZephyrFolder, ZephyrStep, ZephyrTestCase
-from .sanitize import sanitize_html
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field
 
+from .models import ZephyrFolder, ZephyrTestCase
+from .sanitize import SanitizedStep, SanitizedTestCase, sanitize_steps
 
 DEFAULT_MAX_NAME_LENGTH = 255
 
@@ -26,13 +26,14 @@ def build_case_warnings(
     *,
     max_name_length: int = DEFAULT_MAX_NAME_LENGTH,
     folders: Mapping[str, ZephyrFolder] | None = None,
+    sanitized: SanitizedTestCase | None = None,
 ) -> list[str]:
     warnings: list[str] = []
     key = _clean_key(tc.key)
     folder_path = _clean_folder_path(tc.folder)
 
     if key and duplicate_key_counts.get(key, 0) > 1:
-        warnings.append(f"Duplicate Zephyr key in XML: {key}")
+        warnings.append(_format_duplicate_key_warning(key))
 
     name_length = len(mapped_name)
     if name_length > max_name_length:
@@ -49,7 +50,8 @@ def build_case_warnings(
         warnings.append(_format_missing_folder_reference_warning(folder_path, key))
 
     if tc.steps:
-        for step in tc.steps:
+        steps = sanitized.steps if sanitized is not None else sanitize_steps(tc.steps)
+        for step in steps:
             if _is_step_empty(step):
                 warnings.append(_format_empty_step_warning(step.index, key))
             if _is_expected_empty(step) and _has_step_scenario(step):
@@ -58,6 +60,78 @@ def build_case_warnings(
     return warnings
 
 
+@dataclass(slots=True)
+class DeferredCaseWarnings:
+    """
+    Case warnings for single-pass imports, where duplicate keys and folders are only
+    fully known once the whole export has been read.
+
+    Cases are checked against the running state; `reconcile` then fixes up the few
+    rows whose duplicate-key or missing-folder warnings changed by the end.
+    """
+
+    folders: Mapping[str, ZephyrFolder]
+    duplicate_key_counts: dict[str, int] = field(default_factory=dict)
+    _first_row_by_key: dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    _rows_by_unresolved_folder: dict[str, list[tuple[int, str]]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def case_warnings(
+        self,
+        tc: ZephyrTestCase,
+        mapped_name: str,
+        row_index: int,
+        *,
+        max_name_length: int = DEFAULT_MAX_NAME_LENGTH,
+        sanitized: SanitizedTestCase | None = None,
+    ) -> list[str]:
+        key = _clean_key(tc.key)
+        if key:
+            count = self.duplicate_key_counts.get(key, 0) + 1
+            self.duplicate_key_counts[key] = count
+            if count == 1:
+                self._first_row_by_key[key] = row_index
+
+        folder_path = _clean_folder_path(tc.folder)
+        if folder_path and folder_path not in self.folders:
+            self._rows_by_unresolved_folder.setdefault(folder_path, []).append((row_index, key))
+
+        return build_case_warnings(
+            tc,
+            mapped_name,
+            self.duplicate_key_counts,
+            max_name_length=max_name_length,
+            folders=self.folders,
+            sanitized=sanitized,
+        )
+
+    def reconcile(self, row_warnings: Callable[[int], list[str]]) -> dict[int, list[str]]:
+        """
+        Return updated warnings for the rows affected by late-known state, by row index.
+        """
+        updated: dict[int, list[str]] = {}
+
+        def current(row_index: int) -> list[str]:
+            if row_index not in updated:
+                updated[row_index] = list(row_warnings(row_index))
+            return updated[row_index]
+
+        for key, count in self.duplicate_key_counts.items():
+            if count > 1:
+                # The first occurrence was checked before any duplicate was seen.
+                current(self._first_row_by_key[key]).insert(0, _format_duplicate_key_warning(key))
+
+        for folder_path, entries in self._rows_by_unresolved_folder.items():
+            if folder_path not in self.folders:
+                continue
+            for row_index, key in entries:
+                stale = _format_missing_folder_reference_warning(folder_path, key)
+                current(row_index)[:] = [w for w in current(row_index) if w != stale]
+
+        return updated
+
+
 def _clean_key(value: str | None) -> str:
     return (value or "").strip()
 
@@ -66,16 +140,20 @@ def _clean_folder_path(value: str | None) -> str:
     return (value or "").strip()
 
 
-def _is_step_empty(step: ZephyrStep) -> bool:
-    return not sanitize_html(step.description) and not sanitize_html(step.test_data)
+def _is_step_empty(step: SanitizedStep) -> bool:
+    return not step.description and not step.test_data
+
+
+def _is_expected_empty(step: SanitizedStep) -> bool:
+    return not step.expected_result
 
 
-def _is_expected_empty(step: ZephyrStep) -> bool:
-    return not sanitize_html(step.expected_result)
+def _has_step_scenario(step: SanitizedStep) -> bool:
+    return bool(step.description or step.test_data)
 
 
-def _has_step_scenario(step: ZephyrStep) -> bool:
-    return bool(sanitize_html(step.description) or sanitize_html(step.test_data))
+def _format_duplicate_key_warning(key: str) -> str:
+    return f"Duplicate Zephyr key in XML: {key}"
 
 
 def _format_empty_step_warning(step_index: int, key: str) -> str:
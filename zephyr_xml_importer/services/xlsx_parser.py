@@ -1,22 +1,47 @@
 from __future__ import annotations
 
-from contextlib import contextmanager
+import os
+import posixpath
+import re
+import shutil
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import ExitStack, closing, contextmanager
 from dataclasses import dataclass, field
+from functools import partial
 from io import BytesIO
+from operator import itemgetter
 from pathlib import Path
-import re
-from typing import Any, BinaryIO, Iterator
+from tempfile import NamedTemporaryFile
+from typing import Any, BinaryIO
+from zipfile import BadZipFile, ZipFile
 
 try:
     import openpyxl
+    from openpyxl.styles.numbers import BUILTIN_FORMATS, is_date_format, is_timedelta_format
+    from openpyxl.utils.datetime import (
+        CALENDAR_MAC_1904,
+        CALENDAR_WINDOWS_1900,
+        from_excel,
+        from_ISO8601,
+    )
 except Exception as exc:  # pragma: no cover - guarded by runtime dependency
     openpyxl = None
     _OPENPYXL_ERROR = exc
 else:  # pragma: no cover - used at runtime
     _OPENPYXL_ERROR = None
 
+from .filters import CaseFilter
+from .interning import INTERN_MAX_LENGTH, INTERN_TABLE_SIZE, make_interner
 from .models import ZephyrFolder, ZephyrIssue, ZephyrStep, ZephyrTestCase
-
+from .parser import (
+    FEED_CHUNK_SIZE,
+    DefusedET,
+    UnsafeXmlError,
+    new_target_parser,
+)
+from .records import dump_case_batch, load_case_batch
 
 HEADER_KEY = "key"
 HEADER_NAME = "name"
@@ -36,36 +61,48 @@ HEADER_PLAIN_TEXT = "plain_text"
 HEADER_BDD = "bdd"
 
 
-@contextmanager
-def _open_workbook(source: str | Path | BinaryIO | bytes) -> Iterator[Any]:
-    if openpyxl is None:  # pragma: no cover - should be installed via dependencies
-        raise RuntimeError("openpyxl is required to parse Zephyr XLSX exports") from _OPENPYXL_ERROR
+def _load_workbook(source: str | Path | BinaryIO) -> Any:
+    # Read-only workbooks stream rows from the sheet XML instead of building every cell
+    # up front; rows come back ragged (trailing empty cells dropped), which
+    # `_RowExtractor` pads. The archive stays open until `close()`.
+    return openpyxl.load_workbook(source, read_only=True, data_only=True)
+
 
+def _workbook_source(source: str | Path | BinaryIO | bytes) -> str | Path | BinaryIO:
+    # Both readers reopen the archive by seeking, so streams that cannot seek are
+    # buffered once.
     if isinstance(source, (bytes, bytearray)):
-        buffer = BytesIO(bytes(source))
-        wb = openpyxl.load_workbook(buffer, read_only=False, data_only=True)
-    elif isinstance(source, (str, Path)):
-        wb = openpyxl.load_workbook(source, read_only=False, data_only=True)
-    else:
-        stream = source
+        return BytesIO(bytes(source))
+    if isinstance(source, (str, Path)):
+        return source
+    stream = source
+    seekable = False
+    try:
+        seekable = bool(getattr(stream, "seekable", lambda: False)())
+    except Exception:
         seekable = False
+    if seekable:
         try:
-            seekable = bool(getattr(stream, "seekable", lambda: False)())
+            stream.seek(0)
         except Exception:
             seekable = False
-        if seekable:
-            try:
-                stream.seek(0)
-            except Exception:
-                seekable = False
-        if seekable:
-            wb = openpyxl.load_workbook(stream, read_only=False, data_only=True)
-        else:
-            data = stream.read()
-            if isinstance(data, str):
-                data = data.encode("utf-8")
-            buffer = BytesIO(data)
-            wb = openpyxl.load_workbook(buffer, read_only=False, data_only=True)
+    if seekable:
+        return stream
+    data = stream.read()
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return BytesIO(data)
+
+
+def _require_openpyxl() -> None:
+    if openpyxl is None:  # pragma: no cover - should be installed via dependencies
+        raise RuntimeError("openpyxl is required to parse Zephyr XLSX exports") from _OPENPYXL_ERROR
+
+
+@contextmanager
+def _open_workbook(source: str | Path | BinaryIO | bytes) -> Iterator[Any]:
+    _require_openpyxl()
+    wb = _load_workbook(_workbook_source(source))
     try:
         yield wb
     finally:
@@ -75,6 +112,460 @@ def _open_workbook(source: str | Path | BinaryIO | bytes) -> Iterator[Any]:
             pass
 
 
+_SHEET_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_DOC_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+_CONTENT_TYPES_NS = "http://schemas.openxmlformats.org/package/2006/content-types"
+_CONTENT_TYPES_PART = "[Content_Types].xml"
+# openpyxl always reads the stylesheet from this path, whatever the relationships say.
+_STYLES_PART = "xl/styles.xml"
+_WORKBOOK_CONTENT_TYPES = tuple(
+    f"application/vnd.{kind}.main+xml"
+    for kind in (
+        "ms-excel.template.macroEnabled",
+        "openxmlformats-officedocument.spreadsheetml.template",
+        "ms-excel.sheet.macroEnabled",
+        "openxmlformats-officedocument.spreadsheetml.sheet",
+    )
+)
+_SHARED_STRINGS_CONTENT_TYPE = (
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"
+)
+_WORKSHEET_REL_TYPE = f"{_DOC_REL_NS}/worksheet"
+
+
+def _sheet_tags(*names: str) -> dict[str, str]:
+    # lxml targets see `{ns}name`; expat handlers bound directly see `ns}name`.
+    return {f"{opening}{_SHEET_MAIN_NS}}}{name}": name for opening in ("{", "") for name in names}
+
+
+_STRING_TAGS = _sheet_tags("si", "t", "rPh")
+_ROW_TAGS = _sheet_tags("row", "c", "v", "is", "t", "rPh")
+
+
+class _UnsupportedWorkbook(Exception):
+    """The native reader does not handle this workbook; openpyxl takes over."""
+
+
+@dataclass(frozen=True, slots=True)
+class _SheetLayout:
+    sheet_part: str
+    shared_strings_part: str | None
+    date_styles: frozenset[int]
+    timedelta_styles: frozenset[int]
+    epoch: Any
+
+
+def _read_part(archive: ZipFile, name: str) -> Any:
+    try:
+        return DefusedET.fromstring(archive.read(name))
+    except KeyError as exc:
+        raise _UnsupportedWorkbook(f"missing part {name}") from exc
+
+
+def _relationship_targets(archive: ZipFile, part: str) -> dict[str, tuple[str, str]]:
+    # Relationship id -> (type, archive path), resolved the way openpyxl does.
+    folder, name = posixpath.split(part)
+    rels = _read_part(archive, posixpath.join(folder, "_rels", f"{name}.rels"))
+    targets: dict[str, tuple[str, str]] = {}
+    for rel in rels.iter(f"{{{_PKG_REL_NS}}}Relationship"):
+        target = rel.get("Target") or ""
+        if rel.get("TargetMode") == "External":
+            continue
+        if target.startswith("/"):
+            target = target[1:]
+        else:
+            target = posixpath.normpath(posixpath.join(folder, target))
+        targets[rel.get("Id") or ""] = (rel.get("Type") or "", target)
+    return targets
+
+
+def _style_number_formats(archive: ZipFile) -> tuple[frozenset[int], frozenset[int]]:
+    try:
+        styles = DefusedET.fromstring(archive.read(_STYLES_PART))
+    except KeyError:
+        return frozenset(), frozenset()
+    ns = f"{{{_SHEET_MAIN_NS}}}"
+    custom = {
+        int(fmt.get("numFmtId")): fmt.get("formatCode")
+        for fmt in styles.iterfind(f"{ns}numFmts/{ns}numFmt")
+    }
+    dates: set[int] = set()
+    timedeltas: set[int] = set()
+    for index, xf in enumerate(styles.iterfind(f"{ns}cellXfs/{ns}xf")):
+        number_format_id = int(xf.get("numFmtId", 0))
+        code = custom.get(number_format_id, BUILTIN_FORMATS.get(number_format_id))
+        if is_date_format(code):
+            dates.add(index)
+        if is_timedelta_format(code):
+            timedeltas.add(index)
+    return frozenset(dates), frozenset(timedeltas)
+
+
+def _read_workbook(archive: ZipFile) -> tuple[dict[str, str], str, Any]:
+    # Content-type overrides, the workbook part name and its parsed XML.
+    content_types = _read_part(archive, _CONTENT_TYPES_PART)
+    overrides = {
+        override.get("ContentType"): (override.get("PartName") or "").lstrip("/")
+        for override in reversed(list(content_types.iter(f"{{{_CONTENT_TYPES_NS}}}Override")))
+    }
+    workbook_part = next(
+        (overrides[kind] for kind in _WORKBOOK_CONTENT_TYPES if overrides.get(kind)), None
+    )
+    if workbook_part is None:
+        raise _UnsupportedWorkbook("no workbook part override")
+    workbook = _read_part(archive, workbook_part)
+    if workbook.tag != f"{{{_SHEET_MAIN_NS}}}workbook":
+        raise _UnsupportedWorkbook(f"unexpected workbook root {workbook.tag}")
+    return overrides, workbook_part, workbook
+
+
+def _worksheet_parts(archive: ZipFile, workbook: Any, workbook_part: str) -> list[str]:
+    # The worksheets openpyxl lists in `Workbook.worksheets`, in tab order.
+    ns = f"{{{_SHEET_MAIN_NS}}}"
+    targets = _relationship_targets(archive, workbook_part)
+    parts: list[str] = []
+    for sheet in workbook.iterfind(f"{ns}sheets/{ns}sheet"):
+        rel_type, part = targets.get(sheet.get(f"{{{_DOC_REL_NS}}}id"), ("", ""))
+        if part not in archive.NameToInfo or "chartsheet" in rel_type:
+            continue
+        if rel_type != _WORKSHEET_REL_TYPE:
+            raise _UnsupportedWorkbook(f"unexpected sheet relationship {rel_type}")
+        parts.append(part)
+    return parts
+
+
+def _active_sheet_part(archive: ZipFile, workbook: Any, workbook_part: str) -> str:
+    ns = f"{{{_SHEET_MAIN_NS}}}"
+    active = 0
+    for view in workbook.iterfind(f"{ns}bookViews/{ns}workbookView"):
+        if view.get("activeTab") is not None:
+            active = int(view.get("activeTab"))
+            break
+    sheets = workbook.findall(f"{ns}sheets/{ns}sheet")
+    if not 0 <= active < len(sheets):
+        raise _UnsupportedWorkbook("active sheet out of range")
+    rel_id = sheets[active].get(f"{{{_DOC_REL_NS}}}id")
+    rel_type, sheet_part = _relationship_targets(archive, workbook_part).get(rel_id, ("", ""))
+    if rel_type != _WORKSHEET_REL_TYPE or sheet_part not in archive.NameToInfo:
+        raise _UnsupportedWorkbook("active sheet is not a plain worksheet")
+    if any(sheet.get(f"{{{_DOC_REL_NS}}}id") is None for sheet in sheets[:active]):
+        # openpyxl drops such sheets, which shifts what "active" points at.
+        raise _UnsupportedWorkbook("sheet without relationship id")
+    return sheet_part
+
+
+def _read_sheet_layout(archive: ZipFile, sheet: int | None = None) -> _SheetLayout:
+    """
+    Locate a sheet (the active one, or worksheet number `sheet` in tab order), the
+    shared strings and the date styles of a workbook.
+
+    Parts are found the way openpyxl finds them, so both readers agree on which sheet
+    is imported; anything unusual raises `_UnsupportedWorkbook`.
+    """
+    overrides, workbook_part, workbook = _read_workbook(archive)
+    if sheet is None:
+        sheet_part = _active_sheet_part(archive, workbook, workbook_part)
+    else:
+        parts = _worksheet_parts(archive, workbook, workbook_part)
+        if not 0 <= sheet < len(parts):
+            raise _UnsupportedWorkbook(f"no worksheet number {sheet}")
+        sheet_part = parts[sheet]
+
+    properties = workbook.find(f"{{{_SHEET_MAIN_NS}}}workbookPr")
+    date1904 = properties is not None and properties.get("date1904") in {"1", "true"}
+    date_styles, timedelta_styles = _style_number_formats(archive)
+    return _SheetLayout(
+        sheet_part=sheet_part,
+        shared_strings_part=overrides.get(_SHARED_STRINGS_CONTENT_TYPE),
+        date_styles=date_styles,
+        timedelta_styles=timedelta_styles,
+        epoch=CALENDAR_MAC_1904 if date1904 else CALENDAR_WINDOWS_1900,
+    )
+
+
+class _SharedStringsReader:
+    """
+    Parser target collecting `sharedStrings.xml` into a plain list of str.
+
+    Each `<si>` becomes the concatenation of its `<t>` runs, phonetic hints excluded,
+    matching openpyxl's non-rich-text reading.
+    """
+
+    __slots__ = ("_parts", "_phonetic", "_text", "strings")
+
+    def __init__(self) -> None:
+        self.strings: list[str] = []
+        self._parts: list[str] = []
+        self._text: list[str] | None = None
+        self._phonetic = False
+
+    def start(self, tag: str, attrib: dict[str, str]) -> None:
+        name = _STRING_TAGS.get(tag)
+        if name == "t":
+            if not self._phonetic:
+                self._text = []
+        elif name == "si":
+            self._parts = []
+        elif name == "rPh":
+            self._phonetic = True
+
+    def end(self, tag: str) -> None:
+        name = _STRING_TAGS.get(tag)
+        if name == "t":
+            if self._text is not None:
+                self._parts.append("".join(self._text))
+                self._text = None
+        elif name == "si":
+            self.strings.append("".join(self._parts).replace("x005F_", ""))
+        elif name == "rPh":
+            self._phonetic = False
+
+    def data(self, text: str) -> None:
+        if self._text is not None:
+            self._text.append(text)
+
+    def doctype(self, name: str | None, pubid: str | None, system: str | None) -> None:
+        raise UnsafeXmlError("DOCTYPE declarations are not allowed in XLSX parts")
+
+    def close(self) -> None:
+        return None
+
+
+class _SheetRowReader:
+    """
+    Parser target turning worksheet XML into the tuples openpyxl's read-only
+    `iter_rows(values_only=True)` yields once `reset_dimensions()` has dropped the
+    declared `<dimension>`: the same values, an empty tuple for each missing row, and
+    each row padded with None up to its own last cell rather than the sheet's width.
+    """
+
+    __slots__ = (
+        "_cells",
+        "_column",
+        "_columns",
+        "_inline",
+        "_layout",
+        "_next_row",
+        "_phonetic",
+        "_row_number",
+        "_strings",
+        "_style",
+        "_text",
+        "_type",
+        "_value",
+        "rows",
+    )
+
+    def __init__(self, layout: _SheetLayout, strings: list[str]) -> None:
+        self.rows: list[tuple[Any, ...]] = []
+        self._layout = layout
+        self._strings = strings
+        # Column letters -> 1-based index, shared by every row of the sheet.
+        self._columns: dict[str, int] = {}
+        self._next_row = 1
+        self._row_number = 0
+        self._cells: list[tuple[int, Any]] = []
+        self._column = 0
+        self._type = "n"
+        self._style: str | None = None
+        self._value: str | None = None
+        self._inline: list[str] | None = None
+        self._text: list[str] | None = None
+        self._phonetic = False
+
+    def start(self, tag: str, attrib: dict[str, str]) -> None:
+        name = _ROW_TAGS.get(tag)
+        if name is None:
+            return
+        if name == "c":
+            ref = attrib.get("r")
+            self._column = self._column_index(ref) if ref else self._column + 1
+            self._type = attrib.get("t", "n")
+            self._style = attrib.get("s")
+            self._value = None
+            self._inline = None
+        elif name == "v":
+            self._text = []
+        elif name == "t":
+            if self._inline is not None and not self._phonetic:
+                self._text = []
+        elif name == "row":
+            number = attrib.get("r")
+            if number:
+                try:
+                    self._row_number = int(number)
+                except ValueError:
+                    self._row_number = int(float(number))
+            else:
+                self._row_number += 1
+            self._cells = []
+            self._column = 0
+        elif name == "is":
+            self._inline = []
+        elif name == "rPh":
+            self._phonetic = True
+
+    def end(self, tag: str) -> None:
+        name = _ROW_TAGS.get(tag)
+        if name is None:
+            return
+        if name == "c":
+            self._cells.append((self._column, self._cell_value()))
+        elif name == "v":
+            if self._value is None:
+                self._value = "".join(self._text)
+            self._text = None
+        elif name == "t":
+            if self._text is not None:
+                self._inline.append("".join(self._text))
+                self._text = None
+        elif name == "row":
+            self._end_row()
+        elif name == "rPh":
+            self._phonetic = False
+
+    def data(self, text: str) -> None:
+        if self._text is not None:
+            self._text.append(text)
+
+    doctype = _SharedStringsReader.doctype
+
+    def close(self) -> None:
+        return None
+
+    def _column_index(self, ref: str) -> int:
+        letters = ref.rstrip("0123456789")
+        index = self._columns.get(letters)
+        if index is None:
+            index = 0
+            for letter in letters:
+                index = index * 26 + ord(letter) - 64
+            self._columns[letters] = index
+        return index
+
+    def _cell_value(self) -> Any:
+        kind = self._type
+        if kind == "inlineStr":
+            return "".join(self._inline) if self._inline is not None else None
+        value = self._value or None
+        if value is None:
+            return None
+        if kind == "n":
+            number = float(value) if "." in value or "E" in value or "e" in value else int(value)
+            layout = self._layout
+            style = int(self._style) if self._style else 0
+            if style in layout.date_styles:
+                try:
+                    return from_excel(
+                        number, layout.epoch, timedelta=style in layout.timedelta_styles
+                    )
+                except (OverflowError, ValueError):
+                    return "#VALUE!"
+            return number
+        if kind == "s":
+            return self._strings[int(value)]
+        if kind == "b":
+            return bool(int(value))
+        if kind == "d":
+            return from_ISO8601(value)
+        return value
+
+    def _end_row(self) -> None:
+        number = self._row_number
+        rows = self.rows
+        while self._next_row < number:
+            rows.append(())
+            self._next_row += 1
+        if self._next_row > number:
+            # Rows repeated or out of order are skipped, as openpyxl does.
+            return
+        self._next_row += 1
+        cells = self._cells
+        if not cells:
+            rows.append(())
+            return
+        width = cells[-1][0]
+        row: list[Any] = [None] * width
+        for column, value in cells:
+            if 0 < column <= width:
+                row[column - 1] = value
+        rows.append(tuple(row))
+
+
+def _feed_part(archive: ZipFile, part: str, target: Any) -> Iterator[None]:
+    parser = new_target_parser(target)
+    with archive.open(part) as handle:
+        for chunk in iter(partial(handle.read, FEED_CHUNK_SIZE), b""):
+            parser.feed(chunk)
+            yield
+    parser.close()
+    yield
+
+
+def _iter_native_rows(archive: ZipFile, sheet: int | None = None) -> Iterator[tuple[Any, ...]]:
+    layout = _read_sheet_layout(archive, sheet)
+    strings = _SharedStringsReader()
+    if layout.shared_strings_part is not None:
+        for _ in _feed_part(archive, layout.shared_strings_part, strings):
+            pass
+    reader = _SheetRowReader(layout, strings.strings)
+    for _ in _feed_part(archive, layout.sheet_part, reader):
+        if reader.rows:
+            rows, reader.rows = reader.rows, []
+            yield from rows
+
+
+def _iter_sheet_rows(
+    source: str | Path | BinaryIO | bytes, sheet: int | None = None
+) -> Iterator[tuple[Any, ...]]:
+    """
+    Yield the rows of a sheet (the active one, or worksheet number `sheet`) as
+    openpyxl's read-only `iter_rows(values_only=True)` would after
+    `reset_dimensions()`, reading the archive directly. Rows are therefore as wide as
+    their own last cell, and empty rows are empty tuples rather than rows of None.
+
+    The worksheet XML is streamed through a parser target, skipping openpyxl's per-cell
+    objects; workbooks whose layout the native reader does not handle are read, from
+    the first row not yet yielded, with openpyxl.
+    """
+    _require_openpyxl()
+    source = _workbook_source(source)
+    yielded = 0
+    try:
+        with ZipFile(source) as archive:
+            for row in _iter_native_rows(archive, sheet):
+                yield row
+                yielded += 1
+        return
+    except (_UnsupportedWorkbook, BadZipFile):
+        # A broken archive is left to openpyxl, which reports it as it always has.
+        pass
+    with _open_workbook(source) as workbook:
+        ws = workbook.active if sheet is None else workbook.worksheets[sheet]
+        # Read-only sheets stop at the declared `<dimension>`, which some exporters
+        # leave stale; read up to the last row actually present instead.
+        ws.reset_dimensions()
+        yield from ws.iter_rows(min_row=yielded + 1, values_only=True)
+
+
+def xlsx_worksheet_count(source: str | Path | BinaryIO | bytes) -> int:
+    """
+    Return how many worksheets a workbook has, i.e. the valid `sheet` numbers for
+    `iter_test_cases_xlsx`; chartsheets are not counted.
+    """
+    _require_openpyxl()
+    source = _workbook_source(source)
+    try:
+        with ZipFile(source) as archive:
+            _, workbook_part, workbook = _read_workbook(archive)
+            return len(_worksheet_parts(archive, workbook, workbook_part))
+    except (_UnsupportedWorkbook, BadZipFile):
+        pass
+    with _open_workbook(source) as workbook:
+        return len(workbook.worksheets)
+
+
 def _normalize_header(value: Any) -> str:
     if value is None:
         return ""
@@ -84,18 +575,18 @@ def _normalize_header(value: Any) -> str:
 def _coerce_text(value: Any) -> str | None:
     if value is None:
         return None
-    if isinstance(value, str):
-        cleaned = value.strip()
-        return cleaned if cleaned else None
-    cleaned = str(value).strip()
-    return cleaned if cleaned else None
+    cleaned = (value if isinstance(value, str) else str(value)).strip()
+    return cleaned or None
+
+
+_TOKEN_SEPARATORS_RE = re.compile(r"[\n\r;]+")
 
 
 def _split_tokens(value: Any) -> list[str]:
     text = _coerce_text(value)
     if not text:
         return []
-    normalized = re.sub(r"[\n\r;]+", ",", text)
+    normalized = _TOKEN_SEPARATORS_RE.sub(",", text)
     tokens = [t.strip() for t in normalized.split(",") if t.strip()]
     seen: set[str] = set()
     cleaned: list[str] = []
@@ -108,6 +599,34 @@ def _split_tokens(value: Any) -> list[str]:
     return cleaned
 
 
+def _make_token_splitter(
+    intern: Callable[[str | None], str | None],
+) -> Callable[[Any], tuple[str, ...]]:
+    """
+    Return a cached `_split_tokens` for label and issue cells.
+
+    Those cells repeat a small vocabulary across a whole export, so each distinct text
+    is tokenized once; the table is bounded like the interner's.
+    """
+    cache: dict[str, tuple[str, ...]] = {}
+
+    def split(value: Any) -> tuple[str, ...]:
+        if value is None:
+            return ()
+        # Only text is cached: 1, 1.0 and True are equal keys with different tokens.
+        cacheable = type(value) is str and len(value) <= INTERN_MAX_LENGTH
+        if cacheable:
+            tokens = cache.get(value)
+            if tokens is not None:
+                return tokens
+        tokens = tuple(intern(token) for token in _split_tokens(value))
+        if cacheable and len(cache) < INTERN_TABLE_SIZE:
+            cache[value] = tokens
+        return tokens
+
+    return split
+
+
 def _header_role(normalized: str) -> str | None:
     if normalized == "key":
         return HEADER_KEY
@@ -156,24 +675,74 @@ def _build_header_index(header_row: tuple[Any, ...]) -> dict[str, int]:
     return header_index
 
 
-def _row_has_any_value(row: tuple[Any, ...]) -> bool:
-    for value in row:
-        if value is None:
-            continue
-        if isinstance(value, str):
-            if value.strip():
-                return True
-            continue
-        return True
-    return False
+# Order of the values `_RowExtractor` pulls out of each row.
+_ROW_FIELDS = (
+    HEADER_KEY,
+    HEADER_NAME,
+    HEADER_STATUS,
+    HEADER_PRECONDITION,
+    HEADER_OBJECTIVE,
+    HEADER_FOLDER,
+    HEADER_FOLDER_DESCRIPTION,
+    HEADER_PRIORITY,
+    HEADER_OWNER,
+    HEADER_LABELS,
+    HEADER_ISSUES,
+    HEADER_STEP,
+    HEADER_STEP_TEST_DATA,
+    HEADER_STEP_EXPECTED,
+    HEADER_PLAIN_TEXT,
+    HEADER_BDD,
+)
+(
+    _KEY,
+    _NAME,
+    _STATUS,
+    _PRECONDITION,
+    _OBJECTIVE,
+    _FOLDER,
+    _FOLDER_DESCRIPTION,
+    _PRIORITY,
+    _OWNER,
+    _LABELS,
+    _ISSUES,
+    _STEP,
+    _STEP_TEST_DATA,
+    _STEP_EXPECTED,
+    _PLAIN_TEXT,
+    _BDD,
+) = range(len(_ROW_FIELDS))
 
 
-def _row_value(row: tuple[Any, ...], index: int | None) -> Any:
-    if index is None:
-        return None
-    if index < 0 or index >= len(row):
-        return None
-    return row[index]
+class _RowExtractor:
+    """
+    The header resolved once into an `itemgetter` over fixed column positions.
+
+    Calling it on a row returns the `_ROW_FIELDS` values in order. Rows are cut or
+    padded to the header's known columns, and roles the header lacks read a None slot
+    just past them, so extra columns in the export are never read.
+    """
+
+    __slots__ = ("_getter", "_size", "_width")
+
+    def __init__(self, header_index: dict[str, int]) -> None:
+        width = max(header_index.values(), default=-1) + 1
+        self._width = width
+        self._size = width + 1 if any(role not in header_index for role in _ROW_FIELDS) else width
+        self._getter = itemgetter(*(header_index.get(role, width) for role in _ROW_FIELDS))
+
+    def __call__(self, row: Any) -> tuple[Any, ...]:
+        width, size = self._width, self._size
+        if len(row) != size or (size > width and row[width] is not None):
+            row = (*row[:width], *(None,) * (size - min(len(row), width)))
+        return self._getter(row)
+
+
+def _is_blank(fields: tuple[Any, ...]) -> bool:
+    # Only rows with no value at all in the known columns are skipped here. Cells
+    # holding just whitespace read as empty once coerced, so such rows add nothing
+    # to a case either.
+    return fields.count(None) == len(fields)
 
 
 @dataclass
@@ -187,53 +756,53 @@ class _XlsxCaseBuilder:
     folder_description: str | None
     priority: str | None
     owner: str | None
-    labels: list[str] = field(default_factory=list)
-    issues: list[ZephyrIssue] = field(default_factory=list)
+    labels: tuple[str, ...] = ()
+    issue_keys: tuple[str, ...] = ()
     test_script_text: str | None = None
     test_script_type: str | None = None
     steps: list[ZephyrStep] = field(default_factory=list)
 
-    def add_step_from_row(self, row: tuple[Any, ...], header_index: dict[str, int]) -> None:
-        step_value = _coerce_text(_row_value(row, header_index.get(HEADER_STEP)))
-        test_data = _coerce_text(_row_value(row, header_index.get(HEADER_STEP_TEST_DATA)))
-        expected = _coerce_text(_row_value(row, header_index.get(HEADER_STEP_EXPECTED)))
-        if not any([step_value, test_data, expected]):
+    def add_step_from_row(self, fields: tuple[Any, ...]) -> None:
+        step_value = _coerce_text(fields[_STEP])
+        test_data = _coerce_text(fields[_STEP_TEST_DATA])
+        expected = _coerce_text(fields[_STEP_EXPECTED])
+        if not (step_value or test_data or expected):
             return
-        index = len(self.steps)
         self.steps.append(
             ZephyrStep(
-                index=index,
+                index=len(self.steps),
                 description=step_value,
                 test_data=test_data,
                 expected_result=expected,
             )
         )
 
-    def update_from_row(self, row: tuple[Any, ...], header_index: dict[str, int]) -> None:
+    def update_from_row(
+        self, fields: tuple[Any, ...], split: Callable[[Any], tuple[str, ...]]
+    ) -> None:
         if not self.labels:
-            self.labels = _split_tokens(_row_value(row, header_index.get(HEADER_LABELS)))
-        if not self.issues:
-            self.issues = _build_issues(_row_value(row, header_index.get(HEADER_ISSUES)))
+            self.labels = split(fields[_LABELS])
+        if not self.issue_keys:
+            self.issue_keys = split(fields[_ISSUES])
         if not self.folder:
-            self.folder = _coerce_text(_row_value(row, header_index.get(HEADER_FOLDER)))
+            self.folder = _coerce_text(fields[_FOLDER])
         if not self.folder_description:
-            self.folder_description = _coerce_text(
-                _row_value(row, header_index.get(HEADER_FOLDER_DESCRIPTION))
-            )
+            self.folder_description = _coerce_text(fields[_FOLDER_DESCRIPTION])
         if not self.test_script_text:
-            self._set_script_text(row, header_index)
+            self._set_script_text(fields)
 
-    def _set_script_text(self, row: tuple[Any, ...], header_index: dict[str, int]) -> None:
-        plain_text = _coerce_text(_row_value(row, header_index.get(HEADER_PLAIN_TEXT)))
-        bdd_text = _coerce_text(_row_value(row, header_index.get(HEADER_BDD)))
+    def _set_script_text(self, fields: tuple[Any, ...]) -> None:
+        plain_text = _coerce_text(fields[_PLAIN_TEXT])
         if plain_text:
             self.test_script_text = plain_text
             self.test_script_type = "plain"
-        elif bdd_text:
+            return
+        bdd_text = _coerce_text(fields[_BDD])
+        if bdd_text:
             self.test_script_text = bdd_text
             self.test_script_type = "bdd"
 
-    def to_test_case(self) -> ZephyrTestCase:
+    def to_test_case(self, intern: Callable[[str | None], str | None]) -> ZephyrTestCase:
         test_script_type = self.test_script_type
         test_script_text = self.test_script_text
         if self.steps:
@@ -243,13 +812,13 @@ class _XlsxCaseBuilder:
             zephyr_id=None,
             key=self.key,
             name=self.name,
-            folder=self.folder,
-            folder_description=self.folder_description,
+            folder=intern(self.folder),
+            folder_description=intern(self.folder_description),
             objective=self.objective,
             precondition=self.precondition,
-            status=self.status,
-            priority=self.priority,
-            owner=self.owner,
+            status=intern(self.status),
+            priority=intern(self.priority),
+            owner=intern(self.owner),
             created_by=None,
             created_on=None,
             updated_by=None,
@@ -257,8 +826,9 @@ class _XlsxCaseBuilder:
             param_type=None,
             parameters=[],
             test_data_wrapper=None,
-            labels=self.labels,
-            issues=self.issues,
+            # Tokens come interned from the splitter.
+            labels=list(self.labels),
+            issues=[ZephyrIssue(key=key) for key in self.issue_keys],
             attachments=[],
             test_script_type=test_script_type,
             test_script_text=test_script_text,
@@ -266,81 +836,271 @@ class _XlsxCaseBuilder:
         )
 
 
-def _build_issues(value: Any) -> list[ZephyrIssue]:
-    return [ZephyrIssue(key=issue) for issue in _split_tokens(value)]
+def _accept_case(
+    tc: ZephyrTestCase,
+    folders: dict[str, ZephyrFolder] | None,
+    case_filter: CaseFilter | None,
+) -> bool:
+    if case_filter is not None and not case_filter.matches(tc):
+        return False
+    if folders is not None:
+        _add_case_folder(folders, tc.folder, tc.folder_description)
+    return True
 
 
-def iter_test_cases_xlsx(source: str | Path | BinaryIO | bytes) -> Iterator[ZephyrTestCase]:
-    with _open_workbook(source) as workbook:
-        ws = workbook.active
-        rows = ws.iter_rows(values_only=True)
+def iter_test_cases_xlsx(
+    source: str | Path | BinaryIO | bytes,
+    *,
+    sheet: int | None = None,
+    folders: dict[str, ZephyrFolder] | None = None,
+    case_filter: CaseFilter | None = None,
+) -> Iterator[ZephyrTestCase]:
+    """
+    Yield the cases of an XLSX export one at a time, from the active sheet or from
+    worksheet number `sheet` in tab order (see `xlsx_worksheet_count`).
+
+    XLSX exports carry no folder list, so folders come from the cases: when `folders`
+    is given, each yielded case's folder is recorded there before the case is handed
+    out. Cases rejected by `case_filter` are skipped, and rows of a case whose key does
+    not match are not even built.
+    """
+    rows = _iter_sheet_rows(source, sheet)
+    with closing(rows):
+        yield from iter_test_cases_from_rows(rows, folders=folders, case_filter=case_filter)
+
+
+def iter_test_cases_from_rows(
+    rows: Iterator[Sequence[Any]],
+    *,
+    folders: dict[str, ZephyrFolder] | None = None,
+    case_filter: CaseFilter | None = None,
+) -> Iterator[ZephyrTestCase]:
+    """
+    Yield the cases of export rows laid out as in `iter_test_cases_xlsx`, with empty
+    cells as None; the XLSX and CSV readers share it.
+
+    A header row, then one or more rows per case: the first carries the key, later
+    ones add steps and fill in what it left empty.
+    """
+    try:
+        header_row = next(rows)
+    except StopIteration:
+        return
+
+    extract = _RowExtractor(_build_header_index(tuple(header_row)))
+    current: _XlsxCaseBuilder | None = None
+    intern = make_interner()
+    split = _make_token_splitter(intern)
+
+    for fields in map(extract, rows):
+        if _is_blank(fields):
+            continue
+
+        key_value = _coerce_text(fields[_KEY])
+        if key_value:
+            if current is not None:
+                tc = current.to_test_case(intern)
+                if _accept_case(tc, folders, case_filter):
+                    yield tc
+            current = None
+            if case_filter is not None and not case_filter.match_key(key_value):
+                continue
+
+            current = _XlsxCaseBuilder(
+                key=key_value,
+                name=_coerce_text(fields[_NAME]),
+                status=_coerce_text(fields[_STATUS]),
+                precondition=_coerce_text(fields[_PRECONDITION]),
+                objective=_coerce_text(fields[_OBJECTIVE]),
+                folder=_coerce_text(fields[_FOLDER]),
+                folder_description=_coerce_text(fields[_FOLDER_DESCRIPTION]),
+                priority=_coerce_text(fields[_PRIORITY]),
+                owner=_coerce_text(fields[_OWNER]),
+                labels=split(fields[_LABELS]),
+                issue_keys=split(fields[_ISSUES]),
+            )
+            current._set_script_text(fields)
+            current.add_step_from_row(fields)
+        elif current is not None:
+            current.update_from_row(fields, split)
+            current.add_step_from_row(fields)
+
+    if current is not None:
+        tc = current.to_test_case(intern)
+        if _accept_case(tc, folders, case_filter):
+            yield tc
+
+
+def _parse_xlsx_sheet(
+    source: str | Path, sheet: int | None, case_filter: CaseFilter | None
+) -> bytes:
+    cases = iter_test_cases_xlsx(source, sheet=sheet, case_filter=case_filter)
+    return dump_case_batch(cases)
+
+
+@contextmanager
+def _spooled_path(source: str | Path | BinaryIO) -> Iterator[str | Path]:
+    # Worker processes reopen every workbook by path, so streams are written to a
+    # temporary file once instead of being pickled for each of their sheets.
+    if isinstance(source, (str, Path)):
+        yield source
+        return
+    source.seek(0)
+    with NamedTemporaryFile(suffix=".xlsx") as spooled:
+        shutil.copyfileobj(source, spooled)
+        spooled.flush()
+        yield spooled.name
+
+
+def iter_test_cases_xlsx_parallel(
+    sources: Iterable[str | Path | BinaryIO | bytes],
+    *,
+    all_sheets: bool = False,
+    folders: dict[str, ZephyrFolder] | None = None,
+    workers: int | None = None,
+    case_filter: CaseFilter | None = None,
+) -> Iterator[ZephyrTestCase]:
+    """
+    Yield the cases of several XLSX workbooks as one stream: the active sheet of each,
+    or every worksheet with `all_sheets`. Each sheet has its own header row.
+
+    Every sheet is parsed as one task by a pool of `workers` processes (all CPUs when
+    None; 1 parses in-process), and results are merged in workbook and tab order, so
+    the stream does not depend on the worker count. Only a bounded window of sheets is
+    in flight; a finished sheet waits as compact records until its turn.
+
+    `folders` and `case_filter` work as in `iter_test_cases_xlsx`; folders are recorded
+    as the merged cases are yielded.
+    """
+    workers = workers or os.cpu_count() or 1
+    workbooks = [_workbook_source(source) for source in sources]
+    jobs = [
+        (index, sheet)
+        for index, workbook in enumerate(workbooks)
+        for sheet in (range(xlsx_worksheet_count(workbook)) if all_sheets else (None,))
+    ]
+    if workers == 1 or len(jobs) <= 1:
+        for index, sheet in jobs:
+            yield from iter_test_cases_xlsx(
+                workbooks[index], sheet=sheet, folders=folders, case_filter=case_filter
+            )
+        return
+
+    def merged(future: Future[bytes]) -> Iterator[ZephyrTestCase]:
+        for tc in load_case_batch(future.result()):
+            if folders is not None:
+                _add_case_folder(folders, tc.folder, tc.folder_description)
+            yield tc
+
+    with ExitStack() as stack:
+        paths = [stack.enter_context(_spooled_path(workbook)) for workbook in workbooks]
+        pool = ProcessPoolExecutor(max_workers=min(workers, len(jobs)))
+        pending: deque[Future[bytes]] = deque()
         try:
-            header_row = next(rows)
-        except StopIteration:
+            for index, sheet in jobs:
+                pending.append(pool.submit(_parse_xlsx_sheet, paths[index], sheet, case_filter))
+                if len(pending) > workers:
+                    yield from merged(pending.popleft())
+            while pending:
+                yield from merged(pending.popleft())
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+def parse_xlsx_folders_and_duplicate_key_counts(
+    source: str | Path | BinaryIO | bytes,
+    *,
+    case_filter: CaseFilter | None = None,
+) -> tuple[dict[str, ZephyrFolder], dict[str, int]]:
+    """
+    Collect the folders and per-key case counts of an XLSX export without building
+    cases: the cheap first pass of a two-pass import.
+
+    Only the key, folder and folder-description columns are read; the result equals
+    `build_folders_from_cases` and `build_duplicate_key_counts` over the cases
+    `iter_test_cases_xlsx(source, case_filter=case_filter)` yields.
+    """
+    rows = _iter_sheet_rows(source)
+    with closing(rows):
+        return parse_folders_and_duplicate_key_counts_from_rows(rows, case_filter=case_filter)
+
+
+def parse_folders_and_duplicate_key_counts_from_rows(
+    rows: Iterator[Sequence[Any]], *, case_filter: CaseFilter | None = None
+) -> tuple[dict[str, ZephyrFolder], dict[str, int]]:
+    """
+    Collect the folders and per-key case counts of export rows without building
+    cases, as `parse_xlsx_folders_and_duplicate_key_counts` does for a worksheet.
+    """
+    folders: dict[str, ZephyrFolder] = {}
+    duplicate_key_counts: dict[str, int] = {}
+
+    def add_case(key: str, folder: str | None, description: str | None) -> None:
+        # Spreadsheet rows carry no updatedOn, so only the key and folder checks can
+        # reject.
+        if case_filter is not None and not (
+            case_filter.match_key(key) and case_filter.match_folder(folder)
+        ):
             return
+        _add_case_folder(folders, folder, description)
+        duplicate_key_counts[key] = duplicate_key_counts.get(key, 0) + 1
+
+    try:
+        header_row = next(rows)
+    except StopIteration:
+        return folders, duplicate_key_counts
 
-        header_index = _build_header_index(tuple(header_row))
-        current: _XlsxCaseBuilder | None = None
+    extract = _RowExtractor(_build_header_index(tuple(header_row)))
+    key: str | None = None
+    folder: str | None = None
+    description: str | None = None
 
-        for row in rows:
-            row_tuple = tuple(row)
-            if not _row_has_any_value(row_tuple):
-                continue
+    for fields in map(extract, rows):
+        if _is_blank(fields):
+            continue
+        key_value = _coerce_text(fields[_KEY])
+        if key_value:
+            if key is not None:
+                add_case(key, folder, description)
+            key = key_value
+            folder = _coerce_text(fields[_FOLDER])
+            description = _coerce_text(fields[_FOLDER_DESCRIPTION])
+        elif key is not None:
+            # Later rows of a case fill in what its first row left empty.
+            if not folder:
+                folder = _coerce_text(fields[_FOLDER])
+            if not description:
+                description = _coerce_text(fields[_FOLDER_DESCRIPTION])
+
+    if key is not None:
+        add_case(key, folder, description)
+    return folders, duplicate_key_counts
 
-            key_value = _coerce_text(_row_value(row_tuple, header_index.get(HEADER_KEY)))
-            if key_value:
-                if current is not None:
-                    yield current.to_test_case()
-
-                current = _XlsxCaseBuilder(
-                    key=key_value,
-                    name=_coerce_text(_row_value(row_tuple, header_index.get(HEADER_NAME))),
-                    status=_coerce_text(_row_value(row_tuple, header_index.get(HEADER_STATUS))),
-                    precondition=_coerce_text(
-                        _row_value(row_tuple, header_index.get(HEADER_PRECONDITION))
-                    ),
-                    objective=_coerce_text(
-                        _row_value(row_tuple, header_index.get(HEADER_OBJECTIVE))
-                    ),
-                    folder=_coerce_text(_row_value(row_tuple, header_index.get(HEADER_FOLDER))),
-                    folder_description=_coerce_text(
-                        _row_value(row_tuple, header_index.get(HEADER_FOLDER_DESCRIPTION))
-                    ),
-                    priority=_coerce_text(_row_value(row_tuple, header_index.get(HEADER_PRIORITY))),
-                    owner=_coerce_text(_row_value(row_tuple, header_index.get(HEADER_OWNER))),
-                    labels=_split_tokens(_row_value(row_tuple, header_index.get(HEADER_LABELS))),
-                    issues=_build_issues(_row_value(row_tuple, header_index.get(HEADER_ISSUES))),
-                )
-                current._set_script_text(row_tuple, header_index)
-                current.add_step_from_row(row_tuple, header_index)
-            else:
-                if current is None:
-                    continue
-                current.update_from_row(row_tuple, header_index)
-                current.add_step_from_row(row_tuple, header_index)
 
-        if current is not None:
-            yield current.to_test_case()
+def _add_case_folder(
+    folders: dict[str, ZephyrFolder], folder: str | None, description: Any
+) -> None:
+    folder_path = (folder or "").strip()
+    if not folder_path:
+        return
+    folder_description = _coerce_text(description)
+    existing = folders.get(folder_path)
+    if existing is None:
+        folders[folder_path] = ZephyrFolder(
+            full_path=folder_path,
+            index=None,
+            description=folder_description,
+        )
+    elif existing.description is None and folder_description:
+        folders[folder_path] = ZephyrFolder(
+            full_path=existing.full_path,
+            index=existing.index,
+            description=folder_description,
+        )
 
 
 def build_folders_from_cases(cases: list[ZephyrTestCase]) -> dict[str, ZephyrFolder]:
     folders: dict[str, ZephyrFolder] = {}
     for tc in cases:
-        folder_path = (tc.folder or "").strip()
-        if not folder_path:
-            continue
-        folder_description = _coerce_text(tc.folder_description)
-        existing = folders.get(folder_path)
-        if existing is None:
-            folders[folder_path] = ZephyrFolder(
-                full_path=folder_path,
-                index=None,
-                description=folder_description,
-            )
-        elif existing.description is None and folder_description:
-            folders[folder_path] = ZephyrFolder(
-                full_path=existing.full_path,
-                index=existing.index,
-                description=folder_description,
-            )
+        _add_case_folder(folders, tc.folder, tc.folder_description)
     return folders